@@ -2,20 +2,175 @@
 Calculador de Volúmenes de Sólidos mediante Integrales Múltiples
 Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
 Universidad Católica de Santiago de Guayaquil (UCSG)
+
+SymPy, SciPy y los módulos simbólicos se importan en su primer uso (ver
+carga_perezosa): un proceso que solo integra numéricamente no los carga.
 """
 
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import time
+from functools import cached_property
 import numpy as np
-from scipy import integrate
-import sympy as sp
-from typing import Dict, Tuple, Callable, Optional
+from typing import Dict, List, Tuple, Callable, Optional
+
+from cuadratura_vectorizada import (
+    integrar_tensorial, integrar_genz_malik, integrar_lote_parametrico, transformar_region
+)
+from expresiones_compiladas import ExpresionCompilada, compilar_expresion, como_funcion, simbolo
+from carga_perezosa import modulo_perezoso
+from cache_simbolico import CacheSimbolico
+from regiones_integracion import RegionIntegracion
+from especificacion_solidos import EspecificacionSolido, RegistroSolidos, registro_predefinido
+from instrumentacion import contar, tramo
+
+logger = logging.getLogger(__name__)
+
+sp = modulo_perezoso("sympy")
+integrate = modulo_perezoso("scipy.integrate")
+formas_cerradas = modulo_perezoso("formas_cerradas")
+coordenadas = modulo_perezoso("transformacion_coordenadas")
+montecarlo = modulo_perezoso("integracion_montecarlo")
+
+
+# Motores disponibles en calcular_numerico
+METODOS_NUMERICOS = {
+    "dblquad": "Integración Numérica (SciPy dblquad - Gauss-Kronrod)",
+    "gauss_legendre": "Integración Numérica Vectorizada (Gauss-Legendre tensorial)",
+    "clenshaw_curtis": "Integración Numérica Vectorizada (Clenshaw-Curtis tensorial)",
+    "genz_malik": "Cubatura Adaptativa Vectorizada (Genz-Malik grado 7/5)",
+}
+
+
+# Clasificación de comparar_metodos: (cota del error relativo en %, etiqueta)
+CLASIFICACIONES = (
+    (0.0001, "EXCELENTE - Prácticamente idénticos"),
+    (0.01, "MUY BUENO - Alta coincidencia"),
+    (0.1, "BUENO - Aceptable"),
+)
+CLASIFICACION_REVISAR = "REVISAR - Diferencia notable"
+
+# Error relativo (%) por debajo del cual ambos métodos coinciden
+UMBRAL_COINCIDENCIA = 0.01
+
+
+def _notacion_theta(valor) -> str:
+    """Límite de θ legible: 2*pi → 2π."""
+    return str(valor).replace("pi", "π").replace("*", "")
+
+
+def _trabajo_exacto(conexion, f_sup_str: str, f_inf_str: str,
+                    x_lims: Tuple, y_lims: Tuple, ruta_cache: Optional[str],
+                    automatico: bool = False, usar_formas_cerradas: bool = True):
+    """Ejecuta calcular_exacto (o calcular_exacto_automatico) en un proceso aparte y envía el resultado."""
+    try:
+        analizador = AnalizadorMatematico(cache_simbolico=ruta_cache,
+                                          usar_formas_cerradas=usar_formas_cerradas)
+        calcular = analizador.calcular_exacto_automatico if automatico else analizador.calcular_exacto
+        conexion.send(calcular(f_sup_str, f_inf_str, x_lims, y_lims))
+    except Exception as e:
+        conexion.send({
+            "error": str(e),
+            "exito": False,
+            "mensaje": f"No se pudo resolver analíticamente: {str(e)}"
+        })
+    finally:
+        conexion.close()
 
 
 class AnalizadorMatematico:
     """Motor de cálculo que combina integración simbólica y numérica."""
     
-    def __init__(self):
-        self.x, self.y = sp.symbols('x y', real=True)
+    def __init__(self, cache_simbolico=None, depuracion: bool = False,
+                 usar_formas_cerradas: bool = True):
+        """
+        Args:
+            cache_simbolico: CacheSimbolico, ruta de un archivo SQLite, o True
+                             para la ruta por defecto. None desactiva la caché
+                             persistente de resultados exactos.
+            depuracion: Contrastar cada fórmula cerrada reconocida con un
+                        motor numérico (AssertionError si no coinciden)
+            usar_formas_cerradas: Reconocer esferas, cilindros, paraboloides...
+                                  y devolver su fórmula; False obliga a
+                                  integrar (p. ej. para medir los motores)
+        """
+        self.depuracion = depuracion
+        self.usar_formas_cerradas = usar_formas_cerradas
         
+        if cache_simbolico is True:
+            cache_simbolico = CacheSimbolico()
+        elif isinstance(cache_simbolico, str):
+            cache_simbolico = CacheSimbolico(cache_simbolico)
+        self.cache_simbolico = cache_simbolico
+    
+    @cached_property
+    def x(self):
+        """Símbolo x (crearlo importa SymPy, por eso se difiere)."""
+        return simbolo("x")
+    
+    @cached_property
+    def y(self):
+        return simbolo("y")
+    
+    def _consultar_cache(self, tipo: str, integrando, limites) -> Tuple[Optional[str], Optional[Dict]]:
+        """Busca un resultado exacto en la caché persistente (si está activa)."""
+        if self.cache_simbolico is None:
+            return None, None
+        clave = CacheSimbolico.clave(tipo, integrando, limites)
+        guardado = self.cache_simbolico.obtener(clave)
+        if guardado is not None:
+            guardado["desde_cache"] = True
+        return clave, guardado
+    
+    def _guardar_cache(self, clave: Optional[str], resultado: Dict):
+        if clave is not None and resultado.get("exito"):
+            self.cache_simbolico.guardar(clave, resultado)
+        
+    def _reconocer(self, reconocedor: Callable, *args) -> Optional[Tuple]:
+        """Aplica un reconocedor de formas_cerradas; None si no reconoce el sólido."""
+        if not self.usar_formas_cerradas:
+            return None
+        try:
+            return reconocedor(*args)
+        except Exception:
+            # El reconocimiento nunca debe impedir el cálculo general
+            return None
+    
+    @staticmethod
+    def _resultado_forma_cerrada(forma: Tuple) -> Dict:
+        latex, texto, valor, familia = forma
+        return {
+            "valor_exacto": latex,
+            "valor_exacto_sympy": texto,
+            "valor_numerico": valor,
+            "exito": True,
+            "metodo": f"Fórmula cerrada ({familia})",
+            "familia": familia,
+            "forma_cerrada": True
+        }
+    
+    @staticmethod
+    def _confirmar_forma_cerrada(forma: Tuple, aproximado: float, margen: float):
+        """En modo depuración, la fórmula cerrada debe coincidir con el motor numérico."""
+        if abs(forma[2] - aproximado) > margen:
+            raise AssertionError(
+                f"Fórmula cerrada ({forma[3]}) = {forma[2]} no coincide con el "
+                f"valor numérico {aproximado} (margen {margen:.2e})"
+            )
+    
+    def _problema_cartesiano(self, f_sup_str: str, f_inf_str: str, y_lims: Tuple):
+        """Altura h = f - g y límites de y como expresiones SymPy."""
+        # Parse compartido con el camino numérico (caché de expresiones)
+        fs = compilar_expresion(f_sup_str).expr
+        fi = compilar_expresion(f_inf_str).expr
+        
+        # Convertir límites de y a expresiones simbólicas
+        y_min_expr = compilar_expresion(y_lims[0], ("x",)).expr
+        y_max_expr = compilar_expresion(y_lims[1], ("x",)).expr
+        return fs - fi, y_min_expr, y_max_expr
+    
     def calcular_exacto(self, f_sup_str: str, f_inf_str: str, 
                        x_lims: Tuple, y_lims: Tuple) -> Dict:
         """
@@ -30,115 +185,566 @@ class AnalizadorMatematico:
         Returns:
             Dict con valor exacto en LaTeX, valor numérico y estado
         """
+        forma = self._reconocer(formas_cerradas.reconocer_cartesiano,
+                                str(f_sup_str), str(f_inf_str),
+                                tuple(x_lims), tuple(str(v) for v in y_lims))
+        if forma is not None:
+            if self.depuracion:
+                numerico = integrar_tensorial(
+                    como_funcion(f_sup_str), como_funcion(f_inf_str),
+                    tuple(float(compilar_expresion(v, ()).expr) for v in x_lims),
+                    tuple(como_funcion(v, ("x",)) for v in y_lims)
+                )
+                self._confirmar_forma_cerrada(
+                    forma, numerico["volumen"],
+                    max(10 * numerico["error_estimado"], 1e-6 * abs(forma[2]))
+                )
+            return self._resultado_forma_cerrada(forma)
+        
         try:
-            # Parse usando los símbolos locales
-            fs = sp.sympify(f_sup_str, locals={'x': self.x, 'y': self.y})
-            fi = sp.sympify(f_inf_str, locals={'x': self.x, 'y': self.y})
-            h = fs - fi
-            
-            # Convertir límites de y a expresiones simbólicas
-            y_min_expr = sp.sympify(y_lims[0], locals={'x': self.x, 'y': self.y})
-            y_max_expr = sp.sympify(y_lims[1], locals={'x': self.x, 'y': self.y})
+            h, y_min_expr, y_max_expr = self._problema_cartesiano(
+                f_sup_str, f_inf_str, y_lims
+            )
+            clave, guardado = self._consultar_cache(
+                "cartesiano", h,
+                (self.y, y_min_expr, y_max_expr, self.x, x_lims[0], x_lims[1])
+            )
+            if guardado is not None:
+                return guardado
             
             # Integral interna (dy)
-            print(f"Integrando respecto a y: de {y_min_expr} a {y_max_expr}")
-            res_y = sp.integrate(h, (self.y, y_min_expr, y_max_expr))
+            logger.debug("Integrando respecto a y: de %s a %s", y_min_expr, y_max_expr)
+            with tramo("integral_interna"):
+                res_y = sp.integrate(h, (self.y, y_min_expr, y_max_expr))
             
             # Integral externa (dx)
-            print(f"Integrando respecto a x: de {x_lims[0]} a {x_lims[1]}")
-            volumen = sp.integrate(res_y, (self.x, x_lims[0], x_lims[1]))
+            logger.debug("Integrando respecto a x: de %s a %s", x_lims[0], x_lims[1])
+            with tramo("integral_externa"):
+                volumen = sp.integrate(res_y, (self.x, x_lims[0], x_lims[1]))
             
             # Simplificar el resultado
-            volumen_simplificado = sp.simplify(volumen)
+            with tramo("simplificar"):
+                volumen_simplificado = sp.simplify(volumen)
+            with tramo("evalf"):
+                valor_numerico = float(volumen_simplificado.evalf())
             
-            return {
+            resultado = {
                 "valor_exacto": sp.latex(volumen_simplificado),
                 "valor_exacto_sympy": str(volumen_simplificado),
-                "valor_numerico": float(volumen_simplificado.evalf()),
+                "valor_numerico": valor_numerico,
                 "expresion_intermedia_y": sp.latex(res_y),
                 "exito": True,
                 "metodo": "Integración Simbólica (SymPy)"
             }
+            self._guardar_cache(clave, resultado)
+            return resultado
         except Exception as e:
+            logger.info("Sin solución analítica para h = %s - (%s): %s", f_sup_str, f_inf_str, e)
             return {
                 "error": str(e),
                 "exito": False,
                 "mensaje": f"No se pudo resolver analíticamente: {str(e)}"
             }
     
-    def calcular_numerico(self, f_sup_func: Callable, f_inf_func: Callable,
-                         x_lims: Tuple, y_lims_func: Tuple) -> Dict:
+    def _iniciar_exacto_en_proceso(self, f_sup_str: str, f_inf_str: str,
+                                   x_lims: Tuple, y_lims: Tuple, automatico: bool = False):
+        """Lanza calcular_exacto en un proceso aparte; devuelve (proceso, receptor)."""
+        contexto = multiprocessing.get_context()
+        receptor, emisor = contexto.Pipe(duplex=False)
+        ruta_cache = self.cache_simbolico.ruta if self.cache_simbolico else None
+        proceso = contexto.Process(
+            target=_trabajo_exacto,
+            args=(emisor, f_sup_str, f_inf_str, x_lims, y_lims, ruta_cache, automatico,
+                  self.usar_formas_cerradas),
+            daemon=True
+        )
+        proceso.start()
+        emisor.close()
+        return proceso, receptor
+    
+    @staticmethod
+    def _esperar_exacto(proceso_receptor, plazo: float) -> Optional[Dict]:
+        """Espera el resultado hasta el plazo; si vence, elimina el proceso y devuelve None."""
+        proceso, receptor = proceso_receptor
+        exacto = None
+        try:
+            if receptor.poll(max(plazo, 0.0)):
+                exacto = receptor.recv()
+        except EOFError:
+            # El proceso terminó sin enviar resultado
+            exacto = None
+        finally:
+            if proceso.is_alive():
+                proceso.kill()
+            proceso.join()
+            receptor.close()
+        return exacto
+    
+    def calcular_exacto_con_limite(self, f_sup_str: str, f_inf_str: str,
+                                   x_lims: Tuple, y_lims: Tuple,
+                                   tiempo_limite: float = 10.0,
+                                   metodo_numerico: str = "gauss_legendre",
+                                   al_obtener_numerico: Optional[Callable] = None,
+                                   automatico: bool = False) -> Dict:
         """
-        Calcula el volumen utilizando integración numérica de SciPy.
+        Calcula el volumen exacto con un tiempo límite, con respaldo numérico.
+        
+        La integración simbólica corre en un proceso aparte mientras el
+        cálculo numérico avanza en este; si el proceso no termina antes del
+        plazo, se elimina y se devuelve el resultado numérico marcado como
+        respaldo.
         
         Args:
-            f_sup_func: Función superior f(x,y)
-            f_inf_func: Función inferior g(x,y)
+            f_sup_str: Expresión de superficie superior (string SymPy)
+            f_inf_str: Expresión de superficie inferior (string SymPy)
             x_lims: Tupla (x_min, x_max)
-            y_lims_func: Tupla (y_min_func(x), y_max_func(x))
+            y_lims: Tupla (y_min_expr, y_max_expr) como strings
+            tiempo_limite: Segundos disponibles para la parte simbólica
+            metodo_numerico: Motor de calcular_numerico para el respaldo
+            al_obtener_numerico: Función opcional que recibe el resultado
+                                 numérico en cuanto está disponible
+            automatico: Usar calcular_exacto_automatico (elige polares si la
+                        región es un disco) en lugar de calcular_exacto
             
         Returns:
-            Dict con volumen, error estimado y método
-        """
-        def integrando(y, x):
-            """Altura del sólido h(x,y) = f(x,y) - g(x,y)"""
-            try:
-                return f_sup_func(x, y) - f_inf_func(x, y)
-            except:
-                return 0.0
-        
-        # Integración doble con SciPy
-        # dblquad(func, x_min, x_max, y_min_func, y_max_func)
-        volumen, error = integrate.dblquad(
-            integrando,
-            x_lims[0], x_lims[1],
-            y_lims_func[0], y_lims_func[1],
-            epsabs=1e-8,
-            epsrel=1e-8
-        )
+            Dict del método simbólico (si terminó a tiempo) o del respaldo
+            numérico, con 'respaldo_numerico' y 'resultado_numerico'
+        """
+        inicio = time.perf_counter()
+        
+        # Una expresión mal escrita falla aquí como en calcular_exacto, antes
+        # de lanzar el proceso
+        exacto = None
+        try:
+            h, y_min_expr, y_max_expr = self._problema_cartesiano(
+                f_sup_str, f_inf_str, y_lims
+            )
+            if not automatico:
+                # Un acierto de la caché persistente no necesita proceso aparte
+                _, exacto = self._consultar_cache(
+                    "cartesiano", h,
+                    (self.y, y_min_expr, y_max_expr, self.x, x_lims[0], x_lims[1])
+                )
+        except Exception as e:
+            logger.info("Expresión no válida h = %s - (%s): %s", f_sup_str, f_inf_str, e)
+            return {
+                "error": str(e),
+                "exito": False,
+                "mensaje": f"No se pudo resolver analíticamente: {str(e)}"
+            }
+        
+        proceso = None
+        if exacto is None:
+            proceso = self._iniciar_exacto_en_proceso(f_sup_str, f_inf_str, x_lims, y_lims,
+                                                      automatico)
+        
+        try:
+            # El cálculo numérico avanza en paralelo con el simbólico
+            resultado_num = self.calcular_numerico(
+                f_sup_str, f_inf_str, x_lims, y_lims, metodo=metodo_numerico
+            )
+            if al_obtener_numerico is not None:
+                al_obtener_numerico(resultado_num)
+            
+            if proceso is not None:
+                restante = tiempo_limite - (time.perf_counter() - inicio)
+                exacto = self._esperar_exacto(proceso, restante)
+                proceso = None
+        finally:
+            if proceso is not None:
+                # El cálculo numérico falló: el proceso no debe quedar huérfano
+                self._esperar_exacto(proceso, 0.0)
+        
+        tiempo = time.perf_counter() - inicio
+        if exacto is not None and exacto.get("exito"):
+            resultado = dict(exacto)
+            resultado.update({
+                "respaldo_numerico": False,
+                "resultado_numerico": resultado_num,
+                "tiempo_limite": tiempo_limite,
+                "tiempo_s": tiempo
+            })
+            return resultado
+        
+        if exacto is None:
+            mensaje = f"La integración simbólica superó el límite de {tiempo_limite} s"
+        else:
+            mensaje = exacto.get("mensaje", "No se pudo resolver analíticamente")
         
         return {
+            "exito": False,
+            "respaldo_numerico": True,
+            "valor_numerico": resultado_num["volumen"],
+            "error_estimado": resultado_num["error_estimado"],
+            "metodo": f"Respaldo numérico - {resultado_num['metodo']}",
+            "mensaje": mensaje,
+            "resultado_numerico": resultado_num,
+            "tiempo_limite": tiempo_limite,
+            "tiempo_s": tiempo
+        }
+    
+    def calcular_numerico(self, f_sup_func: Callable, f_inf_func: Callable,
+                         x_lims: Tuple, y_lims_func: Tuple,
+                         metodo: str = "dblquad",
+                         epsabs: float = 1e-8, epsrel: float = 1e-8,
+                         tiempo_limite: Optional[float] = None,
+                         max_nodos: Optional[int] = None,
+                         al_progresar: Optional[Callable] = None,
+                         transformacion=None) -> Dict:
+        """
+        Calcula el volumen utilizando integración numérica.
+        
+        Los motores vectorizados refinan progresivamente y se detienen en
+        cuanto el error estimado cumple max(epsabs, epsrel·|V|), o al agotar
+        tiempo_limite o max_nodos; en ese caso devuelven la mejor estimación
+        con convergio=False y el error realmente alcanzado. dblquad solo
+        respeta las tolerancias.
+        
+        Args:
+            f_sup_func: Función superior f(x,y) o su expresión como string
+            f_inf_func: Función inferior g(x,y) o su expresión como string
+            x_lims: Tupla (x_min, x_max)
+            y_lims_func: Tupla (y_min_func(x), y_max_func(x)); también se
+                         aceptan strings como "-sqrt(4 - x**2)"
+            metodo: 'dblquad' (SciPy, punto a punto) o un motor vectorizado:
+                    'gauss_legendre', 'clenshaw_curtis' o 'genz_malik'
+                    (adaptativo 2D)
+            epsabs: Tolerancia absoluta objetivo
+            epsrel: Tolerancia relativa objetivo
+            tiempo_limite: Segundos disponibles (motores vectorizados)
+            max_nodos: Nodos evaluados disponibles (motores vectorizados)
+            al_progresar: Función llamada con cada estimación intermedia
+                          (volumen, error_estimado, nodos, tiempo_s...)
+            transformacion: Sustitución de extremos antes de integrar:
+                            None, 'seno' o 'tanh_sinh' (en ambas variables),
+                            una tupla (en_x, en_y), o 'auto' para detectarla
+                            cuando las expresiones son strings (ver
+                            detectar_transformacion)
+            
+        Returns:
+            Dict con volumen, error estimado, método, nodos evaluados, tiempo,
+            tolerancias pedidas, error relativo alcanzado, 'motivo_parada'
+            ('tolerancia', 'tiempo', 'nodos' o 'agotado') y 'transformacion'
+            (sustituciones aplicadas en x e y). Con 'genz_malik'
+            incluye además 'arbol' con las estadísticas de refinamiento
+            (celdas, profundidad máxima, regiones críticas). Con reglas
+            tensoriales y límites en y dados como strings, los nodos y pesos
+            de la región se memorizan (RegionIntegracion) y 'nodos_memorizados'
+            cuenta los puntos que no hubo que volver a evaluar.
+        """
+        if metodo not in METODOS_NUMERICOS:
+            raise ValueError(
+                f"Método '{metodo}' no soportado: use {sorted(METODOS_NUMERICOS)}"
+            )
+        
+        inicio = time.perf_counter()
+        
+        if transformacion == "auto":
+            expresiones = (f_sup_func, f_inf_func) + tuple(y_lims_func)
+            if all(isinstance(e, (str, int, float)) for e in expresiones):
+                transformacion = coordenadas.detectar_transformacion(
+                    f_sup_func, f_inf_func, x_lims, y_lims_func
+                )
+            else:
+                transformacion = None
+        if transformacion is None or isinstance(transformacion, str):
+            transformacion = (transformacion or "ninguna",) * 2
+        transformacion = tuple(transformacion)
+        
+        # Las cadenas se compilan una vez a núcleos NumPy (con caché)
+        f_sup_func = como_funcion(f_sup_func)
+        f_inf_func = como_funcion(f_inf_func)
+        y_lims_func = tuple(como_funcion(f, ("x",)) for f in y_lims_func)
+        region = None
+        if metodo in ("gauss_legendre", "clenshaw_curtis") and \
+                all(isinstance(f, ExpresionCompilada) for f in y_lims_func):
+            # Nodos, límites internos y pesos se memorizan por región
+            region = RegionIntegracion(x_lims, y_lims_func, metodo, transformacion)
+        elif transformacion != ("ninguna", "ninguna"):
+            f_sup_func, f_inf_func, x_lims, y_lims_func = transformar_region(
+                f_sup_func, f_inf_func, x_lims, y_lims_func, transformacion
+            )
+        
+        with tramo("cuadratura", metodo=metodo):
+            if metodo == "dblquad":
+                contador = {"nodos": 0}
+            
+                def integrando(y, x):
+                    """Altura del sólido h(x,y) = f(x,y) - g(x,y)"""
+                    contador["nodos"] += 1
+                    try:
+                        return f_sup_func(x, y) - f_inf_func(x, y)
+                    except:
+                        return 0.0
+            
+                # Integración doble con SciPy
+                # dblquad(func, x_min, x_max, y_min_func, y_max_func)
+                volumen, error = integrate.dblquad(
+                    integrando,
+                    x_lims[0], x_lims[1],
+                    y_lims_func[0], y_lims_func[1],
+                    epsabs=epsabs,
+                    epsrel=epsrel
+                )
+                # Cada nodo es una llamada de Python al integrando
+                nodos = evaluaciones = contador["nodos"]
+                convergio = error <= max(epsabs, epsrel * abs(volumen))
+                motivo = "tolerancia" if convergio else "agotado"
+                arbol = None
+            else:
+                # Motores vectorizados: una llamada por lote de nodos
+                if metodo == "genz_malik":
+                    presupuesto = {} if max_nodos is None else {"max_nodos": max_nodos}
+                    resultado = integrar_genz_malik(
+                        f_sup_func, f_inf_func, x_lims, y_lims_func,
+                        epsabs=epsabs, epsrel=epsrel, tiempo_limite=tiempo_limite,
+                        al_progresar=al_progresar, **presupuesto
+                    )
+                elif region is not None:
+                    resultado = region.integrar(
+                        f_sup_func, f_inf_func, epsabs=epsabs, epsrel=epsrel,
+                        tiempo_limite=tiempo_limite, max_nodos=max_nodos,
+                        al_progresar=al_progresar
+                    )
+                else:
+                    resultado = integrar_tensorial(
+                        f_sup_func, f_inf_func, x_lims, y_lims_func,
+                        regla=metodo, epsabs=epsabs, epsrel=epsrel,
+                        tiempo_limite=tiempo_limite, max_nodos=max_nodos,
+                        al_progresar=al_progresar
+                    )
+                volumen = resultado["volumen"]
+                error = resultado["error_estimado"]
+                nodos = resultado["nodos"]
+                evaluaciones = resultado["evaluaciones"]
+                convergio = resultado["convergio"]
+                motivo = resultado["motivo_parada"]
+                arbol = resultado.get("arbol")
+        # Puntos donde se evaluó h y llamadas (lotes) al integrando
+        contar("evaluaciones_integrando", nodos, metodo=metodo)
+        contar("llamadas_integrando", evaluaciones, metodo=metodo)
+        
+        salida = {
             "volumen": volumen,
             "error_estimado": error,
             "precision": f"±{error:.2e}",
-            "metodo": "Integración Numérica (SciPy dblquad - Gauss-Kronrod)",
-            "tolerancia_absoluta": 1e-8,
-            "tolerancia_relativa": 1e-8
+            "metodo": METODOS_NUMERICOS[metodo],
+            "tolerancia_absoluta": epsabs,
+            "tolerancia_relativa": epsrel,
+            "error_relativo": error / abs(volumen) if volumen else float("inf"),
+            "nodos": nodos,
+            "evaluaciones": evaluaciones,
+            "convergio": convergio,
+            "motivo_parada": motivo,
+            "transformacion": transformacion,
+            "tiempo_s": time.perf_counter() - inicio
         }
+        if arbol is not None:
+            salida["arbol"] = arbol
+        if region is not None:
+            salida["nodos_memorizados"] = resultado["nodos_memorizados"]
+        return salida
+    
+    def calcular_region_3d(self, region, caja: Tuple, integrando=None,
+                           secuencia: str = "sobol",
+                           epsabs: float = 1e-3, epsrel: float = 1e-3,
+                           max_muestras: int = 2**24, semilla=None,
+                           al_progresar: Optional[Callable] = None) -> Dict:
+        """
+        Calcula el volumen (o la integral triple de integrando) de un sólido
+        definido por desigualdades, con Monte Carlo o cuasi-Monte Carlo.
+        
+        Args:
+            region: Desigualdades en texto, p. ej. "(x**2 + y**2 <= 1) & (x**2 + z**2 <= 1)",
+                    una superficie implícita F(x,y,z) (interior F ≤ 0) o una
+                    función indicadora vectorizada
+            caja: ((x_min, x_max), (y_min, y_max), (z_min, z_max)) que contiene la región
+            integrando: f(x,y,z) como string o función; None para el volumen
+            secuencia: 'sobol', 'halton' o 'aleatoria'
+            epsabs: Semiamplitud absoluta objetivo del intervalo de confianza
+            epsrel: Semiamplitud relativa objetivo
+            max_muestras: Máximo total de puntos evaluados
+            semilla: Semilla para reproducir la estimación
+            al_progresar: Función llamada con cada estimación intermedia
+            
+        Returns:
+            Dict con volumen, error estimado, intervalo de confianza (95 %),
+            muestras, convergencia y tiempo. Las esferas y las intersecciones
+            de dos o tres cilindros ortogonales se resuelven con su fórmula
+            cerrada (error 0, sin muestras).
+        """
+        inicio = time.perf_counter()
+        
+        # Esferas y cilindros ortogonales: volumen exacto sin muestrear
+        forma = None
+        if integrando is None and isinstance(region, str):
+            forma = self._reconocer(formas_cerradas.reconocer_region_3d, region,
+                                    tuple(tuple(lims) for lims in caja))
+        if forma is not None:
+            if self.depuracion:
+                aproximado = montecarlo.integrar_montecarlo(region, caja, epsabs=epsabs,
+                                                 epsrel=epsrel, semilla=semilla)
+                self._confirmar_forma_cerrada(forma, aproximado["volumen"],
+                                              4 * aproximado["error_estimado"])
+            resultado = self._resultado_forma_cerrada(forma)
+            resultado.update({
+                "volumen": forma[2],
+                "error_estimado": 0.0,
+                "intervalo_confianza": (forma[2], forma[2]),
+                "precision": "exacto",
+                "muestras": 0,
+                "nodos": 0,
+                "evaluaciones": 0,
+                "convergio": True,
+                "tiempo_s": time.perf_counter() - inicio
+            })
+            return resultado
+        
+        resultado = montecarlo.integrar_montecarlo(
+            region, caja, integrando, secuencia=secuencia,
+            epsabs=epsabs, epsrel=epsrel, semilla=semilla,
+            max_muestras=max_muestras, al_progresar=al_progresar
+        )
+        etiqueta = {"sobol": "Cuasi-Monte Carlo (Sobol)",
+                    "halton": "Cuasi-Monte Carlo (Halton)",
+                    "aleatoria": "Monte Carlo"}[secuencia]
+        resultado.update({
+            "precision": f"±{resultado['error_estimado']:.2e}",
+            "metodo": etiqueta,
+            "tolerancia_absoluta": epsabs,
+            "tolerancia_relativa": epsrel,
+            "nodos": resultado["muestras"],
+            "tiempo_s": time.perf_counter() - inicio
+        })
+        return resultado
+    
+    def calcular_lote(self, f_sup_str: str, f_inf_str: str,
+                      x_lims: Tuple, y_lims: Tuple, parametros,
+                      orden: int = 64, regla: str = "gauss_legendre") -> np.ndarray:
+        """
+        Calcula en una sola llamada vectorizada los volúmenes de una familia
+        de sólidos con parámetros libres (p. ej. z = a - x² - y² y
+        z = b(x² + y²) sobre el disco de radio R).
+        
+        Args:
+            f_sup_str: Superficie superior con parámetros, p. ej. "a - x**2 - y**2"
+            f_inf_str: Superficie inferior, p. ej. "b*(x**2 + y**2)"
+            x_lims: Tupla (x_min, x_max); números o strings en los parámetros
+            y_lims: Tupla (y_min, y_max) como strings en x y los parámetros
+            parametros: Dict {nombre: arreglo} o arreglo estructurado de NumPy
+            orden: Nodos por dirección de la cuadratura
+            regla: 'gauss_legendre' o 'clenshaw_curtis'
+            
+        Returns:
+            Arreglo estructurado con un campo por parámetro más 'volumen'
+            y 'error_estimado'
+        """
+        if isinstance(parametros, np.ndarray) and parametros.dtype.names:
+            nombres = parametros.dtype.names
+            columnas = [parametros[nombre] for nombre in nombres]
+        else:
+            nombres = tuple(parametros)
+            columnas = list(parametros.values())
+        columnas = [np.ravel(c).astype(float) for c in np.broadcast_arrays(*columnas)]
+        
+        variables = ("x", "y") + nombres
+        f_sup = compilar_expresion(f_sup_str, variables)
+        f_inf = compilar_expresion(f_inf_str, variables)
+        y_lims_func = tuple(compilar_expresion(str(l), ("x",) + nombres) for l in y_lims)
+        x_lims_func = tuple(compilar_expresion(str(l), nombres) for l in x_lims)
+        
+        volumenes, errores = integrar_lote_parametrico(
+            f_sup, f_inf, x_lims_func, y_lims_func, tuple(columnas),
+            regla=regla, orden=orden
+        )
+        
+        campos = [(nombre, "f8") for nombre in nombres]
+        resultado = np.empty(len(volumenes), dtype=campos + [
+            ("volumen", "f8"), ("error_estimado", "f8")
+        ])
+        for nombre, columna in zip(nombres, columnas):
+            resultado[nombre] = columna
+        resultado["volumen"] = volumenes
+        resultado["error_estimado"] = errores
+        return resultado
     
     def calcular_con_coordenadas_polares(self, h_expr: str,
-                                        r_lims: Tuple) -> Dict:
+                                        r_lims: Tuple,
+                                        theta_lims: Tuple = ("0", "2*pi")) -> Dict:
         """
         Calcula el volumen usando coordenadas polares (para sólidos con simetría circular).
         
         Args:
             h_expr: Expresión de altura h(r,θ) ya en coordenadas polares
-            r_lims: Tupla (r_min, r_max)
+            r_lims: Tupla (r_min, r_max); pueden depender de theta,
+                    p. ej. ("0", "2*cos(theta)")
+            theta_lims: Tupla (θ_min, θ_max), por defecto [0, 2π]
             
         Returns:
             Dict con resultado simbólico y numérico
         """
+        forma = self._reconocer(formas_cerradas.reconocer_polar, str(h_expr),
+                                tuple(str(v) for v in r_lims),
+                                tuple(str(v) for v in theta_lims))
+        if forma is not None:
+            region = {"r_lims": r_lims, "theta_lims": theta_lims}
+            if self.depuracion and not self._verificar_polar(h_expr, region, forma[2]):
+                raise AssertionError(
+                    f"Fórmula cerrada ({forma[3]}) = {forma[2]} no coincide con "
+                    f"la cuadratura en polares"
+                )
+            resultado = self._resultado_forma_cerrada(forma)
+            resultado.update({
+                "jacobiano": "r",
+                "sistema_coordenadas": "Polares (r, θ)",
+                "desarrollo": [
+                    f"Cambio a coordenadas polares: x = r·cos(θ), y = r·sin(θ)",
+                    f"Jacobiano: r",
+                    f"Altura: h(r) = {h_expr}",
+                    f"Límites: r ∈ [{r_lims[0]}, {r_lims[1]}], "
+                    f"θ ∈ [{_notacion_theta(theta_lims[0])}, {_notacion_theta(theta_lims[1])}]",
+                    f"Familia reconocida ({forma[3]}): fórmula cerrada",
+                    f"Resultado: {forma[1]}"
+                ]
+            })
+            return resultado
+        
         try:
-            r, theta = sp.symbols('r theta', real=True, positive=True)
+            r = sp.Symbol('r', real=True, positive=True)
+            theta = sp.Symbol('theta', real=True)
+            locales = {'r': r, 'theta': theta}
             
             # Parse la expresión usando los símbolos locales
-            h = sp.sympify(h_expr, locals={'r': r, 'theta': theta})
+            h = sp.sympify(h_expr, locals=locales)
+            r_min, r_max = (sp.sympify(str(v), locals=locales) for v in r_lims)
+            t_min, t_max = (sp.sympify(str(v), locals=locales) for v in theta_lims)
             
             # Jacobiano para polares: r
             integrando = h * r
             
+            clave, guardado = self._consultar_cache(
+                "polar", integrando, (r, r_min, r_max, theta, t_min, t_max)
+            )
+            if guardado is not None:
+                return guardado
+            
             # Integral en r
-            res_r = sp.integrate(integrando, (r, r_lims[0], r_lims[1]))
+            with tramo("integral_interna", sistema="polar"):
+                res_r = sp.integrate(integrando, (r, r_min, r_max))
             
-            # Integral en theta de 0 a 2π
-            volumen = sp.integrate(res_r, (theta, 0, 2*sp.pi))
+            # Integral en theta
+            with tramo("integral_externa", sistema="polar"):
+                volumen = sp.integrate(res_r, (theta, t_min, t_max))
             
-            volumen_simplificado = sp.simplify(volumen)
+            with tramo("simplificar", sistema="polar"):
+                volumen_simplificado = sp.simplify(volumen)
+            with tramo("evalf", sistema="polar"):
+                valor_numerico = float(volumen_simplificado.evalf())
             
-            return {
+            resultado = {
                 "valor_exacto": sp.latex(volumen_simplificado),
                 "valor_exacto_sympy": str(volumen_simplificado),
-                "valor_numerico": float(volumen_simplificado.evalf()),
+                "valor_numerico": valor_numerico,
                 "jacobiano": "r",
                 "sistema_coordenadas": "Polares (r, θ)",
                 "exito": True,
@@ -146,16 +752,207 @@ class AnalizadorMatematico:
                     f"Cambio a coordenadas polares: x = r·cos(θ), y = r·sin(θ)",
                     f"Jacobiano: r",
                     f"Altura: h(r) = {h_expr}",
-                    f"Límites: r ∈ [{r_lims[0]}, {r_lims[1]}], θ ∈ [0, 2π]",
+                    f"Límites: r ∈ [{r_lims[0]}, {r_lims[1]}], "
+                    f"θ ∈ [{_notacion_theta(t_min)}, {_notacion_theta(t_max)}]",
                     f"Resultado: {volumen_simplificado}"
                 ]
             }
+            self._guardar_cache(clave, resultado)
+            return resultado
         except Exception as e:
+            logger.info("Sin solución analítica en polares para h = %s: %s", h_expr, e)
             return {
                 "error": str(e),
                 "exito": False
             }
     
+    def calcular_numerico_polar(self, h_expr: str, r_lims: Tuple,
+                                theta_lims: Tuple = ("0", "2*pi"),
+                                epsabs: float = 1e-8, epsrel: float = 1e-8) -> Dict:
+        """
+        Calcula el volumen numéricamente en coordenadas polares, para regiones
+        que no son de tipo I en cartesianas (p. ej. un anillo).
+        
+        Args:
+            h_expr: Expresión de altura h(r,θ) ya en coordenadas polares
+            r_lims: Tupla (r_min, r_max); pueden depender de theta
+            theta_lims: Tupla (θ_min, θ_max), por defecto [0, 2π]
+            epsabs: Tolerancia absoluta
+            epsrel: Tolerancia relativa
+            
+        Returns:
+            Dict con las mismas claves que calcular_numerico
+        """
+        inicio = time.perf_counter()
+        resultado = self._integrar_polar(h_expr, {"r_lims": r_lims, "theta_lims": theta_lims},
+                                         epsabs, epsrel)
+        volumen, error = resultado["volumen"], resultado["error_estimado"]
+        return {
+            "volumen": volumen,
+            "error_estimado": error,
+            "precision": f"±{error:.2e}",
+            "metodo": "Integración Numérica Vectorizada (Gauss-Legendre en polares)",
+            "tolerancia_absoluta": epsabs,
+            "tolerancia_relativa": epsrel,
+            "error_relativo": error / abs(volumen) if volumen else float("inf"),
+            "nodos": resultado["nodos"],
+            "evaluaciones": resultado["evaluaciones"],
+            "convergio": resultado["convergio"],
+            "motivo_parada": resultado["motivo_parada"],
+            "transformacion": None,
+            "tiempo_s": time.perf_counter() - inicio
+        }
+    
+    def calcular_exacto_automatico(self, f_sup_str: str, f_inf_str: str,
+                                   x_lims: Tuple, y_lims: Tuple,
+                                   anillo: Optional[Tuple] = None,
+                                   comparar_cartesiano: bool = False,
+                                   tiempo_limite_cartesiano: float = 30.0) -> Dict:
+        """
+        Calcula el volumen exacto eligiendo el sistema de coordenadas.
+        
+        Si la región es un disco (o una porción de disco) se reescribe el
+        problema en polares, con límites r(θ) generales; si no, se integra
+        en cartesianas con calcular_exacto.
+        
+        Args:
+            f_sup_str: Expresión de superficie superior (string SymPy)
+            f_inf_str: Expresión de superficie inferior (string SymPy)
+            x_lims: Tupla (x_min, x_max)
+            y_lims: Tupla (y_min_expr, y_max_expr) como strings
+            anillo: Tupla (r_interno, r_externo) para regiones anulares, que
+                    no son de tipo I en cartesianas (ignora x_lims/y_lims)
+            comparar_cartesiano: Integrar también en cartesianas para medir
+                                 el tiempo ahorrado
+            tiempo_limite_cartesiano: Plazo (s) de la integral cartesiana de
+                                      comparación; si vence, el ahorro
+                                      reportado es una cota inferior
+            
+        Returns:
+            Dict del método elegido con 'sistema_elegido', 'deteccion',
+            'simetria_rotacional', 'tiempo_s' y 'tiempo_ahorrado_s'. Si el
+            valor en polares no pasa la verificación, un disco se integra en
+            cartesianas (con tiempo_limite_cartesiano) y un anillo con
+            respaldo numérico en polares ('respaldo_numerico')
+        """
+        inicio = time.perf_counter()
+        
+        if anillo is None and self._reconocer(
+                formas_cerradas.reconocer_cartesiano, str(f_sup_str), str(f_inf_str),
+                tuple(x_lims), tuple(str(v) for v in y_lims)) is not None:
+            # Familia conocida: no hace falta elegir sistema de coordenadas
+            resultado = self.calcular_exacto(f_sup_str, f_inf_str, x_lims, y_lims)
+            resultado.update({
+                "sistema_elegido": "formula_cerrada",
+                "deteccion": None,
+                "simetria_rotacional": None,
+                "tiempo_s": time.perf_counter() - inicio,
+                "tiempo_ahorrado_s": None
+            })
+            return resultado
+        
+        region = coordenadas.region_anular(*anillo) if anillo is not None else \
+            coordenadas.detectar_region_polar(x_lims, y_lims)
+        
+        if region is None:
+            resultado = self.calcular_exacto(f_sup_str, f_inf_str, x_lims, y_lims)
+            resultado.update({
+                "sistema_elegido": "cartesiano",
+                "deteccion": None,
+                "simetria_rotacional": False,
+                "tiempo_s": time.perf_counter() - inicio,
+                "tiempo_ahorrado_s": None
+            })
+            return resultado
+        
+        h, _, _ = self._problema_cartesiano(f_sup_str, f_inf_str, ("0", "0"))
+        h_polar, simetrica = coordenadas.a_polares(h)
+        resultado = self.calcular_con_coordenadas_polares(
+            str(h_polar), region["r_lims"], region["theta_lims"]
+        )
+        # SymPy puede devolver un valor incorrecto en integrales trigonométricas
+        # (p. ej. sqrt(1 - r²cos²θ)): se descarta
+        descartado = resultado.get("exito") and not self._verificar_polar(
+            h_polar, region, resultado["valor_numerico"])
+        if anillo is not None and (descartado or not resultado.get("exito")):
+            # Un anillo no es de tipo I en cartesianas (x_lims/y_lims describirían
+            # otra región): respaldo numérico en polares sobre el mismo anillo
+            numerico = self._integrar_polar(h_polar, region, 1e-10)
+            resultado = {
+                "exito": False,
+                "respaldo_numerico": True,
+                "valor_numerico": numerico["volumen"],
+                "error_estimado": numerico["error_estimado"],
+                "metodo": "Respaldo numérico - Gauss-Legendre en polares",
+                "mensaje": "El valor simbólico en polares no pasó la verificación"
+                           if descartado else resultado.get("error", "Sin solución analítica"),
+                "resultado_numerico": numerico,
+                "polar_descartado": bool(descartado),
+            }
+        elif descartado:
+            # Disco detectado en x_lims/y_lims: la misma región en cartesianas,
+            # con plazo para que sp.integrate no se quede colgado
+            resultado = self.calcular_exacto_con_limite(
+                f_sup_str, f_inf_str, x_lims, y_lims, tiempo_limite=tiempo_limite_cartesiano
+            )
+            resultado.update({
+                "sistema_elegido": "cartesiano",
+                "deteccion": region,
+                "altura_polar": str(h_polar),
+                "simetria_rotacional": simetrica,
+                "polar_descartado": True,
+                "tiempo_s": time.perf_counter() - inicio,
+                "tiempo_ahorrado_s": None
+            })
+            return resultado
+        tiempo = time.perf_counter() - inicio
+        
+        ahorro = None
+        if comparar_cartesiano and anillo is None:
+            # La integral cartesiana puede tardar indefinidamente: se acota
+            inicio_cartesiano = time.perf_counter()
+            cartesiano = self._esperar_exacto(
+                self._iniciar_exacto_en_proceso(f_sup_str, f_inf_str, x_lims, y_lims),
+                tiempo_limite_cartesiano
+            )
+            resultado["tiempo_cartesiano_s"] = time.perf_counter() - inicio_cartesiano
+            resultado["cartesiano_agoto_tiempo"] = cartesiano is None
+            resultado["coincide_cartesiano"] = bool(
+                cartesiano and cartesiano.get("exito") and resultado.get("exito") and
+                abs(cartesiano["valor_numerico"] - resultado["valor_numerico"])
+                <= 1e-9 * max(1.0, abs(resultado["valor_numerico"]))
+            )
+            # Si la cartesiana agotó el plazo, el ahorro es una cota inferior
+            ahorro = resultado["tiempo_cartesiano_s"] - tiempo
+        
+        resultado.update({
+            "sistema_elegido": "polar",
+            "deteccion": region,
+            "altura_polar": str(h_polar),
+            "simetria_rotacional": simetrica,
+            "tiempo_s": tiempo,
+            "tiempo_ahorrado_s": ahorro
+        })
+        return resultado
+    
+    @staticmethod
+    def _integrar_polar(h_polar, region: Dict, epsabs: float,
+                        epsrel: Optional[float] = None) -> Dict:
+        """Cuadratura de Gauss-Legendre de h·r sobre r_lims(θ) × theta_lims."""
+        integrando = compilar_expresion(f"({h_polar})*r", ("theta", "r"))
+        r_lims = tuple(compilar_expresion(str(v), ("theta",)) for v in region["r_lims"])
+        theta_lims = tuple(float(compilar_expresion(str(v), ()).expr) for v in region["theta_lims"])
+        return integrar_tensorial(integrando, lambda t, r: 0.0, theta_lims, r_lims,
+                                  epsabs=epsabs, epsrel=epsabs if epsrel is None else epsrel)
+
+    @classmethod
+    def _verificar_polar(cls, h_polar: sp.Expr, region: Dict, valor: float,
+                         tolerancia: float = 1e-6) -> bool:
+        """Contrasta el valor simbólico en polares con una cuadratura de Gauss-Legendre."""
+        numerico = cls._integrar_polar(h_polar, region, tolerancia)
+        margen = max(10 * numerico["error_estimado"], tolerancia * max(1.0, abs(valor)))
+        return abs(numerico["volumen"] - valor) <= margen
+    
     def comparar_metodos(self, resultado_numerico: Dict, resultado_exacto: Dict) -> Dict:
         """
         Compara los resultados de ambos métodos y calcula métricas de precisión.
@@ -180,14 +977,8 @@ class AnalizadorMatematico:
         error_relativo = (diferencia_absoluta / abs(v_exacto)) * 100 if v_exacto != 0 else 0
         
         # Clasificación de la precisión
-        if error_relativo < 0.0001:
-            clasificacion = "EXCELENTE - Prácticamente idénticos"
-        elif error_relativo < 0.01:
-            clasificacion = "MUY BUENO - Alta coincidencia"
-        elif error_relativo < 0.1:
-            clasificacion = "BUENO - Aceptable"
-        else:
-            clasificacion = "REVISAR - Diferencia notable"
+        clasificacion = next((etiqueta for cota, etiqueta in CLASIFICACIONES
+                              if error_relativo < cota), CLASIFICACION_REVISAR)
         
         return {
             "volumen_numerico": v_num,
@@ -195,59 +986,256 @@ class AnalizadorMatematico:
             "diferencia_absoluta": diferencia_absoluta,
             "error_relativo_porcentaje": error_relativo,
             "clasificacion": clasificacion,
-            "coinciden": error_relativo < 0.01,
+            "coinciden": error_relativo < UMBRAL_COINCIDENCIA,
             "precision_decimal": -np.log10(diferencia_absoluta) if diferencia_absoluta > 0 else float('inf')
         }
+    
+    def comparar_metodos_lote(self, volumenes_numericos, volumenes_exactos=None,
+                              nombres=None, max_atipicos: int = 20) -> Dict:
+        """
+        Versión por columnas de comparar_metodos para miles de pares
+        (catálogos, barridos de parámetros).
+        
+        Cada fila da el mismo resultado que comparar_metodos: un volumen
+        exacto nulo produce error relativo 0 y una diferencia nula,
+        precisión infinita. Las filas sin valor exacto (NaN) se marcan como
+        'solo_numerico' y no se clasifican.
+        
+        Args:
+            volumenes_numericos: Arreglo de volúmenes numéricos, o una tabla
+                                 (dict de columnas o DataFrame) con columnas
+                                 'volumen_numerico', 'volumen_exacto' y,
+                                 opcionalmente, 'nombre'
+            volumenes_exactos: Arreglo de volúmenes exactos (NaN = sin
+                               solución exacta); se omite si se pasa una tabla
+            nombres: Identificador de cada fila para el informe de atípicos
+            max_atipicos: Filas a REVISAR que se detallan en el informe
+            
+        Returns:
+            Dict con las columnas de comparar_metodos (arreglos NumPy) más
+            'solo_numerico', un 'resumen' por clasificación, los 'atipicos'
+            (peores errores relativos primero) y un 'informe' en texto
+        """
+        if volumenes_exactos is None:
+            tabla = volumenes_numericos
+            volumenes_numericos = tabla["volumen_numerico"]
+            volumenes_exactos = tabla["volumen_exacto"]
+            if nombres is None and "nombre" in tabla:
+                nombres = tabla["nombre"]
+        v_num = np.asarray(volumenes_numericos, dtype=float)
+        v_exacto = np.asarray(volumenes_exactos, dtype=float)
+        if v_num.shape != v_exacto.shape or v_num.ndim != 1:
+            raise ValueError(
+                f"Se esperan dos columnas de igual longitud: {v_num.shape} y {v_exacto.shape}"
+            )
+        nombres = np.arange(len(v_num)) if nombres is None else np.asarray(nombres)
+        
+        solo_numerico = np.isnan(v_exacto)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diferencia = np.abs(v_num - v_exacto)
+            error_relativo = np.where(v_exacto != 0, diferencia / np.abs(v_exacto) * 100, 0.0)
+            precision = np.where(diferencia > 0, -np.log10(diferencia), np.inf)
+        error_relativo[solo_numerico] = np.nan
+        precision[solo_numerico] = np.nan
+        
+        # NaN no cumple ninguna cota y cae en REVISAR, como en la versión escalar
+        clasificacion = np.select(
+            [error_relativo < cota for cota, _ in CLASIFICACIONES],
+            [etiqueta for _, etiqueta in CLASIFICACIONES],
+            default=CLASIFICACION_REVISAR
+        ).astype(object)
+        clasificacion[solo_numerico] = None
+        
+        revisar = (clasificacion == CLASIFICACION_REVISAR)
+        indices = np.flatnonzero(revisar)
+        orden = np.argsort(-np.nan_to_num(error_relativo[indices], nan=np.inf), kind="stable")
+        atipicos = [
+            {
+                "nombre": nombres[i].item() if hasattr(nombres[i], "item") else nombres[i],
+                "volumen_numerico": float(v_num[i]),
+                "volumen_exacto": float(v_exacto[i]),
+                "diferencia_absoluta": float(diferencia[i]),
+                "error_relativo_porcentaje": float(error_relativo[i]),
+            }
+            for i in indices[orden][:max_atipicos]
+        ]
+        
+        comparados = ~solo_numerico
+        resumen = {etiqueta: int(np.count_nonzero(clasificacion == etiqueta))
+                   for etiqueta in [e for _, e in CLASIFICACIONES] + [CLASIFICACION_REVISAR]}
+        resumen.update({
+            "total": int(len(v_num)),
+            "comparados": int(np.count_nonzero(comparados)),
+            "solo_numerico": int(np.count_nonzero(solo_numerico)),
+            "exacto_nulo": int(np.count_nonzero(v_exacto == 0)),
+            "error_relativo_maximo": float(np.nanmax(error_relativo)) if comparados.any() else None,
+            "error_relativo_mediano": float(np.nanmedian(error_relativo)) if comparados.any() else None,
+        })
+        
+        lineas = [
+            f"{resumen['comparados']} de {resumen['total']} pares comparados "
+            f"({resumen['solo_numerico']} sin solución exacta)"
+        ]
+        lineas += [f"  {etiqueta}: {resumen[etiqueta]}"
+                   for etiqueta in [e for _, e in CLASIFICACIONES] + [CLASIFICACION_REVISAR]]
+        if resumen["exacto_nulo"]:
+            lineas.append(f"{resumen['exacto_nulo']} con volumen exacto nulo "
+                          f"(error relativo 0 por convención)")
+        if atipicos:
+            lineas.append(f"Atípicos ({len(indices)}; se muestran {len(atipicos)}):")
+            lineas += [
+                f"  {a['nombre']}: numérico {a['volumen_numerico']:.8g}, exacto "
+                f"{a['volumen_exacto']:.8g}, error {a['error_relativo_porcentaje']:.3g}%"
+                for a in atipicos
+            ]
+        
+        return {
+            "volumen_numerico": v_num,
+            "volumen_exacto": v_exacto,
+            "diferencia_absoluta": diferencia,
+            "error_relativo_porcentaje": error_relativo,
+            "clasificacion": clasificacion,
+            "coinciden": error_relativo < UMBRAL_COINCIDENCIA,
+            "precision_decimal": precision,
+            "solo_numerico": solo_numerico,
+            "resumen": resumen,
+            "atipicos": atipicos,
+            "informe": "\n".join(lineas)
+        }
+
+
+def _notacion(expresion: str) -> str:
+    """Notación legible para los textos del reporte: x**2 → x²."""
+    return expresion.replace("**2", "²").replace("**3", "³")
 
 
 class BibliotecaSolidos:
     """Biblioteca de sólidos predefinidos con análisis completo."""
     
-    def __init__(self):
-        self.analizador = AnalizadorMatematico()
-        
-    def paraboloides_intersectados(self) -> Dict:
+    def __init__(self, registro: Optional[RegistroSolidos] = None):
         """
-        Sólido entre z = 8 - x² - y² (paraboloide hacia abajo)
-        y z = x² + y² (paraboloide hacia arriba)
+        Args:
+            registro: Registro de sólidos (por defecto, solidos_predefinidos.json)
         """
-        # Método numérico
-        f_sup = lambda x, y: 8 - x**2 - y**2
-        f_inf = lambda x, y: x**2 + y**2
-        y_min_func = lambda x: -np.sqrt(np.maximum(4 - x**2, 0))
-        y_max_func = lambda x: np.sqrt(np.maximum(4 - x**2, 0))
-        
-        resultado_num = self.analizador.calcular_numerico(
-            f_sup, f_inf,
-            (-2, 2),
-            (y_min_func, y_max_func)
+        self.analizador = AnalizadorMatematico()
+        self.registro = registro if registro is not None else registro_predefinido()
+    
+    def catalogo(self) -> List[EspecificacionSolido]:
+        """Especificaciones de todos los sólidos registrados."""
+        return list(self.registro)
+    
+    def obtener(self, nombre: str) -> EspecificacionSolido:
+        """Especificación de un sólido por nombre o clave (ValueError si no existe)."""
+        return self.registro.obtener(nombre)
+    
+    def _altura_polar(self, espec: EspecificacionSolido) -> str:
+        """h(r, θ) de la especificación, o la de sus superficies en polares."""
+        if espec.altura_polar is not None:
+            return espec.altura_polar
+        h, _, _ = self.analizador._problema_cartesiano(
+            espec.superficie_superior, espec.superficie_inferior, ("0", "0")
         )
-        
-        # Método simbólico con coordenadas polares
-        # Altura en polares: h(r) = (8 - r²) - (r²) = 8 - 2r²
-        resultado_exacto = self.analizador.calcular_con_coordenadas_polares(
-            "8 - 2*r**2",   # Altura en polares
-            (0, 2)          # r de 0 a 2
+        return str(coordenadas.a_polares(h)[0])
+    
+    def analizar_numerico(self, espec: EspecificacionSolido) -> Dict:
+        """Mitad numérica del análisis de un sólido."""
+        if espec.tipo_region == "anillo":
+            # x_lims/y_lims solo encierran el anillo: se integra en polares
+            return self.analizador.calcular_numerico_polar(self._altura_polar(espec), espec.r_lims)
+        return self.analizador.calcular_numerico(
+            espec.superficie_superior, espec.superficie_inferior,
+            espec.x_lims_numericos, espec.y_lims,
+            metodo=espec.metodo_numerico
         )
-        
-        # Comparación
+    
+    def analizar_exacto(self, espec: EspecificacionSolido) -> Dict:
+        """
+        Mitad simbólica según tipo_region: un anillo va a
+        calcular_exacto_automatico con sus radios; un disco, a polares (con la
+        altura polar de la especificación o detectando la región); el tipo I,
+        a cartesianas.
+        """
+        if espec.tipo_region == "anillo":
+            return self.analizador.calcular_exacto_automatico(
+                espec.superficie_superior, espec.superficie_inferior,
+                espec.x_lims, espec.y_lims, anillo=espec.r_lims
+            )
+        if espec.altura_polar is not None:
+            return self.analizador.calcular_con_coordenadas_polares(
+                espec.altura_polar, espec.r_lims
+            )
+        if espec.tipo_region == "disco":
+            return self.analizador.calcular_exacto_automatico(
+                espec.superficie_superior, espec.superficie_inferior,
+                espec.x_lims, espec.y_lims
+            )
+        return self.analizador.calcular_exacto(
+            espec.superficie_superior, espec.superficie_inferior,
+            espec.x_lims, espec.y_lims
+        )
+    
+    def combinar(self, espec: EspecificacionSolido, resultado_num: Dict,
+                 resultado_exacto: Dict) -> Dict:
+        """Arma el análisis completo a partir de ambas mitades."""
         comparacion = self.analizador.comparar_metodos(resultado_num, resultado_exacto)
         
         return {
-            "nombre": "Paraboloides Intersectados",
-            "descripcion": "Sólido limitado por z = 8 - x² - y² y z = x² + y²",
+            "nombre": espec.nombre,
+            "descripcion": espec.descripcion,
             "ecuaciones": {
-                "superior": "z = 8 - x² - y²",
-                "inferior": "z = x² + y²"
+                "superior": f"z = {_notacion(espec.superficie_superior)}",
+                "inferior": f"z = {_notacion(espec.superficie_inferior)}"
+            },
+            "expresiones": {
+                "superior": espec.superficie_superior,
+                "inferior": espec.superficie_inferior,
+                "x_lims": espec.x_lims_numericos,
+                "y_lims": espec.y_lims
             },
             "resultado_numerico": resultado_num,
             "resultado_exacto": resultado_exacto,
             "comparacion": comparacion,
-            "metodo_optimo": "Coordenadas polares por simetría circular"
+            "metodo_optimo": espec.metodo_optimo
         }
+    
+    def analizar(self, espec) -> Dict:
+        """
+        Análisis completo (numérico, simbólico y comparación) de un sólido.
+        
+        Args:
+            espec: EspecificacionSolido, o nombre/clave de un sólido registrado
+        """
+        if isinstance(espec, str):
+            espec = self.obtener(espec)
+        return self.combinar(espec, self.analizar_numerico(espec), self.analizar_exacto(espec))
+    
+    def ejecutar_catalogo(self, especificaciones=None, max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Analiza el catálogo en paralelo con un ProcessPoolExecutor.
+        
+        Args:
+            especificaciones: Sólidos a analizar (por defecto, el catálogo)
+            max_workers: Procesos del pool (por defecto, núcleos disponibles)
+            
+        Returns:
+            Lista de análisis completos, en el orden de especificaciones
+        """
+        from ejecucion_paralela import ejecutar_catalogo
+        
+        if especificaciones is None:
+            especificaciones = self.catalogo()
+        return ejecutar_catalogo(especificaciones, max_workers=max_workers)
+        
+    def paraboloides_intersectados(self) -> Dict:
+        """
+        Sólido entre z = 8 - x² - y² (paraboloide hacia abajo)
+        y z = x² + y² (paraboloide hacia arriba)
+        """
+        return self.analizar("Paraboloides Intersectados")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("="*80)
     print("ANALIZADOR MATEMÁTICO - SISTEMA DE VALIDACIÓN TÉCNICA")
     print("Universidad Católica de Santiago de Guayaquil")
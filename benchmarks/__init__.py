@@ -0,0 +1,12 @@
+"""
+Benchmarks de los Motores de Integración
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Uso:
+    python -m benchmarks                          # ejecutar y mostrar tabla
+    python -m benchmarks --salida actual.json     # guardar resultados
+    python -m benchmarks --guardar-base base.json # fijar línea base
+    python -m benchmarks --base base.json         # comparar (código 1 si hay regresión)
+    python -m benchmarks.arranque                 # presupuesto de arranque (código 1 si se excede)
+"""
@@ -0,0 +1,63 @@
+"""Punto de entrada: python -m benchmarks."""
+
+import argparse
+import sys
+
+from benchmarks.corpus import CASOS
+from benchmarks.ejecutor import MOTORES, cargar, comparar_con_base, ejecutar, guardar
+
+
+def _linea(medicion):
+    if "fallo" in medicion:
+        return (f"{medicion['caso']:<28} {medicion['motor']:<22} "
+                f"{medicion.get('tiempo_s', float('nan')):>10.4f} {'-':>10} {'-':>10} {'-':>12}  "
+                f"{medicion['fallo'][:40]}")
+    evaluaciones, nodos = medicion.get("evaluaciones"), medicion.get("nodos")
+    return (f"{medicion['caso']:<28} {medicion['motor']:<22} "
+            f"{medicion['tiempo_s']:>10.4f} "
+            f"{evaluaciones if evaluaciones is not None else '-':>10} "
+            f"{nodos if nodos is not None else '-':>10} "
+            f"{medicion['error_relativo']:>12.2e}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmarks de los motores de integración")
+    parser.add_argument("--motores", nargs="+", choices=MOTORES, default=list(MOTORES))
+    parser.add_argument("--casos", nargs="+", choices=[c["nombre"] for c in CASOS])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--tiempo-limite", type=float, default=30.0,
+                        help="plazo (s) de cada motor simbólico")
+    parser.add_argument("--salida", help="guardar los resultados en JSON")
+    parser.add_argument("--guardar-base", help="guardar los resultados como línea base")
+    parser.add_argument("--base", help="comparar contra una línea base")
+    parser.add_argument("--umbral", type=float, default=1.5,
+                        help="factor de tiempo/evaluaciones tolerado frente a la base")
+    args = parser.parse_args(argv)
+
+    casos = [c for c in CASOS if not args.casos or c["nombre"] in args.casos]
+
+    print(f"{'Caso':<28} {'Motor':<22} {'Tiempo (s)':>10} {'Evals':>10} {'Nodos':>10} {'Error rel.':>12}")
+    print("-" * 97)
+    resultados = ejecutar(casos, args.motores, args.repeticiones, args.tiempo_limite,
+                          al_medir=lambda m: print(_linea(m), flush=True))
+
+    for ruta in (args.salida, args.guardar_base):
+        if ruta:
+            guardar(resultados, ruta)
+            print(f"\n✓ Resultados guardados en {ruta}")
+
+    if args.base:
+        regresiones = comparar_con_base(resultados, cargar(args.base), args.umbral)
+        if regresiones:
+            print(f"\n✗ {len(regresiones)} regresión(es) frente a {args.base}:")
+            for r in regresiones:
+                detalle = r.get("detalle") or f"{r['base']:.4g} → {r['actual']:.4g}"
+                print(f"  {r['caso']} / {r['motor']}: {r['tipo']} ({detalle})")
+            return 1
+        print(f"\n✓ Sin regresiones frente a {args.base}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
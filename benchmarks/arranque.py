@@ -0,0 +1,124 @@
+"""
+Presupuesto de arranque de los puntos de entrada.
+
+Cada escenario se importa en un intérprete nuevo (mínimo de varias
+repeticiones) y se compara con su presupuesto en segundos. Además se
+comprueba qué dependencias pesadas quedaron cargadas: un trabajador que
+solo integra numéricamente no debe importar SymPy, matplotlib ni ReportLab.
+
+    python -m benchmarks.arranque               # código 1 si se excede algo
+    python -m benchmarks.arranque --factor 2    # presupuestos ×2 (máquinas lentas)
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PESADOS = ("sympy", "scipy.integrate", "scipy.stats", "matplotlib",
+           "mpl_toolkits.mplot3d", "reportlab.platypus")
+
+_TRABAJADOR_NUMERICO = """
+from analizador_matematico import AnalizadorMatematico
+AnalizadorMatematico().calcular_numerico(
+    lambda x, y: 8 - 2 * x**2 - 2 * y**2, lambda x, y: 0 * x, (-2.0, 2.0),
+    (lambda x: -(4 - x**2)**0.5, lambda x: (4 - x**2)**0.5), metodo="gauss_legendre")
+"""
+
+# nombre: (código, presupuesto en segundos, módulos que no deben cargarse)
+ESCENARIOS = {
+    "analizador_matematico": ("import analizador_matematico", 0.35, PESADOS),
+    "generador_pdf_profesional": ("import generador_pdf_profesional", 0.45, PESADOS),
+    "servidor_calculo": ("import servidor_calculo", 0.30, PESADOS),
+    "reportes_lote": ("import reportes_lote", 0.15, PESADOS),
+    "mallas_solidos": ("import mallas_solidos", 0.30, PESADOS),
+    "trabajador_numerico": (_TRABAJADOR_NUMERICO, 0.60,
+                            ("sympy", "matplotlib", "reportlab.platypus")),
+}
+
+_SONDA = """
+import json, sys, time
+inicio = time.perf_counter()
+exec(compile({codigo!r}, "<escenario>", "exec"))
+print(json.dumps({{"tiempo_s": time.perf_counter() - inicio,
+                  "modulos": [m for m in {pesados!r} if m in sys.modules]}}))
+"""
+
+
+def medir_escenario(codigo: str, repeticiones: int = 5) -> Dict:
+    """
+    Ejecuta codigo en intérpretes nuevos y devuelve el menor tiempo.
+
+    Returns:
+        Dict con 'tiempo_s' (mínimo) y 'modulos' (dependencias pesadas cargadas)
+    """
+    sonda = _SONDA.format(codigo=codigo, pesados=PESADOS)
+    mediciones = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", sonda], cwd=RAIZ, check=True,
+                                capture_output=True, text=True)
+        mediciones.append(json.loads(salida.stdout.strip().splitlines()[-1]))
+    return min(mediciones, key=lambda m: m["tiempo_s"])
+
+
+def verificar_arranque(escenarios: Optional[Sequence[str]] = None,
+                       repeticiones: int = 5, factor: float = 1.0) -> List[Dict]:
+    """
+    Mide cada escenario y lo contrasta con su presupuesto.
+
+    Args:
+        escenarios: Nombres de ESCENARIOS (por defecto, todos)
+        repeticiones: Intérpretes lanzados por escenario
+        factor: Multiplicador de los presupuestos
+
+    Returns:
+        Lista de Dict con 'escenario', 'tiempo_s', 'presupuesto_s',
+        'modulos_prohibidos' y 'exito'
+    """
+    resultados = []
+    for nombre in escenarios or ESCENARIOS:
+        if nombre not in ESCENARIOS:
+            raise ValueError(f"Escenario '{nombre}' no existe: use {sorted(ESCENARIOS)}")
+        codigo, presupuesto, prohibidos = ESCENARIOS[nombre]
+        medicion = medir_escenario(codigo, repeticiones)
+        cargados = [m for m in medicion["modulos"] if m in prohibidos]
+        resultados.append({
+            "escenario": nombre,
+            "tiempo_s": medicion["tiempo_s"],
+            "presupuesto_s": presupuesto * factor,
+            "modulos_prohibidos": cargados,
+            "exito": medicion["tiempo_s"] <= presupuesto * factor and not cargados,
+        })
+    return resultados
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.arranque",
+                                     description="Presupuesto de arranque de los puntos de entrada")
+    parser.add_argument("--escenarios", nargs="+", choices=sorted(ESCENARIOS))
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--factor", type=float, default=1.0,
+                        help="multiplicador de los presupuestos")
+    args = parser.parse_args(argv)
+
+    print(f"{'Escenario':<28} {'Tiempo (s)':>10} {'Presup. (s)':>11}  Dependencias prohibidas")
+    print("-" * 80)
+    resultados = verificar_arranque(args.escenarios, args.repeticiones, args.factor)
+    for r in resultados:
+        marca = "✓" if r["exito"] else "✗"
+        print(f"{r['escenario']:<28} {r['tiempo_s']:>10.3f} {r['presupuesto_s']:>11.3f}  "
+              f"{', '.join(r['modulos_prohibidos']) or '-'} {marca}")
+    fallos = [r for r in resultados if not r["exito"]]
+    if fallos:
+        print(f"\n✗ {len(fallos)} escenario(s) fuera de presupuesto")
+        return 1
+    print("\n✓ Todos los escenarios dentro de presupuesto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
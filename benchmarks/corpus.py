@@ -0,0 +1,117 @@
+"""
+Corpus de sólidos con volumen exacto conocido para los benchmarks.
+
+Cada caso trae las superficies y límites en cartesianas (strings SymPy),
+el volumen exacto y, si aplica, la forma polar y la región 3D por
+desigualdades (motor Monte Carlo).
+"""
+
+import math
+
+
+CASOS = [
+    {
+        "nombre": "paraboloides",
+        "categoria": "suave",
+        "f_sup": "8 - x**2 - y**2",
+        "f_inf": "x**2 + y**2",
+        "x_lims": (-2, 2),
+        "y_lims": ("-sqrt(4 - x**2)", "sqrt(4 - x**2)"),
+        "polar": {"altura": "8 - 2*r**2", "r_lims": ("0", "2")},
+        "exacto": 16 * math.pi,
+    },
+    {
+        "nombre": "esfera",
+        "categoria": "raiz",
+        "f_sup": "sqrt(9 - x**2 - y**2)",
+        "f_inf": "-sqrt(9 - x**2 - y**2)",
+        "x_lims": (-3, 3),
+        "y_lims": ("-sqrt(9 - x**2)", "sqrt(9 - x**2)"),
+        "polar": {"altura": "2*sqrt(9 - r**2)", "r_lims": ("0", "3")},
+        "region_3d": {"region": "x**2 + y**2 + z**2 - 9",
+                      "caja": ((-3, 3), (-3, 3), (-3, 3))},
+        "exacto": 36 * math.pi,
+    },
+    {
+        "nombre": "cono",
+        "categoria": "raiz",
+        "f_sup": "2 - sqrt(x**2 + y**2)",
+        "f_inf": "0",
+        "x_lims": (-2, 2),
+        "y_lims": ("-sqrt(4 - x**2)", "sqrt(4 - x**2)"),
+        "polar": {"altura": "2 - r", "r_lims": ("0", "2")},
+        "exacto": 8 * math.pi / 3,
+    },
+    {
+        "nombre": "cilindro_plano_inclinado",
+        "categoria": "suave",
+        "f_sup": "4 - y",
+        "f_inf": "0",
+        "x_lims": (-2, 2),
+        "y_lims": ("-sqrt(4 - x**2)", "sqrt(4 - x**2)"),
+        "polar": {"altura": "4 - r*sin(theta)", "r_lims": ("0", "2")},
+        "exacto": 16 * math.pi,
+    },
+    {
+        "nombre": "cilindro_entre_planos",
+        "categoria": "suave",
+        "f_sup": "x + 3",
+        "f_inf": "-1",
+        "x_lims": (-2, 2),
+        "y_lims": ("-sqrt(4 - x**2)", "sqrt(4 - x**2)"),
+        "polar": {"altura": "r*cos(theta) + 4", "r_lims": ("0", "2")},
+        "exacto": 16 * math.pi,
+    },
+    {
+        "nombre": "steinmetz",
+        "categoria": "raiz",
+        "f_sup": "sqrt(1 - x**2)",
+        "f_inf": "-sqrt(1 - x**2)",
+        "x_lims": (-1, 1),
+        "y_lims": ("-sqrt(1 - x**2)", "sqrt(1 - x**2)"),
+        "polar": None,
+        "region_3d": {"region": "(x**2 + y**2 <= 1) & (x**2 + z**2 <= 1)",
+                      "caja": ((-1, 1), (-1, 1), (-1, 1))},
+        "exacto": 16 / 3,
+    },
+    {
+        "nombre": "oscilatorio",
+        "categoria": "oscilatorio",
+        "f_sup": "sin(5*x)**2 * cos(5*y)**2",
+        "f_inf": "0",
+        "x_lims": (0, math.pi),
+        "y_lims": ("0", "pi"),
+        "polar": None,
+        "exacto": math.pi**2 / 4,
+    },
+    {
+        "nombre": "oscilatorio_alta_frecuencia",
+        "categoria": "oscilatorio",
+        "f_sup": "1 + sin(20*x)*sin(20*y)",
+        "f_inf": "0",
+        "x_lims": (0, math.pi),
+        "y_lims": ("0", "pi"),
+        "polar": None,
+        "exacto": math.pi**2,
+    },
+    {
+        "nombre": "singular_raiz",
+        "categoria": "singular",
+        "f_sup": "sqrt(x*y)",
+        "f_inf": "0",
+        "x_lims": (0, 1),
+        "y_lims": ("0", "1"),
+        "polar": None,
+        "exacto": 4 / 9,
+    },
+    {
+        "nombre": "singular_integrable",
+        "categoria": "singular",
+        "f_sup": "1/sqrt(x)",
+        "f_inf": "0",
+        "x_lims": (0, 1),
+        "y_lims": ("0", "1"),
+        "polar": None,
+        "exacto": 2.0,
+    },
+]
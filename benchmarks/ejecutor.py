@@ -0,0 +1,262 @@
+"""
+Ejecución de los benchmarks y comparación con una línea base.
+
+Los motores numéricos se miden en el proceso actual (mínimo de varias
+repeticiones). Los simbólicos corren en un proceso aparte con plazo, porque
+sp.integrate puede no terminar en algunos casos del corpus. El
+reconocimiento de fórmulas cerradas se desactiva: se mide la integración,
+no la coincidencia de patrones.
+"""
+
+import json
+import multiprocessing
+import platform
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from analizador_matematico import AnalizadorMatematico, METODOS_NUMERICOS
+from regiones_integracion import limpiar_cache_regiones
+
+
+MOTORES_SIMBOLICOS = ("exacto", "polar", "automatico")
+MOTORES_MONTECARLO = ("montecarlo",)
+# Los mismos motores numéricos con transformacion="auto" (sustitución de extremos)
+SUFIJO_TRANSFORMADO = "+auto"
+MOTORES_TRANSFORMADOS = tuple(m + SUFIJO_TRANSFORMADO for m in METODOS_NUMERICOS)
+MOTORES = (tuple(METODOS_NUMERICOS) + MOTORES_TRANSFORMADOS + MOTORES_MONTECARLO
+           + MOTORES_SIMBOLICOS)
+
+
+def _ejecutar_motor(motor: str, caso: Dict) -> Optional[Dict]:
+    """Ejecuta un motor sobre un caso; None si el motor no aplica al caso."""
+    analizador = AnalizadorMatematico(usar_formas_cerradas=False)
+    metodo = motor[:-len(SUFIJO_TRANSFORMADO)] if motor in MOTORES_TRANSFORMADOS else motor
+    if metodo in METODOS_NUMERICOS:
+        # Se mide el cálculo completo, no un acierto de las tablas memorizadas
+        limpiar_cache_regiones()
+        resultado = analizador.calcular_numerico(
+            caso["f_sup"], caso["f_inf"], caso["x_lims"], caso["y_lims"], metodo=metodo,
+            transformacion="auto" if motor in MOTORES_TRANSFORMADOS else None
+        )
+        return {
+            "volumen": resultado["volumen"],
+            "error_estimado": resultado["error_estimado"],
+            "evaluaciones": resultado["evaluaciones"],
+            "nodos": resultado["nodos"],
+            "transformacion": list(resultado["transformacion"]),
+        }
+
+    if motor == "montecarlo":
+        if not caso.get("region_3d"):
+            return None
+        resultado = analizador.calcular_region_3d(
+            caso["region_3d"]["region"], caso["region_3d"]["caja"], semilla=0
+        )
+        return {
+            "volumen": resultado["volumen"],
+            "error_estimado": resultado["error_estimado"],
+            "evaluaciones": resultado["evaluaciones"],
+            "nodos": resultado["nodos"],
+        }
+
+    if motor == "exacto":
+        resultado = analizador.calcular_exacto(
+            caso["f_sup"], caso["f_inf"], caso["x_lims"], caso["y_lims"]
+        )
+    elif motor == "polar":
+        if not caso.get("polar"):
+            return None
+        polar = caso["polar"]
+        resultado = analizador.calcular_con_coordenadas_polares(
+            polar["altura"], polar["r_lims"], polar.get("theta_lims", ("0", "2*pi"))
+        )
+    elif motor == "automatico":
+        resultado = analizador.calcular_exacto_automatico(
+            caso["f_sup"], caso["f_inf"], caso["x_lims"], caso["y_lims"]
+        )
+    else:
+        raise ValueError(f"Motor '{motor}' no soportado: use {MOTORES}")
+
+    if not resultado.get("exito"):
+        return {"fallo": resultado.get("error", "sin solución")}
+    return {"volumen": resultado["valor_numerico"]}
+
+
+def _trabajo(conexion, motor: str, caso: Dict):
+    try:
+        inicio = time.perf_counter()
+        medicion = _ejecutar_motor(motor, caso)
+        if medicion is not None:
+            medicion["tiempo_s"] = time.perf_counter() - inicio
+        conexion.send(medicion)
+    except Exception as e:
+        conexion.send({"fallo": str(e)})
+    finally:
+        conexion.close()
+
+
+def _medir_con_plazo(motor: str, caso: Dict, tiempo_limite: float) -> Optional[Dict]:
+    """Mide un motor simbólico en un proceso aparte, eliminándolo si vence el plazo."""
+    contexto = multiprocessing.get_context()
+    receptor, emisor = contexto.Pipe(duplex=False)
+    proceso = contexto.Process(target=_trabajo, args=(emisor, motor, caso), daemon=True)
+    proceso.start()
+    emisor.close()
+    try:
+        if receptor.poll(tiempo_limite):
+            return receptor.recv()
+        return {"fallo": "tiempo_agotado", "tiempo_s": tiempo_limite}
+    except EOFError:
+        return {"fallo": "proceso terminado sin resultado"}
+    finally:
+        if proceso.is_alive():
+            proceso.kill()
+        proceso.join()
+        receptor.close()
+
+
+def medir(motor: str, caso: Dict, repeticiones: int = 3,
+          tiempo_limite: float = 30.0) -> Optional[Dict]:
+    """
+    Mide un motor sobre un caso del corpus.
+
+    Args:
+        motor: Nombre del motor (ver MOTORES)
+        caso: Entrada de CASOS
+        repeticiones: Repeticiones de los motores numéricos, tras una de
+                      calentamiento (se toma el mínimo)
+        tiempo_limite: Plazo de cada motor simbólico, en segundos
+
+    Returns:
+        Dict con tiempo, volumen, error alcanzado y evaluaciones, o None
+        si el motor no aplica al caso
+    """
+    if motor in MOTORES_SIMBOLICOS:
+        medicion = _medir_con_plazo(motor, caso, tiempo_limite)
+    else:
+        # Calentamiento: la primera llamada incluye la compilación de las expresiones
+        if _ejecutar_motor(motor, caso) is None:
+            return None
+        medicion = None
+        tiempos = []
+        for _ in range(max(1, repeticiones)):
+            inicio = time.perf_counter()
+            medicion = _ejecutar_motor(motor, caso)
+            tiempos.append(time.perf_counter() - inicio)
+        medicion["tiempo_s"] = min(tiempos)
+
+    if medicion is None:
+        return None
+    medicion.update({"caso": caso["nombre"], "categoria": caso["categoria"], "motor": motor})
+    if "volumen" in medicion:
+        error = abs(medicion["volumen"] - caso["exacto"])
+        medicion["error_alcanzado"] = error
+        medicion["error_relativo"] = error / abs(caso["exacto"])
+    return medicion
+
+
+def ejecutar(casos: Sequence[Dict], motores: Sequence[str] = MOTORES,
+             repeticiones: int = 3, tiempo_limite: float = 30.0,
+             al_medir: Optional[Callable] = None) -> Dict:
+    """
+    Ejecuta todos los motores sobre todos los casos.
+
+    Returns:
+        Dict con 'meta' (versiones, plataforma, fecha) y 'resultados'
+    """
+    import scipy
+    import sympy
+
+    resultados = []
+    for caso in casos:
+        for motor in motores:
+            medicion = medir(motor, caso, repeticiones, tiempo_limite)
+            if medicion is None:
+                continue
+            resultados.append(medicion)
+            if al_medir is not None:
+                al_medir(medicion)
+
+    return {
+        "meta": {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "plataforma": platform.platform(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+            "sympy": sympy.__version__,
+            "repeticiones": repeticiones,
+            "tiempo_limite": tiempo_limite,
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar_con_base(actual: Dict, base: Dict, umbral: float = 1.5,
+                      tiempo_minimo: float = 0.005) -> List[Dict]:
+    """
+    Compara dos ejecuciones y devuelve las regresiones encontradas.
+
+    Se marca regresión cuando el tiempo crece más de umbral veces (con un
+    piso de tiempo_minimo para no reaccionar al ruido de mediciones de
+    microsegundos), cuando crecen las evaluaciones, cuando el error
+    alcanzado empeora más de 10 veces o cuando un motor deja de resolver
+    un caso que antes resolvía. Los motores simbólicos se miden una sola
+    vez en un proceso nuevo, así que de ellos solo se comparan el fallo y
+    el error alcanzado, no el tiempo.
+
+    Args:
+        actual: Resultado de ejecutar()
+        base: Línea base guardada
+        umbral: Factor de tolerancia de tiempo y evaluaciones
+        tiempo_minimo: Piso de tiempo en segundos
+
+    Returns:
+        Lista de regresiones (vacía si no hay)
+    """
+    indice = {(m["caso"], m["motor"]): m for m in base["resultados"]}
+    regresiones = []
+
+    for medicion in actual["resultados"]:
+        previa = indice.get((medicion["caso"], medicion["motor"]))
+        if previa is None:
+            continue
+        clave = {"caso": medicion["caso"], "motor": medicion["motor"]}
+
+        if "fallo" in medicion and "fallo" not in previa:
+            regresiones.append({**clave, "tipo": "fallo", "detalle": medicion["fallo"]})
+            continue
+        if "fallo" in medicion or "fallo" in previa:
+            # Un caso que antes fallaba y ahora se resuelve no es regresión;
+            # además, los fallos de la base pueden no tener tiempo medido
+            continue
+
+        t_base = max(previa["tiempo_s"], tiempo_minimo)
+        if medicion["motor"] not in MOTORES_SIMBOLICOS and medicion["tiempo_s"] > umbral * t_base:
+            regresiones.append({**clave, "tipo": "tiempo",
+                                "base": previa["tiempo_s"], "actual": medicion["tiempo_s"]})
+
+        if "evaluaciones" in previa and medicion.get("evaluaciones", 0) > umbral * previa["evaluaciones"]:
+            regresiones.append({**clave, "tipo": "evaluaciones",
+                                "base": previa["evaluaciones"], "actual": medicion["evaluaciones"]})
+
+        if "error_alcanzado" in previa:
+            limite = max(10 * previa["error_alcanzado"], 1e-12)
+            if medicion["error_alcanzado"] > limite:
+                regresiones.append({**clave, "tipo": "precision",
+                                    "base": previa["error_alcanzado"],
+                                    "actual": medicion["error_alcanzado"]})
+    return regresiones
+
+
+def guardar(resultados: Dict, ruta: str):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+
+
+def cargar(ruta: str) -> Dict:
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
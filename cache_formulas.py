@@ -0,0 +1,276 @@
+"""
+Caché de Fórmulas LaTeX Renderizadas
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Cada reporte vuelve a dibujar las mismas fórmulas (V = ∬_R [f - g] dA, los
+títulos de las secciones...), y rasterizar con matplotlib es lo más lento
+del reporte. Las imágenes se guardan en dos niveles, indexadas por
+(latex, tamaño, dpi, colores): una caché LRU en memoria y un almacén de PNG
+en disco compartido entre procesos y ejecuciones.
+
+El modo vectorial convierte la fórmula en trazos (TextPath de matplotlib)
+y la dibuja como un Drawing de ReportLab, sin rasterizar.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import io
+import json
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from carga_perezosa import pyplot_perezoso
+from expresiones_compiladas import CacheLRU
+
+# matplotlib se importa al rasterizar la primera fórmula que no está en caché
+plt = pyplot_perezoso()
+
+
+DIRECTORIO_POR_DEFECTO = os.path.join(
+    os.path.expanduser("~"), ".cache", "ucsg_volumenes", "formulas"
+)
+
+MODOS = ("png", "vectorial")
+
+
+def _renderizar_png(latex: str, tamano: float, dpi: int, fondo: str, color: str) -> bytes:
+    """Rasteriza la fórmula con matplotlib (el camino lento)."""
+    fig = plt.figure(figsize=(8, 1.5))
+    fig.patch.set_facecolor(fondo)
+    ax = fig.add_subplot(111)
+    ax.axis('off')
+    ax.text(0.5, 0.5, f'${latex}$',
+            fontsize=tamano,
+            color=color,
+            ha='center',
+            va='center',
+            transform=ax.transAxes,
+            family='serif')
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight',
+                facecolor=fondo, edgecolor='none', pad_inches=0.2)
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def _trazos_vectoriales(latex: str, tamano: float) -> Dict:
+    """
+    Contornos de la fórmula como operaciones de trazado, en puntos.
+
+    Las curvas cuadráticas de las fuentes se elevan a cúbicas, que es lo
+    que admite ReportLab.
+    """
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.path import Path as RutaMatplotlib
+    from matplotlib.textpath import TextPath
+
+    ruta = TextPath((0, 0), f'${latex}$', size=tamano, prop=FontProperties(family='serif'))
+    operaciones: List = []
+    actual = (0.0, 0.0)
+    for vertices, codigo in ruta.iter_segments(curves=True, simplify=False):
+        if codigo == RutaMatplotlib.MOVETO:
+            actual = tuple(vertices[-2:])
+            operaciones.append(["m", *actual])
+        elif codigo == RutaMatplotlib.LINETO:
+            actual = tuple(vertices[-2:])
+            operaciones.append(["l", *actual])
+        elif codigo == RutaMatplotlib.CURVE3:
+            (cx, cy), fin = vertices[:2], tuple(vertices[2:4])
+            c1 = (actual[0] + 2 / 3 * (cx - actual[0]), actual[1] + 2 / 3 * (cy - actual[1]))
+            c2 = (fin[0] + 2 / 3 * (cx - fin[0]), fin[1] + 2 / 3 * (cy - fin[1]))
+            operaciones.append(["c", *c1, *c2, *fin])
+            actual = fin
+        elif codigo == RutaMatplotlib.CURVE4:
+            operaciones.append(["c", *map(float, vertices[:6])])
+            actual = tuple(vertices[4:6])
+        elif codigo == RutaMatplotlib.CLOSEPOLY:
+            operaciones.append(["z"])
+    extension = ruta.get_extents()
+    return {
+        "operaciones": [[o[0], *map(float, o[1:])] for o in operaciones],
+        "caja": [float(extension.x0), float(extension.y0),
+                 float(extension.x1), float(extension.y1)],
+    }
+
+
+@lru_cache(maxsize=1)
+def _version_matplotlib() -> str:
+    """Versión instalada de matplotlib, sin importarlo."""
+    return importlib.metadata.version("matplotlib")
+
+
+class CacheFormulas:
+    """
+    Caché de dos niveles (memoria LRU + disco) de fórmulas renderizadas.
+
+    Las estadísticas distinguen los aciertos en memoria, los aciertos en
+    disco y los renderizados completos.
+    """
+
+    def __init__(self, directorio: Optional[str] = DIRECTORIO_POR_DEFECTO,
+                 capacidad: int = 256):
+        """
+        Args:
+            directorio: Carpeta del almacén en disco; None lo desactiva
+            capacidad: Fórmulas guardadas en memoria
+        """
+        self.directorio = directorio
+        self._memoria = CacheLRU(capacidad)
+        self._lock = threading.Lock()
+        self.aciertos_disco = 0
+        self.renderizados = 0
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+
+    @staticmethod
+    def clave(modo: str, latex: str, tamano: float, dpi: int,
+              fondo: str, color: str) -> str:
+        """Hash de la fórmula y su presentación (incluye la versión de matplotlib)."""
+        partes = [modo, latex, repr(float(tamano)), str(dpi), fondo, color, _version_matplotlib()]
+        return hashlib.sha256("\x1f".join(partes).encode("utf-8")).hexdigest()
+
+    def _leer_disco(self, clave: str, extension: str) -> Optional[bytes]:
+        if self.directorio is None:
+            return None
+        try:
+            with open(os.path.join(self.directorio, clave + extension), "rb") as archivo:
+                return archivo.read()
+        except OSError:
+            return None
+
+    def _escribir_disco(self, clave: str, extension: str, datos: bytes):
+        if self.directorio is None:
+            return
+        ruta = os.path.join(self.directorio, clave + extension)
+        temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporal, "wb") as archivo:
+                archivo.write(datos)
+            # Reemplazo atómico: otros procesos nunca leen un archivo a medias
+            os.replace(temporal, ruta)
+        except OSError:
+            # Sin disco disponible la caché en memoria sigue funcionando
+            pass
+
+    def _obtener(self, clave: str, extension: str, generar) -> bytes:
+        datos = self._memoria.obtener(clave)
+        if datos is not None:
+            return datos
+        datos = self._leer_disco(clave, extension)
+        if datos is not None:
+            with self._lock:
+                self.aciertos_disco += 1
+        else:
+            datos = generar()
+            with self._lock:
+                self.renderizados += 1
+            self._escribir_disco(clave, extension, datos)
+        self._memoria.guardar(clave, datos)
+        return datos
+
+    def png(self, latex: str, tamano: float = 18, dpi: int = 150,
+            fondo: str = '#fdfdfd', color: str = 'black') -> bytes:
+        """
+        PNG de la fórmula (desde memoria, disco o renderizándola).
+
+        Args:
+            latex: Fórmula LaTeX (sin los $)
+            tamano: Tamaño de letra en puntos
+            dpi: Resolución de la imagen
+            fondo: Color de fondo
+            color: Color del texto
+
+        Returns:
+            Contenido del archivo PNG
+        """
+        clave = self.clave("png", latex, tamano, dpi, fondo, color)
+        return self._obtener(clave, ".png",
+                             lambda: _renderizar_png(latex, tamano, dpi, fondo, color))
+
+    def dibujo(self, latex: str, ancho: float, alto: float, tamano: float = 18,
+               fondo: str = '#fdfdfd', color: str = 'black') -> Drawing:
+        """
+        Fórmula como Drawing vectorial de ReportLab, centrada en ancho × alto.
+
+        Args:
+            latex: Fórmula LaTeX (sin los $)
+            ancho: Ancho del dibujo en puntos
+            alto: Alto del dibujo en puntos
+            tamano: Tamaño de letra en puntos (se reduce si no cabe)
+            fondo: Color de fondo
+            color: Color del texto
+
+        Returns:
+            Drawing (un objeto nuevo en cada llamada)
+        """
+        from reportlab.graphics.shapes import FILL_EVEN_ODD, Drawing, Group, Path, Rect
+        from reportlab.lib import colors
+
+        clave = self.clave("vectorial", latex, tamano, 0, fondo, color)
+        trazos = json.loads(self._obtener(
+            clave, ".json",
+            lambda: json.dumps(_trazos_vectoriales(latex, tamano)).encode("utf-8")
+        ))
+
+        x0, y0, x1, y1 = trazos["caja"]
+        escala = min(1.0, 0.95 * ancho / max(x1 - x0, 1e-9), 0.8 * alto / max(y1 - y0, 1e-9))
+        # Relleno par-impar: respeta los huecos de las letras (o, e, ∬...)
+        ruta = Path(fillColor=colors.toColor(color), strokeColor=None,
+                    fillMode=FILL_EVEN_ODD)
+        for operacion, *valores in trazos["operaciones"]:
+            if operacion == "m":
+                ruta.moveTo(*valores)
+            elif operacion == "l":
+                ruta.lineTo(*valores)
+            elif operacion == "c":
+                ruta.curveTo(*valores)
+            else:
+                ruta.closePath()
+
+        grupo = Group(ruta)
+        grupo.scale(escala, escala)
+        grupo.translate((ancho / escala - (x1 - x0)) / 2 - x0,
+                        (alto / escala - (y1 - y0)) / 2 - y0)
+
+        dibujo = Drawing(ancho, alto)
+        dibujo.add(Rect(0, 0, ancho, alto, fillColor=colors.toColor(fondo), strokeColor=None))
+        dibujo.add(grupo)
+        return dibujo
+
+    def estadisticas(self) -> Dict:
+        """Aciertos por nivel y tasa de aciertos total."""
+        consultas = self._memoria.aciertos + self._memoria.fallos
+        aciertos = self._memoria.aciertos + self.aciertos_disco
+        return {
+            "consultas": consultas,
+            "aciertos_memoria": self._memoria.aciertos,
+            "aciertos_disco": self.aciertos_disco,
+            "renderizados": self.renderizados,
+            "tasa_aciertos": aciertos / consultas if consultas else 0.0,
+            "entradas_memoria": len(self._memoria),
+        }
+
+    def limpiar(self, disco: bool = False):
+        """Vacía la caché en memoria (y, si se pide, el almacén en disco)."""
+        self._memoria.limpiar()
+        self.aciertos_disco = self.renderizados = 0
+        if disco and self.directorio is not None:
+            for nombre in os.listdir(self.directorio):
+                if nombre.endswith((".png", ".json")):
+                    os.remove(os.path.join(self.directorio, nombre))
+
+
+_CACHE_COMPARTIDA = None
+
+
+def cache_compartida() -> CacheFormulas:
+    """Caché única del proceso, con el almacén en el directorio por defecto."""
+    global _CACHE_COMPARTIDA
+    if _CACHE_COMPARTIDA is None:
+        _CACHE_COMPARTIDA = CacheFormulas()
+    return _CACHE_COMPARTIDA
@@ -0,0 +1,155 @@
+"""
+Caché Persistente de Resultados de Integración Simbólica
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+sp.integrate + sp.simplify cuesta segundos por sólido; los resultados exactos
+se guardan en SQLite, direccionados por el contenido del problema: el srepr
+del integrando normalizado y de los límites, más la versión de SymPy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+from carga_perezosa import modulo_perezoso
+
+sp = modulo_perezoso("sympy")
+
+
+RUTA_POR_DEFECTO = os.path.join(
+    os.path.expanduser("~"), ".cache", "ucsg_volumenes", "simbolico.sqlite"
+)
+
+
+class CacheSimbolico:
+    """
+    Caché en disco (SQLite) de resultados exactos con desalojo LRU.
+
+    El tamaño se acota por número de entradas y por bytes almacenados;
+    al superarse cualquiera de los dos se eliminan las entradas usadas
+    hace más tiempo.
+    """
+
+    def __init__(self, ruta: str = RUTA_POR_DEFECTO, max_entradas: int = 10000,
+                 max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            ruta: Archivo SQLite (se crea si no existe)
+            max_entradas: Número máximo de resultados guardados
+            max_bytes: Tamaño máximo de los resultados serializados
+        """
+        self.ruta = ruta
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self._lock = threading.Lock()
+
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        self._conexion = sqlite3.connect(ruta, timeout=30, check_same_thread=False)
+        with self._lock, self._conexion:
+            self._conexion.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                " clave TEXT PRIMARY KEY,"
+                " datos TEXT NOT NULL,"
+                " bytes INTEGER NOT NULL,"
+                " ultimo_acceso REAL NOT NULL)"
+            )
+            self._conexion.execute(
+                "CREATE INDEX IF NOT EXISTS idx_acceso ON resultados (ultimo_acceso)"
+            )
+
+    @staticmethod
+    def clave(tipo: str, integrando: sp.Expr, limites: Sequence) -> str:
+        """
+        Clave canónica de un problema de integración.
+
+        Args:
+            tipo: Sistema de coordenadas ('cartesiano', 'polar', ...)
+            integrando: Expresión SymPy del integrando
+            limites: Secuencia de límites (expresiones o números)
+
+        Returns:
+            Hash SHA-256 hexadecimal
+        """
+        partes = [tipo, sp.srepr(integrando)]
+        partes += [sp.srepr(sp.sympify(limite)) for limite in limites]
+        partes.append(f"sympy={sp.__version__}")
+        return hashlib.sha256("|".join(partes).encode("utf-8")).hexdigest()
+
+    def obtener(self, clave: str) -> Optional[Dict]:
+        """Devuelve el resultado guardado o None, actualizando los contadores."""
+        with self._lock, self._conexion:
+            fila = self._conexion.execute(
+                "SELECT datos FROM resultados WHERE clave = ?", (clave,)
+            ).fetchone()
+            if fila is None:
+                self.fallos += 1
+                return None
+            self._conexion.execute(
+                "UPDATE resultados SET ultimo_acceso = ? WHERE clave = ?",
+                (time.time(), clave)
+            )
+            self.aciertos += 1
+        return json.loads(fila[0])
+
+    def guardar(self, clave: str, resultado: Dict):
+        """Guarda un resultado (serializable a JSON) y aplica el desalojo."""
+        datos = json.dumps(resultado, ensure_ascii=False)
+        with self._lock, self._conexion:
+            self._conexion.execute(
+                "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?)",
+                (clave, datos, len(datos.encode("utf-8")), time.time())
+            )
+            self._desalojar()
+
+    def _desalojar(self):
+        entradas, total = self._conexion.execute(
+            "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM resultados"
+        ).fetchone()
+        if entradas <= self.max_entradas and total <= self.max_bytes:
+            return
+        filas = self._conexion.execute(
+            "SELECT clave, bytes FROM resultados ORDER BY ultimo_acceso"
+        )
+        eliminar = []
+        for clave, tamano in filas:
+            if entradas <= self.max_entradas and total <= self.max_bytes:
+                break
+            eliminar.append((clave,))
+            entradas -= 1
+            total -= tamano
+        self._conexion.executemany("DELETE FROM resultados WHERE clave = ?", eliminar)
+
+    def estadisticas(self) -> Dict:
+        """Entradas, bytes y tasa de aciertos de la caché."""
+        with self._lock:
+            entradas, total = self._conexion.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM resultados"
+            ).fetchone()
+        consultas = self.aciertos + self.fallos
+        return {
+            "ruta": self.ruta,
+            "entradas": entradas,
+            "bytes": total,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+        }
+
+    def limpiar(self):
+        """Elimina todas las entradas y reinicia los contadores."""
+        with self._lock, self._conexion:
+            self._conexion.execute("DELETE FROM resultados")
+        self.aciertos = self.fallos = 0
+
+    def cerrar(self):
+        self._conexion.close()
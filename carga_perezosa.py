@@ -0,0 +1,90 @@
+"""
+Importación Diferida de Dependencias Pesadas
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+SymPy, SciPy, matplotlib y ReportLab tardan de 0.2 a 1 s cada uno en
+importarse. Los módulos del proyecto los declaran con modulo_perezoso y el
+import real ocurre en el primer acceso a un atributo, de modo que un proceso
+que solo integra numéricamente nunca carga SymPy ni matplotlib:
+
+    sp = modulo_perezoso("sympy")
+    ...
+    sp.integrate(h, (x, 0, 1))   # aquí se importa sympy
+"""
+
+import importlib
+import sys
+import threading
+
+_CANDADO = threading.Lock()
+
+
+class ModuloPerezoso:
+    """Representante de un módulo que se importa en el primer acceso."""
+
+    def __init__(self, nombre: str, al_cargar=None):
+        self.__dict__["_nombre"] = nombre
+        self.__dict__["_al_cargar"] = al_cargar
+        self.__dict__["_modulo"] = None
+
+    def _cargar(self):
+        modulo = self.__dict__["_modulo"]
+        if modulo is None:
+            with _CANDADO:
+                modulo = self.__dict__["_modulo"]
+                if modulo is None:
+                    modulo = importlib.import_module(self.__dict__["_nombre"])
+                    if self.__dict__["_al_cargar"] is not None:
+                        self.__dict__["_al_cargar"](modulo)
+                    self.__dict__["_modulo"] = modulo
+        return modulo
+
+    def __getattr__(self, atributo: str):
+        valor = getattr(self._cargar(), atributo)
+        # Los accesos siguientes ya no pasan por __getattr__
+        self.__dict__[atributo] = valor
+        return valor
+
+    def __setattr__(self, atributo: str, valor):
+        setattr(self._cargar(), atributo, valor)
+
+    def __dir__(self):
+        return dir(self._cargar())
+
+    def __repr__(self):
+        estado = "cargado" if self.__dict__["_modulo"] is not None else "sin cargar"
+        return f"<módulo perezoso '{self.__dict__['_nombre']}' ({estado})>"
+
+
+def modulo_perezoso(nombre: str, al_cargar=None):
+    """
+    Devuelve el módulo si ya está importado; si no, un representante que lo
+    importa en el primer acceso a un atributo.
+
+    Args:
+        nombre: Nombre completo del módulo ("sympy", "scipy.integrate"...)
+        al_cargar: Función opcional que recibe el módulo recién importado
+                   (p. ej. para configurar el backend de matplotlib)
+
+    Returns:
+        Módulo o ModuloPerezoso
+    """
+    if nombre in sys.modules and al_cargar is None:
+        return sys.modules[nombre]
+    return ModuloPerezoso(nombre, al_cargar)
+
+
+def cargado(nombre: str) -> bool:
+    """Indica si el módulo ya se importó en este proceso."""
+    return nombre in sys.modules
+
+
+def _backend_agg(pyplot):
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def pyplot_perezoso():
+    """matplotlib.pyplot con el backend Agg (sin ventanas), importado en el primer uso."""
+    return ModuloPerezoso("matplotlib.pyplot", _backend_agg)
@@ -0,0 +1,748 @@
+"""
+Motores de Cuadratura Vectorizada para Integrales Dobles
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Evalúa la altura h(x,y) = f(x,y) - g(x,y) sobre arreglos completos de NumPy
+en lugar de hacerlo punto a punto como scipy.integrate.dblquad.
+"""
+
+import heapq
+import math
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from carga_perezosa import modulo_perezoso
+
+special = modulo_perezoso("scipy.special")
+
+# Nodos por dirección de las reglas producto: 2048² ≈ 4·10⁶ puntos por estimación
+ORDEN_MAXIMO = 2048
+
+
+# =====================================================================
+# Reglas de cuadratura 1D en [-1, 1]
+# =====================================================================
+
+@lru_cache(maxsize=64)
+def nodos_gauss_legendre(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nodos y pesos de Gauss-Legendre de orden n en [-1, 1].
+
+    Args:
+        n: Número de nodos
+
+    Returns:
+        Tupla (nodos, pesos) de solo lectura
+    """
+    t, w = special.roots_legendre(n)
+    t.setflags(write=False)
+    w.setflags(write=False)
+    return t, w
+
+
+@lru_cache(maxsize=64)
+def nodos_clenshaw_curtis(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nodos (extremos de Chebyshev) y pesos de Clenshaw-Curtis en [-1, 1].
+
+    Args:
+        n: Número de nodos (n >= 2)
+
+    Returns:
+        Tupla (nodos, pesos) de solo lectura
+    """
+    N = n - 1
+    theta = np.pi * np.arange(N + 1) / N
+    t = -np.cos(theta)
+    w = np.zeros(N + 1)
+    v = np.ones(N - 1)
+    interior = theta[1:-1]
+
+    if N % 2 == 0:
+        w[0] = w[N] = 1.0 / (N**2 - 1)
+        for k in range(1, N // 2):
+            v -= 2 * np.cos(2 * k * interior) / (4 * k**2 - 1)
+        v -= np.cos(N * interior) / (N**2 - 1)
+    else:
+        w[0] = w[N] = 1.0 / N**2
+        for k in range(1, (N - 1) // 2 + 1):
+            v -= 2 * np.cos(2 * k * interior) / (4 * k**2 - 1)
+
+    w[1:-1] = 2 * v / N
+    t.setflags(write=False)
+    w.setflags(write=False)
+    return t, w
+
+
+REGLAS_1D = {
+    "gauss_legendre": nodos_gauss_legendre,
+    "clenshaw_curtis": nodos_clenshaw_curtis,
+}
+
+
+# =====================================================================
+# Evaluación vectorizada
+# =====================================================================
+
+def evaluar_vectorizado(func: Callable, *args: np.ndarray) -> np.ndarray:
+    """
+    Evalúa func sobre arreglos completos con una sola llamada de Python.
+
+    Si la función no acepta arreglos (p. ej. usa math.sqrt), se recurre
+    a np.vectorize. Los puntos inválidos (excepción o no finitos) valen 0,
+    igual que el integrando de dblquad.
+
+    Args:
+        func: Función escalar o vectorizada
+        *args: Arreglos de coordenadas (con forma compatible)
+
+    Returns:
+        Arreglo con la forma de difusión de args
+    """
+    forma = np.broadcast(*args).shape
+    with np.errstate(all='ignore'):
+        try:
+            valores = np.asarray(func(*args), dtype=float)
+        except Exception:
+            def escalar(*punto):
+                try:
+                    return float(func(*punto))
+                except Exception:
+                    return 0.0
+            valores = np.vectorize(escalar, otypes=[float])(*args)
+    valores = np.broadcast_to(valores, forma)
+    return np.where(np.isfinite(valores), valores, 0.0)
+
+
+# =====================================================================
+# Sustituciones que suavizan los extremos del intervalo
+# =====================================================================
+
+# Semiancho del intervalo de t en tanh-sinh: en t = ±1 el extremo queda a ~1e-37
+_T_TANH_SINH = 4.0
+
+
+def _sustitucion_ninguna(t: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return (1.0 + t) / 2, (1.0 - t) / 2, np.full_like(t, 0.5)
+
+
+def _sustitucion_seno(t: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """u = (1 + sin(πt/2))/2: convierte sqrt(u) y sqrt(1-u) en funciones suaves de t."""
+    theta = np.pi * (1.0 + t) / 4
+    return np.sin(theta)**2, np.cos(theta)**2, (np.pi / 4) * np.sin(2 * theta)
+
+
+def _sustitucion_tanh_sinh(t: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """u = (1 + tanh(π/2·sinh(Tt)))/2 (doble exponencial): extremos singulares integrables."""
+    u = (np.pi / 2) * np.sinh(_T_TANH_SINH * t)
+    with np.errstate(over="ignore"):
+        desde_inicio = 1.0 / (1.0 + np.exp(-2 * u))
+        hasta_fin = 1.0 / (1.0 + np.exp(2 * u))
+    jacobiano = 2 * desde_inicio * hasta_fin * (np.pi / 2) * _T_TANH_SINH * np.cosh(_T_TANH_SINH * t)
+    return desde_inicio, hasta_fin, jacobiano
+
+
+# Cada sustitución lleva t ∈ [-1, 1] a la fracción u ∈ [0, 1] del intervalo y
+# devuelve (u, 1 - u, du/dt); 1 - u se calcula aparte para no perder cifras
+# junto al extremo superior
+SUSTITUCIONES = {
+    "ninguna": _sustitucion_ninguna,
+    "seno": _sustitucion_seno,
+    "tanh_sinh": _sustitucion_tanh_sinh,
+}
+
+
+def _mapear(inicio, fin, t: np.ndarray, sustitucion: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Punto del intervalo [inicio, fin] y jacobiano para el parámetro t."""
+    largo = fin - inicio
+    if sustitucion == "ninguna":
+        # Cambio afín: sin np.where ni jacobiano con la forma completa
+        return inicio + 0.5 * largo * (t + 1.0), 0.5 * largo
+    desde_inicio, hasta_fin, derivada = SUSTITUCIONES[sustitucion](t)
+    punto = np.where(desde_inicio <= hasta_fin, inicio + largo * desde_inicio,
+                     fin - largo * hasta_fin)
+    return punto, largo * derivada
+
+
+def transformar_region(f_sup_func: Callable, f_inf_func: Callable,
+                       x_lims: Tuple, y_lims_func: Tuple,
+                       transformacion: Tuple[str, str]) -> Tuple:
+    """
+    Reescribe la integral con sustituciones que suavizan los extremos.
+
+    Con límites como y = ±sqrt(4 - x²), el ancho del intervalo interno
+    tiene pendiente infinita en x = ±2 y las reglas pierden su orden de
+    convergencia; con x = 2·sin(θ) el integrando vuelve a ser suave.
+    'seno' trata singularidades de tipo raíz y 'tanh_sinh' (doble
+    exponencial) cualquier singularidad integrable en los extremos.
+
+    Args:
+        f_sup_func: Función superior f(x,y)
+        f_inf_func: Función inferior g(x,y)
+        x_lims: Tupla (x_min, x_max)
+        y_lims_func: Tupla (y_min_func(x), y_max_func(x))
+        transformacion: Sustitución en x y en y ('ninguna', 'seno' o 'tanh_sinh')
+
+    Returns:
+        Tupla (f_sup, f_inf, x_lims, y_lims_func) equivalente en las
+        variables (t, s), lista para cualquier motor; la nueva f_sup ya
+        incluye el jacobiano y la nueva f_inf es nula
+    """
+    for sustitucion in transformacion:
+        if sustitucion not in SUSTITUCIONES:
+            raise ValueError(
+                f"Transformación '{sustitucion}' no soportada: use {sorted(SUSTITUCIONES)}"
+            )
+    en_x, en_y = transformacion
+    a, b = float(x_lims[0]), float(x_lims[1])
+
+    def x_de(T):
+        return _mapear(a, b, np.asarray(T, dtype=float), en_x)
+
+    def altura(X, Y):
+        return evaluar_vectorizado(f_sup_func, X, Y) - evaluar_vectorizado(f_inf_func, X, Y)
+
+    if en_y == "ninguna":
+        # Solo cambia x: los límites de y se evalúan en x(t)
+        def f_sup(T, Y):
+            X, jacobiano_x = x_de(T)
+            return jacobiano_x * altura(X, Y)
+
+        y_lims_t = (lambda T: evaluar_vectorizado(y_lims_func[0], x_de(T)[0]),
+                    lambda T: evaluar_vectorizado(y_lims_func[1], x_de(T)[0]))
+    else:
+        # Ambas variables en [-1, 1]: y(t, s) recorre [y_min(x(t)), y_max(x(t))]
+        def f_sup(T, S):
+            X, jacobiano_x = x_de(T)
+            y_min = evaluar_vectorizado(y_lims_func[0], X)
+            y_max = evaluar_vectorizado(y_lims_func[1], X)
+            Y, jacobiano_y = _mapear(y_min, y_max, np.asarray(S, dtype=float), en_y)
+            return jacobiano_x * jacobiano_y * altura(X, Y)
+
+        y_lims_t = (lambda T: -1.0, lambda T: 1.0)
+
+    return f_sup, lambda T, S: 0.0, (-1.0, 1.0), y_lims_t
+
+
+def _suma_tensorial(h_func: Callable, x_lims: Tuple, y_lims_func: Tuple,
+                    regla: Callable, n_x: int, n_y: int) -> float:
+    """Aplica la regla producto n_x × n_y sobre la región de tipo I."""
+    tx, wx = regla(n_x)
+    ty, wy = regla(n_y)
+
+    a, b = float(x_lims[0]), float(x_lims[1])
+    medio_x = 0.5 * (b - a)
+    xs = a + medio_x * (tx + 1.0)
+
+    # Límites variables de y, evaluados una sola vez para todos los nodos x
+    y_min = evaluar_vectorizado(y_lims_func[0], xs)
+    y_max = evaluar_vectorizado(y_lims_func[1], xs)
+    medio_y = 0.5 * (y_max - y_min)
+
+    X = xs[:, None]
+    Y = y_min[:, None] + medio_y[:, None] * (ty[None, :] + 1.0)
+    H = h_func(X, Y)
+
+    interna = medio_y * (H @ wy)
+    return float(medio_x * (wx @ interna))
+
+
+def refinar_tensorial(f_sup_func: Callable, f_inf_func: Callable,
+                      x_lims: Tuple, y_lims_func: Tuple,
+                      regla: str = "gauss_legendre",
+                      epsabs: float = 1e-8, epsrel: float = 1e-8,
+                      orden_inicial: int = 16,
+                      orden_maximo: int = ORDEN_MAXIMO,
+                      tiempo_limite: Optional[float] = None,
+                      max_nodos: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Genera estimaciones sucesivas de la integral con reglas producto,
+    duplicando el orden en la dirección que más contribuye al error.
+
+    Una dirección cuyo error ya es menor que la cuarta parte de la
+    tolerancia deja de re-medirse, de modo que un integrando polinómico
+    en y solo refina la dirección x. Antes de evaluar cada candidato se
+    estima su costo (nodos y segundos, según lo ya medido) y se para si
+    excede el presupuesto, en lugar de descubrirlo después.
+
+    Args:
+        f_sup_func: Función superior f(x,y)
+        f_inf_func: Función inferior g(x,y)
+        x_lims: Tupla (x_min, x_max)
+        y_lims_func: Tupla (y_min_func(x), y_max_func(x))
+        regla: 'gauss_legendre' o 'clenshaw_curtis'
+        epsabs: Tolerancia absoluta
+        epsrel: Tolerancia relativa
+        orden_inicial: Nodos por dirección en la primera estimación
+        orden_maximo: Máximo de nodos por dirección
+        tiempo_limite: Segundos disponibles (None: sin límite)
+        max_nodos: Nodos evaluados disponibles (None: sin límite)
+
+    Yields:
+        Dict con 'volumen', 'error_estimado', 'nodos', 'evaluaciones',
+        'orden_x', 'orden_y', 'agotado' y 'presupuesto' ('tiempo' o
+        'nodos' si el siguiente candidato no cabía; None si no) tras
+        cada refinamiento
+    """
+    if regla not in REGLAS_1D:
+        raise ValueError(f"Regla '{regla}' no soportada: use {sorted(REGLAS_1D)}")
+    reglas = REGLAS_1D[regla]
+
+    estado = {"nodos": 0, "evaluaciones": 0}
+
+    def h_func(X, Y):
+        estado["evaluaciones"] += 2
+        estado["nodos"] += np.broadcast(X, Y).size
+        return evaluar_vectorizado(f_sup_func, X, Y) - evaluar_vectorizado(f_inf_func, X, Y)
+
+    def estimar(n_x, n_y):
+        return _suma_tensorial(h_func, x_lims, y_lims_func, reglas, n_x, n_y)
+
+    return _refinar_producto(estimar, estado, epsabs, epsrel, orden_inicial, orden_maximo,
+                             tiempo_limite, max_nodos)
+
+
+def _refinar_producto(estimar: Callable[[int, int], float], estado: Dict,
+                      epsabs: float, epsrel: float,
+                      orden_inicial: int, orden_maximo: int,
+                      tiempo_limite: Optional[float] = None,
+                      max_nodos: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Bucle de refinamiento anisótropo de las reglas producto.
+
+    Args:
+        estimar: Función (n_x, n_y) -> integral con la regla n_x × n_y
+        estado: Contadores que estimar actualiza ('nodos', 'evaluaciones'...);
+                se copian en cada estimación
+        tiempo_limite: Segundos disponibles desde la primera estimación
+        max_nodos: Nodos evaluados disponibles
+    """
+    inicio = time.perf_counter()
+    n_x = n_y = orden_inicial
+    actual = estimar(n_x, n_y)
+    puntos = n_x * n_y
+    error = {"x": np.inf, "y": np.inf}
+
+    def excede(m_x, m_y):
+        """Motivo por el que la regla m_x × m_y no cabe en el presupuesto."""
+        if max_nodos is not None and estado["nodos"] + m_x * m_y > max_nodos:
+            return "nodos"
+        if tiempo_limite is not None:
+            # Segundos por punto medidos en las estimaciones anteriores
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido + m_x * m_y * transcurrido / puntos > tiempo_limite:
+                return "tiempo"
+        return None
+
+    while True:
+        tolerancia = max(epsabs, epsrel * abs(actual))
+        candidatos = {}
+        presupuesto = None
+
+        # Duplicar cada dirección por separado para localizar el error
+        for direccion, (m_x, m_y) in (("x", (2 * n_x, n_y)), ("y", (n_x, 2 * n_y))):
+            if max(m_x, m_y) > orden_maximo or error[direccion] <= tolerancia / 4:
+                continue
+            presupuesto = excede(m_x, m_y)
+            if presupuesto is not None:
+                break
+            candidatos[direccion] = estimar(m_x, m_y)
+            puntos += m_x * m_y
+            error[direccion] = abs(candidatos[direccion] - actual)
+
+        if candidatos:
+            direccion = max(candidatos, key=lambda d: error[d])
+            actual = candidatos[direccion]
+            if direccion == "x":
+                n_x *= 2
+            else:
+                n_y *= 2
+
+        yield {
+            "volumen": actual,
+            "error_estimado": error["x"] + error["y"],
+            **estado,
+            "orden_x": n_x,
+            "orden_y": n_y,
+            "agotado": not candidatos,
+            "presupuesto": presupuesto,
+        }
+        if presupuesto is not None:
+            return
+
+
+def seguir_refinamiento(pasos: Iterator[Dict], epsabs: float, epsrel: float,
+                        tiempo_limite: Optional[float] = None,
+                        max_nodos: Optional[int] = None,
+                        al_progresar: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Consume las estimaciones de un generador refinar_* hasta alcanzar la
+    tolerancia o agotar el presupuesto de tiempo o de nodos.
+
+    Args:
+        pasos: Generador de estimaciones (refinar_tensorial, refinar_genz_malik...)
+        epsabs: Tolerancia absoluta
+        epsrel: Tolerancia relativa
+        tiempo_limite: Segundos disponibles (None: sin límite)
+        max_nodos: Nodos evaluados disponibles (None: sin límite)
+        al_progresar: Función llamada con cada estimación intermedia
+
+    Returns:
+        Última estimación, con 'convergio', 'error_relativo', 'tiempo_s' y
+        'motivo_parada' ('tolerancia', 'tiempo', 'nodos' o 'agotado')
+    """
+    inicio = time.perf_counter()
+    paso = None
+    for paso in pasos:
+        tolerancia = max(epsabs, epsrel * abs(paso["volumen"]))
+        paso["convergio"] = paso["error_estimado"] <= tolerancia
+        paso["error_relativo"] = paso["error_estimado"] / abs(paso["volumen"]) \
+            if paso["volumen"] else math.inf
+        paso["tiempo_s"] = time.perf_counter() - inicio
+        if paso["convergio"]:
+            paso["motivo_parada"] = "tolerancia"
+        elif tiempo_limite is not None and paso["tiempo_s"] >= tiempo_limite:
+            paso["motivo_parada"] = "tiempo"
+        elif max_nodos is not None and paso["nodos"] >= max_nodos:
+            paso["motivo_parada"] = "nodos"
+        elif paso.get("presupuesto"):
+            # El generador vio que el siguiente paso no cabía
+            paso["motivo_parada"] = paso["presupuesto"]
+        elif paso["agotado"]:
+            paso["motivo_parada"] = "agotado"
+        else:
+            paso["motivo_parada"] = None
+        if al_progresar is not None:
+            al_progresar(paso)
+        if paso["motivo_parada"] is not None:
+            break
+    if paso["motivo_parada"] is None:
+        # El generador terminó por su cuenta (p. ej. Genz-Malik al converger)
+        paso["motivo_parada"] = "agotado"
+    return paso
+
+
+def integrar_tensorial(f_sup_func: Callable, f_inf_func: Callable,
+                       x_lims: Tuple, y_lims_func: Tuple,
+                       regla: str = "gauss_legendre",
+                       epsabs: float = 1e-8, epsrel: float = 1e-8,
+                       orden_inicial: int = 16,
+                       orden_maximo: int = ORDEN_MAXIMO,
+                       tiempo_limite: Optional[float] = None,
+                       max_nodos: Optional[int] = None,
+                       al_progresar: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Integra h = f - g sobre una región de tipo I con reglas producto
+    vectorizadas, refinando hasta alcanzar la tolerancia o agotar el
+    presupuesto.
+
+    Args:
+        f_sup_func: Función superior f(x,y)
+        f_inf_func: Función inferior g(x,y)
+        x_lims: Tupla (x_min, x_max)
+        y_lims_func: Tupla (y_min_func(x), y_max_func(x))
+        regla: 'gauss_legendre' o 'clenshaw_curtis'
+        epsabs: Tolerancia absoluta
+        epsrel: Tolerancia relativa
+        orden_inicial: Nodos por dirección en la primera estimación
+        orden_maximo: Máximo de nodos por dirección
+        tiempo_limite: Segundos disponibles
+        max_nodos: Nodos evaluados disponibles
+        al_progresar: Función llamada con cada estimación intermedia
+
+    Returns:
+        Dict con volumen, error estimado, nodos, evaluaciones, convergencia
+        y motivo de parada (ver seguir_refinamiento)
+    """
+    pasos = refinar_tensorial(f_sup_func, f_inf_func, x_lims, y_lims_func,
+                              regla, epsabs, epsrel, orden_inicial, orden_maximo,
+                              tiempo_limite, max_nodos)
+    return seguir_refinamiento(pasos, epsabs, epsrel, tiempo_limite, max_nodos, al_progresar)
+
+
+# =====================================================================
+# Cubatura adaptativa 2D (Genz-Malik, grado 7 con regla embebida de grado 5)
+# =====================================================================
+
+def _regla_genz_malik() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Puntos generadores en [-1, 1]² y pesos (normalizados a suma 1)."""
+    l2 = np.sqrt(9 / 70)
+    l3 = np.sqrt(9 / 10)
+    l4 = np.sqrt(9 / 10)
+    l5 = np.sqrt(9 / 19)
+    n = 2
+    signos = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+    puntos = [(0.0, 0.0)]
+    puntos += [(l2, 0.0), (-l2, 0.0), (0.0, l2), (0.0, -l2)]
+    puntos += [(l3, 0.0), (-l3, 0.0), (0.0, l3), (0.0, -l3)]
+    puntos += [(l4 * sx, l4 * sy) for sx, sy in signos]
+    puntos += [(l5 * sx, l5 * sy) for sx, sy in signos]
+
+    w7 = np.array(
+        [(12824 - 9120 * n + 400 * n**2) / 19683]
+        + [980 / 6561] * 4
+        + [(1820 - 400 * n) / 19683] * 4
+        + [200 / 19683] * 4
+        + [6859 / 19683 / 2**n] * 4
+    )
+    w5 = np.array(
+        [(729 - 950 * n + 50 * n**2) / 729]
+        + [245 / 486] * 4
+        + [(265 - 100 * n) / 1458] * 4
+        + [25 / 729] * 4
+        + [0.0] * 4
+    )
+    return np.array(puntos), w7, w5
+
+
+_GM_PUNTOS, _GM_PESOS_7, _GM_PESOS_5 = _regla_genz_malik()
+_GM_RAZON = (9 / 70) / (9 / 10)   # (λ2 / λ3)², para las cuartas diferencias
+_GM_NODOS_DIVISION = 2 * len(_GM_PUNTOS)   # nodos de los dos hijos de una celda
+
+
+def refinar_genz_malik(f_sup_func: Callable, f_inf_func: Callable,
+                       x_lims: Tuple, y_lims_func: Tuple,
+                       epsabs: float = 1e-8, epsrel: float = 1e-8,
+                       divisiones_iniciales: int = 4,
+                       max_nodos: int = 2_000_000) -> Iterator[Dict]:
+    """
+    Cubatura adaptativa 2D con control de error por celda.
+
+    La región de tipo I se transforma al rectángulo (x, s) ∈ [a, b] × [0, 1]
+    con y = y_min(x) + s·(y_max(x) - y_min(x)). Las celdas se guardan en un
+    montículo ordenado por error; en cada ronda se dividen las de mayor error
+    (hasta que el error restante quepa en la tolerancia, o hasta agotar los
+    nodos que quedan del presupuesto) y todos los nodos de las celdas nuevas
+    se evalúan en un solo lote de NumPy.
+
+    Args:
+        f_sup_func: Función superior f(x,y)
+        f_inf_func: Función inferior g(x,y)
+        x_lims: Tupla (x_min, x_max)
+        y_lims_func: Tupla (y_min_func(x), y_max_func(x))
+        epsabs: Tolerancia absoluta
+        epsrel: Tolerancia relativa
+        divisiones_iniciales: Celdas iniciales a lo largo de x
+        max_nodos: Presupuesto máximo de nodos evaluados
+
+    Yields:
+        Dict con 'volumen', 'error_estimado', 'nodos', 'evaluaciones',
+        'agotado', 'presupuesto' ('nodos' si no cabe otra división) y
+        'arbol' (estadísticas de refinamiento) tras cada ronda
+    """
+    a, b = float(x_lims[0]), float(x_lims[1])
+    estado = {"nodos": 0, "evaluaciones": 0, "contador": 0,
+              "divididas": 0, "profundidad": 0}
+
+    def evaluar_celdas(centros: np.ndarray, semianchos: np.ndarray):
+        """Evalúa la regla en k celdas a la vez: devuelve (valor, error, eje)."""
+        P = centros[:, None, :] + semianchos[:, None, :] * _GM_PUNTOS[None, :, :]
+        X, S = P[..., 0], P[..., 1]
+
+        y_min = evaluar_vectorizado(y_lims_func[0], X)
+        y_max = evaluar_vectorizado(y_lims_func[1], X)
+        alto = y_max - y_min
+        Y = y_min + S * alto
+        F = (evaluar_vectorizado(f_sup_func, X, Y)
+             - evaluar_vectorizado(f_inf_func, X, Y)) * alto
+
+        estado["evaluaciones"] += 4
+        estado["nodos"] += F.size
+
+        volumen_celda = 4 * semianchos[:, 0] * semianchos[:, 1]
+        valor = volumen_celda * (F @ _GM_PESOS_7)
+        error = np.abs(valor - volumen_celda * (F @ _GM_PESOS_5))
+
+        # Cuartas diferencias para escoger el eje de división
+        f0 = 2 * F[:, 0]
+        dif_x = np.abs(F[:, 1] + F[:, 2] - f0 - _GM_RAZON * (F[:, 5] + F[:, 6] - f0))
+        dif_y = np.abs(F[:, 3] + F[:, 4] - f0 - _GM_RAZON * (F[:, 7] + F[:, 8] - f0))
+        eje = (dif_y > dif_x).astype(int)
+        return valor, error, eje
+
+    def insertar(monticulo, centros, semianchos, profundidades):
+        valor, error, eje = evaluar_celdas(centros, semianchos)
+        for k in range(len(valor)):
+            estado["contador"] += 1
+            heapq.heappush(monticulo, (
+                -error[k], estado["contador"], float(valor[k]),
+                centros[k], semianchos[k], int(eje[k]), int(profundidades[k])
+            ))
+        estado["profundidad"] = max(estado["profundidad"], int(profundidades.max()))
+
+    # Celdas iniciales: divisiones uniformes a lo largo de x
+    ancho = (b - a) / divisiones_iniciales
+    centros = np.column_stack([
+        a + ancho * (np.arange(divisiones_iniciales) + 0.5),
+        np.full(divisiones_iniciales, 0.5)
+    ])
+    semianchos = np.tile([ancho / 2, 0.5], (divisiones_iniciales, 1))
+    monticulo = []
+    insertar(monticulo, centros, semianchos, np.zeros(divisiones_iniciales, dtype=int))
+
+    while True:
+        volumen = math.fsum(celda[2] for celda in monticulo)
+        error_total = math.fsum(-celda[0] for celda in monticulo)
+        tolerancia = max(epsabs, epsrel * abs(volumen))
+        # Sin cupo para dividir ni una celda más
+        agotado = estado["nodos"] + _GM_NODOS_DIVISION > max_nodos
+
+        criticas = heapq.nsmallest(5, monticulo)
+        yield {
+            "volumen": volumen,
+            "error_estimado": error_total,
+            "nodos": estado["nodos"],
+            "evaluaciones": estado["evaluaciones"],
+            "agotado": agotado,
+            "presupuesto": "nodos" if agotado else None,
+            "arbol": {
+                "celdas": len(monticulo),
+                "celdas_divididas": estado["divididas"],
+                "profundidad_maxima": estado["profundidad"],
+                "nodos": estado["nodos"],
+                "regiones_criticas": [
+                    {
+                        "x": (float(c[3][0] - c[4][0]), float(c[3][0] + c[4][0])),
+                        "s": (float(c[3][1] - c[4][1]), float(c[3][1] + c[4][1])),
+                        "profundidad": c[6],
+                        "error": float(-c[0]),
+                    }
+                    for c in criticas
+                ],
+            },
+        }
+        if error_total <= tolerancia or agotado:
+            return
+
+        # Extraer las celdas de mayor error hasta que el resto quepa en la
+        # tolerancia, sin dividir más celdas de las que permite el presupuesto
+        cupo = (max_nodos - estado["nodos"]) // _GM_NODOS_DIVISION
+        extraidas = []
+        restante = error_total
+        while monticulo and restante > tolerancia and len(extraidas) < cupo:
+            celda = heapq.heappop(monticulo)
+            restante += celda[0]
+            extraidas.append(celda)
+
+        hijos_c, hijos_h, hijos_p = [], [], []
+        for _, _, _, centro, semiancho, eje, profundidad in extraidas:
+            mitad = semiancho.copy()
+            mitad[eje] /= 2
+            desplazamiento = np.zeros(2)
+            desplazamiento[eje] = mitad[eje]
+            hijos_c += [centro - desplazamiento, centro + desplazamiento]
+            hijos_h += [mitad, mitad]
+            hijos_p += [profundidad + 1, profundidad + 1]
+        estado["divididas"] += len(extraidas)
+
+        insertar(monticulo, np.array(hijos_c), np.array(hijos_h), np.array(hijos_p))
+
+
+def integrar_genz_malik(f_sup_func: Callable, f_inf_func: Callable,
+                        x_lims: Tuple, y_lims_func: Tuple,
+                        epsabs: float = 1e-8, epsrel: float = 1e-8,
+                        divisiones_iniciales: int = 4,
+                        max_nodos: int = 2_000_000,
+                        tiempo_limite: Optional[float] = None,
+                        al_progresar: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Integra h = f - g sobre una región de tipo I con cubatura adaptativa
+    Genz-Malik vectorizada.
+
+    Args:
+        f_sup_func: Función superior f(x,y)
+        f_inf_func: Función inferior g(x,y)
+        x_lims: Tupla (x_min, x_max)
+        y_lims_func: Tupla (y_min_func(x), y_max_func(x))
+        epsabs: Tolerancia absoluta
+        epsrel: Tolerancia relativa
+        divisiones_iniciales: Celdas iniciales a lo largo de x
+        max_nodos: Presupuesto máximo de nodos evaluados
+        tiempo_limite: Segundos disponibles
+        al_progresar: Función llamada con cada estimación intermedia
+
+    Returns:
+        Dict con volumen, error estimado, nodos, evaluaciones, convergencia,
+        motivo de parada y estadísticas del árbol de refinamiento
+    """
+    pasos = refinar_genz_malik(f_sup_func, f_inf_func, x_lims, y_lims_func,
+                               epsabs, epsrel, divisiones_iniciales, max_nodos)
+    return seguir_refinamiento(pasos, epsabs, epsrel, tiempo_limite, max_nodos, al_progresar)
+
+
+# =====================================================================
+# Lotes paramétricos: una cuadratura difundida sobre un eje de parámetros
+# =====================================================================
+
+def integrar_lote_parametrico(f_sup_func: Callable, f_inf_func: Callable,
+                              x_lims_func: Tuple, y_lims_func: Tuple,
+                              parametros: Tuple[np.ndarray, ...],
+                              regla: str = "gauss_legendre",
+                              orden: int = 64,
+                              max_puntos: int = 4_000_000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integra h = f - g para muchos juegos de parámetros a la vez.
+
+    Las funciones reciben los parámetros como argumentos adicionales:
+    f(x, y, *p), y_lim(x, *p) y x_lim(*p). Los nodos de la regla producto
+    se difunden sobre un eje de parámetros (forma P × n × n) y el lote se
+    procesa por bloques para acotar la memoria. El error se estima
+    comparando los órdenes n/2 y n.
+
+    Args:
+        f_sup_func: Función superior f(x, y, *p)
+        f_inf_func: Función inferior g(x, y, *p)
+        x_lims_func: Tupla (x_min(*p), x_max(*p))
+        y_lims_func: Tupla (y_min(x, *p), y_max(x, *p))
+        parametros: Arreglos 1D de igual longitud, uno por parámetro
+        regla: 'gauss_legendre' o 'clenshaw_curtis'
+        orden: Nodos por dirección de la regla fina
+        max_puntos: Máximo de nodos evaluados por bloque
+
+    Returns:
+        Tupla (volumenes, errores) con un valor por juego de parámetros
+    """
+    if regla not in REGLAS_1D:
+        raise ValueError(f"Regla '{regla}' no soportada: use {sorted(REGLAS_1D)}")
+    if not parametros:
+        raise ValueError("Se requiere al menos un parámetro; use calcular_numerico")
+    reglas = REGLAS_1D[regla]
+    total = len(parametros[0])
+
+    def estimar(p, n):
+        t, w = reglas(n)
+        a = evaluar_vectorizado(x_lims_func[0], *p)[:, None]
+        b = evaluar_vectorizado(x_lims_func[1], *p)[:, None]
+        medio_x = 0.5 * (b - a)
+        xs = a + medio_x * (t[None, :] + 1.0)                  # (P, n)
+
+        p_x = [v[:, None] for v in p]
+        y_min = evaluar_vectorizado(y_lims_func[0], xs, *p_x)
+        y_max = evaluar_vectorizado(y_lims_func[1], xs, *p_x)
+        medio_y = 0.5 * (y_max - y_min)
+
+        X = xs[..., None]                                       # (P, n, 1)
+        Y = y_min[..., None] + medio_y[..., None] * (t + 1.0)   # (P, n, n)
+        p_xy = [v[:, None, None] for v in p]
+        H = (evaluar_vectorizado(f_sup_func, X, Y, *p_xy)
+             - evaluar_vectorizado(f_inf_func, X, Y, *p_xy))
+
+        interna = medio_y * (H @ w)                             # (P, n)
+        return medio_x[:, 0] * (interna @ w)
+
+    volumenes = np.empty(total)
+    errores = np.empty(total)
+    bloque = max(1, max_puntos // (orden * orden))
+    for inicio in range(0, total, bloque):
+        fin = min(inicio + bloque, total)
+        p = tuple(np.asarray(v[inicio:fin], dtype=float) for v in parametros)
+        fino = estimar(p, orden)
+        grueso = estimar(p, orden // 2)
+        volumenes[inicio:fin] = fino
+        errores[inicio:fin] = np.abs(fino - grueso)
+    return volumenes, errores
@@ -0,0 +1,76 @@
+"""
+Ejecución Paralela del Catálogo de Sólidos
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Reparte los sólidos (y, por separado, las mitades numérica y simbólica de
+cada uno) entre los procesos de un ProcessPoolExecutor. Las tareas reciben
+EspecificacionSolido, que viaja por pickle sin lambdas.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from especificacion_solidos import EspecificacionSolido
+
+
+_BIBLIOTECA = None
+
+
+def _biblioteca():
+    """Una BibliotecaSolidos por proceso (sus cachés se reutilizan entre tareas)."""
+    global _BIBLIOTECA
+    if _BIBLIOTECA is None:
+        from analizador_matematico import BibliotecaSolidos
+        _BIBLIOTECA = BibliotecaSolidos()
+    return _BIBLIOTECA
+
+
+def tarea_numerica(espec: EspecificacionSolido) -> Dict:
+    """Mitad numérica del análisis de un sólido."""
+    return _biblioteca().analizar_numerico(espec)
+
+
+def tarea_exacta(espec: EspecificacionSolido) -> Dict:
+    """Mitad simbólica del análisis de un sólido."""
+    return _biblioteca().analizar_exacto(espec)
+
+
+def tarea_completa(espec: EspecificacionSolido) -> Dict:
+    """Análisis completo de un sólido en un solo proceso."""
+    return _biblioteca().analizar(espec)
+
+
+def ejecutar_catalogo(especificaciones: Sequence[EspecificacionSolido],
+                      max_workers: Optional[int] = None,
+                      separar_mitades: bool = True) -> List[Dict]:
+    """
+    Analiza un catálogo de sólidos en paralelo.
+
+    Args:
+        especificaciones: Sólidos a analizar
+        max_workers: Procesos del pool (por defecto, núcleos disponibles)
+        separar_mitades: Enviar la parte numérica y la simbólica de cada
+                         sólido como tareas independientes
+
+    Returns:
+        Lista de análisis completos en el mismo orden que especificaciones
+    """
+    especificaciones = list(especificaciones)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        if not separar_mitades:
+            return list(pool.map(tarea_completa, especificaciones))
+
+        # Primero las simbólicas (más lentas) para equilibrar la carga
+        exactos = [pool.submit(tarea_exacta, e) for e in especificaciones]
+        numericos = [pool.submit(tarea_numerica, e) for e in especificaciones]
+
+        biblioteca = _biblioteca()
+        return [
+            biblioteca.combinar(espec, numerico.result(), exacto.result())
+            for espec, numerico, exacto in zip(especificaciones, numericos, exactos)
+        ]
@@ -0,0 +1,189 @@
+"""
+Especificación Serializable de Sólidos y Registro
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Un sólido se describe solo con datos (cadenas y tuplas), sin lambdas, de
+modo que la especificación se puede enviar a otros procesos (pickle) y
+usar como clave de caché. El registro carga especificaciones desde JSON o
+TOML: agregar un sólido no requiere cambios de código.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# tipo_I: x_lims y y_lims; disco: además se integra en polares; anillo:
+# r_lims (radios interno y externo), con x_lims/y_lims solo como caja
+TIPOS_REGION = ("tipo_I", "disco", "anillo")
+
+RUTA_PREDEFINIDOS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "solidos_predefinidos.json")
+
+
+@dataclass(frozen=True)
+class EspecificacionSolido:
+    """
+    Sólido entre dos superficies sobre una región de tipo I.
+
+    Las superficies y los límites son expresiones SymPy en texto; la forma
+    polar (altura h(r) y límites de r) es opcional, salvo en un anillo
+    (tipo_region='anillo'), que se describe con r_lims. Los campos latex_*
+    solo ajustan la presentación en el reporte PDF.
+    """
+    nombre: str
+    superficie_superior: str
+    superficie_inferior: str
+    x_lims: Tuple[str, str]
+    y_lims: Tuple[str, str]
+    descripcion: str = ""
+    clave: Optional[str] = None
+    tipo_region: str = "tipo_I"
+    altura_polar: Optional[str] = None
+    r_lims: Optional[Tuple[str, str]] = None
+    metodo_numerico: str = "dblquad"
+    metodo_optimo: str = "Integración directa en coordenadas cartesianas"
+    latex_superior: Optional[str] = None
+    latex_inferior: Optional[str] = None
+    latex_y_lims: Optional[Tuple[str, str]] = None
+
+    def __post_init__(self):
+        # Normalizar a tuplas de strings para que el objeto sea hashable
+        for campo in ("x_lims", "y_lims", "r_lims", "latex_y_lims"):
+            valor = getattr(self, campo)
+            if valor is not None:
+                object.__setattr__(self, campo, tuple(str(v) for v in valor))
+        if self.tipo_region not in TIPOS_REGION:
+            raise ValueError(
+                f"Tipo de región '{self.tipo_region}' no soportado: use {TIPOS_REGION}"
+            )
+        if self.tipo_region == "anillo" and self.r_lims is None:
+            raise ValueError(f"'{self.nombre}': un anillo necesita r_lims (radio interno y externo)")
+
+    @property
+    def x_lims_numericos(self) -> Tuple[float, float]:
+        """Límites de x evaluados a float (p. ej. "-2" → -2.0, "pi" → 3.14...)."""
+        from expresiones_compiladas import compilar_expresion
+        return tuple(float(compilar_expresion(v, ()).expr) for v in self.x_lims)
+
+    def latex(self) -> Dict[str, str]:
+        """
+        Fórmulas LaTeX para el reporte: usa los campos latex_* si existen
+        y, si no, las genera con SymPy desde las expresiones.
+        """
+        from expresiones_compiladas import compilar_expresion
+
+        def a_latex(texto, variables=("x", "y")):
+            return compilar_expresion(texto, variables).latex
+
+        y_lims = self.latex_y_lims or tuple(a_latex(v, ("x",)) for v in self.y_lims)
+        return {
+            "superior": self.latex_superior or a_latex(self.superficie_superior),
+            "inferior": self.latex_inferior or a_latex(self.superficie_inferior),
+            "x_min": a_latex(self.x_lims[0], ()),
+            "x_max": a_latex(self.x_lims[1], ()),
+            "y_min": y_lims[0],
+            "y_max": y_lims[1],
+        }
+
+    @classmethod
+    def desde_dict(cls, datos: Dict) -> "EspecificacionSolido":
+        """Crea la especificación desde un dict (p. ej. una entrada JSON/TOML)."""
+        validos = {f.name for f in fields(cls)}
+        desconocidos = set(datos) - validos
+        if desconocidos:
+            raise ValueError(f"Campos desconocidos en la especificación: {sorted(desconocidos)}")
+        return cls(**datos)
+
+    def a_dict(self) -> Dict:
+        """Dict serializable a JSON (omite los campos vacíos)."""
+        return {k: (list(v) if isinstance(v, tuple) else v)
+                for k, v in asdict(self).items() if v is not None}
+
+
+class RegistroSolidos:
+    """Registro de sólidos por nombre o clave (sin distinguir mayúsculas)."""
+
+    def __init__(self, especificaciones=()):
+        self._solidos: Dict[str, EspecificacionSolido] = {}
+        for espec in especificaciones:
+            self.registrar(espec)
+
+    @staticmethod
+    def _normalizar(nombre: str) -> str:
+        return nombre.strip().lower()
+
+    def registrar(self, espec: EspecificacionSolido):
+        """Agrega (o reemplaza) un sólido en el registro."""
+        self._solidos[self._normalizar(espec.nombre)] = espec
+
+    def obtener(self, nombre: str) -> EspecificacionSolido:
+        """
+        Busca un sólido por nombre o por clave.
+
+        Raises:
+            ValueError: Si el sólido no está registrado
+        """
+        buscado = self._normalizar(nombre)
+        if buscado in self._solidos:
+            return self._solidos[buscado]
+        for espec in self._solidos.values():
+            if espec.clave is not None and self._normalizar(espec.clave) == buscado:
+                return espec
+        raise ValueError(f"Sólido '{nombre}' no implementado")
+
+    def nombres(self) -> List[str]:
+        return [espec.nombre for espec in self._solidos.values()]
+
+    def __iter__(self) -> Iterator[EspecificacionSolido]:
+        return iter(list(self._solidos.values()))
+
+    def __len__(self):
+        return len(self._solidos)
+
+    def __contains__(self, nombre: str):
+        try:
+            self.obtener(nombre)
+            return True
+        except ValueError:
+            return False
+
+    def cargar_datos(self, datos: Dict):
+        """Registra las entradas de {"solidos": [...]}."""
+        for entrada in datos.get("solidos", []):
+            self.registrar(EspecificacionSolido.desde_dict(entrada))
+
+    def cargar_json(self, ruta: str):
+        """Registra los sólidos de un archivo JSON."""
+        with open(ruta, encoding="utf-8") as archivo:
+            self.cargar_datos(json.load(archivo))
+
+    def cargar_toml(self, ruta: str):
+        """Registra los sólidos de un archivo TOML ([[solidos]] por sólido)."""
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open(ruta, "rb") as archivo:
+            self.cargar_datos(tomllib.load(archivo))
+
+    def guardar_json(self, ruta: str):
+        """Escribe el registro en JSON."""
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"solidos": [e.a_dict() for e in self]}, archivo,
+                      ensure_ascii=False, indent=2)
+
+
+_REGISTRO_PREDEFINIDO = None
+
+
+def registro_predefinido() -> RegistroSolidos:
+    """Registro con los sólidos de solidos_predefinidos.json (se carga una vez)."""
+    global _REGISTRO_PREDEFINIDO
+    if _REGISTRO_PREDEFINIDO is None:
+        registro = RegistroSolidos()
+        registro.cargar_json(RUTA_PREDEFINIDOS)
+        _REGISTRO_PREDEFINIDO = registro
+    return _REGISTRO_PREDEFINIDO
@@ -0,0 +1,204 @@
+"""
+Compilación de Expresiones SymPy a Núcleos NumPy Vectorizados
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Una misma cadena ("8 - x**2 - y**2") alimenta el cálculo simbólico, el
+numérico, las gráficas y el reporte PDF. Cada expresión se interpreta una
+sola vez y se compila a código NumPy (con eliminación de subexpresiones
+comunes) al primer uso numérico; los objetos compilados se guardan en una
+caché LRU indexada por el texto de la expresión. Esa caché, CacheLRU, es
+la que usan también el servidor, las fórmulas, las regiones y el PDF.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import numpy as np
+
+from carga_perezosa import modulo_perezoso
+from instrumentacion import tramo
+
+sp = modulo_perezoso("sympy")
+
+# numexpr es opcional; se importa solo si una expresión lo pide
+NUMEXPR_DISPONIBLE = importlib.util.find_spec("numexpr") is not None
+
+
+def simbolo(nombre: str) -> sp.Symbol:
+    """Símbolo real compartido con AnalizadorMatematico."""
+    return sp.Symbol(nombre, real=True)
+
+
+class ExpresionCompilada:
+    """
+    Expresión SymPy interpretada una vez y compilada a NumPy bajo demanda.
+
+    El objeto es invocable: expr(x, y) evalúa sobre escalares o arreglos
+    con difusión (broadcasting) de NumPy.
+    """
+
+    def __init__(self, texto: str, variables: Tuple[str, ...] = ("x", "y"),
+                 usar_numexpr: bool = False):
+        """
+        Args:
+            texto: Expresión en sintaxis SymPy
+            variables: Nombres de las variables, en el orden de llamada
+            usar_numexpr: Compilar con numexpr si está instalado
+        """
+        self.texto = texto
+        self.variables = tuple(variables)
+        self.simbolos = tuple(simbolo(v) for v in self.variables)
+        self.usar_numexpr = usar_numexpr and NUMEXPR_DISPONIBLE
+
+        locales = {nombre: s for nombre, s in zip(self.variables, self.simbolos)}
+        self.expr = sp.sympify(texto, locals=locales)
+        self.texto_canonico = sp.srepr(self.expr)
+
+        self._funcion = None
+        self._lock = threading.Lock()
+
+    @property
+    def funcion(self):
+        """Núcleo NumPy generado con lambdify (se compila al primer uso)."""
+        if self._funcion is None:
+            with self._lock:
+                if self._funcion is None:
+                    self._funcion = self._compilar()
+        return self._funcion
+
+    def _compilar(self):
+        if self.usar_numexpr:
+            try:
+                return sp.lambdify(self.simbolos, self.expr, modules="numexpr")
+            except Exception:
+                pass
+        return sp.lambdify(self.simbolos, self.expr, modules="numpy", cse=True)
+
+    @property
+    def latex(self) -> str:
+        return sp.latex(self.expr)
+
+    def __call__(self, *args):
+        if all(isinstance(a, (float, int)) for a in args):
+            # Camino escalar (p. ej. dblquad): sin coste de difusión
+            return float(self.funcion(*args))
+        valores = np.asarray(self.funcion(*args), dtype=float)
+        forma = np.broadcast(*args).shape
+        if not forma:
+            return float(valores)
+        return np.broadcast_to(valores, forma)
+
+    def __reduce__(self):
+        # Al enviarse a otro proceso se vuelve a compilar desde el texto
+        return (compilar_expresion, (self.texto, self.variables, self.usar_numexpr))
+
+    def __repr__(self):
+        return f"ExpresionCompilada({self.texto!r}, variables={self.variables})"
+
+
+class CacheLRU:
+    """Caché LRU segura entre hilos con contadores de aciertos y fallos."""
+
+    def __init__(self, capacidad: int):
+        self.capacidad = capacidad
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        with self._lock:
+            if clave in self._datos:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return self._datos[clave]
+            self.fallos += 1
+            return None
+
+    def guardar(self, clave, valor):
+        with self._lock:
+            self._datos[clave] = valor
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self.aciertos = self.fallos = 0
+
+    def __len__(self):
+        return len(self._datos)
+
+
+_CACHE_TEXTO = CacheLRU(256)
+_CACHE_CANONICA = CacheLRU(256)
+
+
+def compilar_expresion(texto, variables: Tuple[str, ...] = ("x", "y"),
+                       usar_numexpr: bool = False) -> ExpresionCompilada:
+    """
+    Devuelve la expresión compilada para texto, reutilizando la caché.
+
+    Primero se busca el texto normalizado (sin espacios), lo que evita
+    interpretar de nuevo la cadena; si no está, se interpreta y se busca
+    por su forma canónica, de modo que "x**2+y**2" y "y**2 + x**2"
+    comparten el mismo núcleo.
+
+    Args:
+        texto: Expresión en sintaxis SymPy (o una ExpresionCompilada)
+        variables: Nombres de las variables, en el orden de llamada
+        usar_numexpr: Compilar con numexpr si está instalado
+
+    Returns:
+        ExpresionCompilada
+    """
+    if isinstance(texto, ExpresionCompilada):
+        return texto
+
+    variables = tuple(variables)
+    clave_texto = ("".join(str(texto).split()), variables, usar_numexpr)
+    compilada = _CACHE_TEXTO.obtener(clave_texto)
+    if compilada is not None:
+        return compilada
+
+    with tramo("interpretar"):
+        candidata = ExpresionCompilada(str(texto), variables, usar_numexpr)
+    clave_canonica = (candidata.texto_canonico, variables, usar_numexpr)
+    compilada = _CACHE_CANONICA.obtener(clave_canonica)
+    if compilada is None:
+        compilada = candidata
+        _CACHE_CANONICA.guardar(clave_canonica, compilada)
+
+    _CACHE_TEXTO.guardar(clave_texto, compilada)
+    return compilada
+
+
+def como_funcion(func, variables: Tuple[str, ...] = ("x", "y")):
+    """Convierte cadenas y constantes en ExpresionCompilada; deja pasar los invocables."""
+    if isinstance(func, (str, int, float)):
+        return compilar_expresion(str(func), variables)
+    return func
+
+
+def estadisticas_cache() -> Dict:
+    """Tamaño y tasa de aciertos de las cachés de expresiones."""
+    consultas = _CACHE_TEXTO.aciertos + _CACHE_TEXTO.fallos
+    return {
+        "entradas": len(_CACHE_CANONICA),
+        "aciertos": _CACHE_TEXTO.aciertos,
+        "fallos": _CACHE_TEXTO.fallos,
+        "tasa_aciertos": _CACHE_TEXTO.aciertos / consultas if consultas else 0.0,
+        "numexpr_disponible": NUMEXPR_DISPONIBLE,
+    }
+
+
+def limpiar_cache():
+    """Vacía las cachés de expresiones compiladas."""
+    _CACHE_TEXTO.limpiar()
+    _CACHE_CANONICA.limpiar()
@@ -0,0 +1,231 @@
+"""
+Fórmulas Cerradas para Familias de Sólidos Conocidas
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Reconoce estructuralmente (sin sp.integrate ni sp.simplify) los sólidos que
+se consultan con más frecuencia y devuelve su volumen exacto:
+
+- Alturas radiales sobre discos, sectores y anillos centrados en el origen,
+  suma de términos c·ρᵖ y c·sqrt(S² - ρ²): paraboloides (πa²/(4k) para
+  a - k(x²+y²) frente a k(x²+y²)), esferas, conos y sus combinaciones.
+- Sólido de Steinmetz de dos cilindros en cartesianas (16r³/3) y, como
+  región 3D por desigualdades, dos o tres cilindros ortogonales
+  (16r³/3, 8(2-√2)r³) y la esfera.
+
+Los reconocimientos se memorizan por texto, de modo que las consultas
+repetidas cuestan microsegundos.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import sympy as sp
+
+from expresiones_compiladas import compilar_expresion, simbolo
+from transformacion_coordenadas import detectar_region_polar
+
+
+_RHO = sp.Symbol("rho", positive=True)
+
+
+def _forma_cerrada(volumen: sp.Expr, familia: str) -> Tuple[str, str, float, str]:
+    """Valor listo para el resultado: (LaTeX, texto SymPy, float, familia)."""
+    return sp.latex(volumen), str(volumen), float(volumen), familia
+
+
+def _primitiva_radial(h_rho: sp.Expr) -> Optional[Tuple[sp.Expr, str]]:
+    """
+    Primitiva G(ρ) de h(ρ)·ρ para alturas formadas por términos c·ρᵖ y
+    c·sqrt(S² - ρ²), junto con la familia reconocida.
+    """
+    primitiva = sp.Integer(0)
+    familias = []
+    for termino in sp.Add.make_args(sp.expand(h_rho)):
+        coeficiente, resto = termino.as_independent(_RHO, as_Add=False)
+        if resto == 1:
+            primitiva += coeficiente * _RHO**2 / 2
+            familias.append("cilindro")
+            continue
+        base, exponente = resto.as_base_exp()
+        if base == _RHO and exponente.is_Rational and exponente > -2:
+            primitiva += coeficiente * _RHO**(exponente + 2) / (exponente + 2)
+            familias.append({1: "cono", 2: "paraboloide"}.get(exponente, "radial"))
+            continue
+        if exponente == sp.Rational(1, 2):
+            try:
+                cuadratica = sp.Poly(base, _RHO)
+            except sp.PolynomialError:
+                return None
+            if cuadratica.degree() != 2 or cuadratica.LC() != -1 \
+                    or cuadratica.coeff_monomial(_RHO) != 0:
+                return None
+            s2 = cuadratica.coeff_monomial(1)
+            primitiva += -coeficiente * (s2 - _RHO**2)**sp.Rational(3, 2) / 3
+            familias.append("esfera")
+            continue
+        return None
+
+    # El término constante solo da nombre a la familia si está solo
+    nombres = [f for f in dict.fromkeys(familias) if f != "cilindro"] or ["cilindro"]
+    return primitiva, " + ".join(nombres).replace("paraboloide", "paraboloides")
+
+
+def _volumen_radial(h_rho: sp.Expr, r_min: sp.Expr, r_max: sp.Expr,
+                    apertura: sp.Expr) -> Optional[Tuple[sp.Expr, str]]:
+    """Volumen Δθ·[G(r_max) - G(r_min)] de una altura radial."""
+    reconocida = _primitiva_radial(h_rho)
+    if reconocida is None:
+        return None
+    primitiva, familia = reconocida
+    # Las raíces deben ser reales en todo el intervalo de r
+    for raiz in primitiva.atoms(sp.Pow):
+        if raiz.exp == sp.Rational(3, 2) and \
+                not raiz.base.subs(_RHO, r_max).is_nonnegative:
+            return None
+    if r_min == 0 and any(p.exp.is_negative for p in primitiva.atoms(sp.Pow)
+                          if p.base == _RHO):
+        return None
+    volumen = apertura * (primitiva.subs(_RHO, r_max) - primitiva.subs(_RHO, r_min))
+    volumen = sp.expand(volumen)
+    factorizado = sp.factor(volumen)
+    return (volumen if factorizado.could_extract_minus_sign() else factorizado), familia
+
+
+def _raiz_cuadrada_de(termino: sp.Expr, variable: sp.Symbol, radio: sp.Expr) -> Optional[sp.Expr]:
+    """Si termino = α·sqrt(radio² - variable²), devuelve α."""
+    coeficiente, resto = termino.as_independent(variable, as_Add=False)
+    base, exponente = resto.as_base_exp()
+    if exponente == sp.Rational(1, 2) and sp.expand(base - (radio**2 - variable**2)) == 0:
+        return coeficiente
+    return None
+
+
+@lru_cache(maxsize=256)
+def reconocer_cartesiano(f_sup: str, f_inf: str, x_lims: Tuple,
+                         y_lims: Tuple) -> Optional[Tuple[str, str, float, str]]:
+    """
+    Reconoce un sólido de tipo I de una familia conocida.
+
+    Args:
+        f_sup: Superficie superior (string SymPy)
+        f_inf: Superficie inferior (string SymPy)
+        x_lims: Tupla (x_min, x_max)
+        y_lims: Tupla (y_min(x), y_max(x)) como strings
+
+    Returns:
+        Tupla (LaTeX, texto SymPy, valor numérico, familia) o None si el
+        sólido no pertenece a ninguna familia reconocida
+    """
+    region = detectar_region_polar(x_lims, y_lims)
+    if region is None or region["tipo"] not in ("disco", "sector"):
+        return None
+
+    x, y = simbolo("x"), simbolo("y")
+    h = compilar_expresion(f_sup).expr - compilar_expresion(f_inf).expr
+    radio = sp.sympify(region["radio"])
+    t_min, t_max = (sp.sympify(t) for t in region["theta_lims"])
+
+    # Altura radial: h(x, y) = g(sqrt(x² + y²))
+    g = h.subs({x: _RHO, y: 0})
+    if sp.expand(h - g.subs(_RHO, sp.sqrt(x**2 + y**2))) == 0:
+        reconocido = _volumen_radial(g, sp.Integer(0), radio, t_max - t_min)
+        if reconocido is not None:
+            return _forma_cerrada(*reconocido)
+
+    # Dos cilindros ortogonales sobre el disco completo: h = α·sqrt(r² - x²)
+    if region["tipo"] == "disco" and len(sp.Add.make_args(h)) == 1:
+        for variable, otra in ((x, y), (y, x)):
+            if otra in h.free_symbols:
+                continue
+            alfa = _raiz_cuadrada_de(h, variable, radio)
+            if alfa is not None:
+                return _forma_cerrada(alfa * 8 * radio**3 / 3, "steinmetz")
+    return None
+
+
+@lru_cache(maxsize=256)
+def reconocer_polar(h_expr: str, r_lims: Tuple,
+                    theta_lims: Tuple) -> Optional[Tuple[str, str, float, str]]:
+    """
+    Reconoce una altura radial h(r) con límites constantes en polares.
+
+    Returns:
+        Tupla (LaTeX, texto SymPy, valor numérico, familia) o None
+    """
+    r = sp.Symbol("r", real=True, positive=True)
+    theta = sp.Symbol("theta", real=True)
+    locales = {"r": r, "theta": theta}
+    h = sp.sympify(h_expr, locals=locales)
+    r_min, r_max = (sp.sympify(str(v), locals=locales) for v in r_lims)
+    t_min, t_max = (sp.sympify(str(v), locals=locales) for v in theta_lims)
+    if any(not e.is_number for e in (r_min, r_max, t_min, t_max)) or theta in h.free_symbols:
+        return None
+    reconocido = _volumen_radial(h.subs(r, _RHO), r_min, r_max, t_max - t_min)
+    return _forma_cerrada(*reconocido) if reconocido is not None else None
+
+
+def _suma_de_cuadrados(desigualdad) -> Optional[Tuple[frozenset, sp.Expr]]:
+    """Si la desigualdad es Σ v² ≤ c, devuelve (variables, c)."""
+    if isinstance(desigualdad, (sp.LessThan, sp.StrictLessThan)):
+        expr = desigualdad.lhs - desigualdad.rhs
+    elif isinstance(desigualdad, (sp.GreaterThan, sp.StrictGreaterThan)):
+        expr = desigualdad.rhs - desigualdad.lhs
+    else:
+        return None
+    variables = [s for s in map(simbolo, "xyz") if s in expr.free_symbols]
+    try:
+        polinomio = sp.Poly(sp.expand(expr), *variables)
+    except sp.PolynomialError:
+        return None
+    cuadrados = {tuple(2 if j == i else 0 for j in range(len(variables)))
+                 for i in range(len(variables))}
+    terminos = dict(polinomio.terms())
+    constante = -terminos.pop((0,) * len(variables), sp.Integer(0))
+    if set(terminos) != cuadrados or any(c != 1 for c in terminos.values()) \
+            or not constante.is_positive:
+        return None
+    return frozenset(v.name for v in variables), constante
+
+
+@lru_cache(maxsize=256)
+def reconocer_region_3d(region: str, caja: Tuple) -> Optional[Tuple[str, str, float, str]]:
+    """
+    Reconoce esferas e intersecciones de dos o tres cilindros ortogonales
+    del mismo radio, descritas por desigualdades.
+
+    Args:
+        region: Desigualdades en texto (o superficie implícita F ≤ 0)
+        caja: Caja que debe contener la región
+
+    Returns:
+        Tupla (LaTeX, texto SymPy, valor numérico, familia) o None
+    """
+    expr = compilar_expresion(region, ("x", "y", "z")).expr
+    if not isinstance(expr, sp.logic.boolalg.Boolean):
+        expr = sp.Le(expr, 0)
+    desigualdades = expr.args if isinstance(expr, sp.And) else (expr,)
+
+    piezas = [_suma_de_cuadrados(d) for d in desigualdades]
+    if not piezas or any(p is None for p in piezas):
+        return None
+    radios2 = {c for _, c in piezas}
+    conjuntos = {v for v, _ in piezas}
+    if len(radios2) != 1 or len(conjuntos) != len(piezas):
+        return None
+    r2 = radios2.pop()
+    radio = sp.sqrt(r2)
+
+    if conjuntos == {frozenset("xyz")}:
+        volumen, familia = sp.Rational(4, 3) * sp.pi * radio**3, "esfera"
+    elif all(len(v) == 2 for v in conjuntos) and len(conjuntos) == 2:
+        volumen, familia = sp.Rational(16, 3) * radio**3, "steinmetz (2 cilindros)"
+    elif all(len(v) == 2 for v in conjuntos) and len(conjuntos) == 3:
+        volumen, familia = 8 * (2 - sp.sqrt(2)) * radio**3, "steinmetz (3 cilindros)"
+    else:
+        return None
+
+    # La región debe quedar dentro de la caja: |x|, |y|, |z| ≤ r
+    if any(float(a) > -float(radio) or float(b) < float(radio) for a, b in caja):
+        return None
+    return _forma_cerrada(volumen, familia)
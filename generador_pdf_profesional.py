@@ -4,20 +4,54 @@ Proyecto: Análisis de Sólidos mediante Integrales Múltiples
 Facultad de Ingeniería - UCSG
 """
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak, KeepTogether
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
-from reportlab.lib.units import cm
-from reportlab.pdfgen import canvas
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-import matplotlib
-matplotlib.use('Agg')  # Backend sin GUI
+from __future__ import annotations
+
 import numpy as np
+import hashlib
 import io
+import logging
+import os
+import shutil
+import tempfile
+import time
+from functools import lru_cache
 from datetime import datetime
+from typing import Optional
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+from reportlab.lib.units import cm
+from carga_perezosa import modulo_perezoso, pyplot_perezoso
+from expresiones_compiladas import CacheLRU, como_funcion
+from cache_formulas import MODOS, cache_compartida
+from instrumentacion import tramo
+from mallas_solidos import generar_malla
+
+logger = logging.getLogger(__name__)
+
+
+# Facetas por eje que dibuja plot_surface (la malla se evalúa completa)
+MAX_FACETAS_3D = 100
+
+
+def _configurar_reportlab(platypus):
+    # Imágenes en binario comprimido: la codificación ASCII85 de ReportLab es
+    # Python puro y dominaba el tiempo de build con las gráficas 3D
+    from reportlab import rl_config
+    rl_config.useA85 = 0
+
+
+# ReportLab (platypus) y matplotlib se importan al armar el primer reporte
+platypus = modulo_perezoso("reportlab.platypus", _configurar_reportlab)
+estilos_rl = modulo_perezoso("reportlab.lib.styles")
+colors = modulo_perezoso("reportlab.lib.colors")
+plt = pyplot_perezoso()
+
+# Gráficas 3D ya renderizadas (por expresiones, malla y resolución)
+_CACHE_GRAFICAS = CacheLRU(32)
+
+# Hoja de estilos compartida por los reportes del proceso
+_ESTILOS = None
 
 
 class GeneradorReporteProfesionalUCSG:
@@ -25,9 +59,26 @@ class GeneradorReporteProfesionalUCSG:
     Generador de reportes PDF profesionales con matemáticas renderizadas.
     """
     
-    def __init__(self, filename="Reporte_Analisis_UCSG.pdf"):
+    def __init__(self, filename="Reporte_Analisis_UCSG.pdf",
+                 modo_formulas: str = "png", cache_formulas=None,
+                 streaming: bool = False):
+        """
+        Args:
+            filename: Archivo PDF de salida
+            modo_formulas: 'png' (imágenes rasterizadas) o 'vectorial'
+                           (trazos de ReportLab, sin rasterizar)
+            cache_formulas: CacheFormulas; por defecto, la compartida del
+                            proceso (memoria + disco)
+            streaming: Vuelca las imágenes a archivos temporales que
+                       ReportLab abre solo al dibujarlas y cierra después;
+                       la historia no retiene ninguna imagen en memoria
+        """
+        if modo_formulas not in MODOS:
+            raise ValueError(f"Modo de fórmulas '{modo_formulas}' no soportado: use {MODOS}")
         self.filename = filename
-        self.doc = SimpleDocTemplate(
+        self.modo_formulas = modo_formulas
+        self.cache_formulas = cache_formulas if cache_formulas is not None else cache_compartida()
+        self.doc = platypus.SimpleDocTemplate(
             filename,
             pagesize=A4,
             rightMargin=2.5*cm,
@@ -36,20 +87,32 @@ class GeneradorReporteProfesionalUCSG:
             bottomMargin=2*cm
         )
         self.story = []
-        self.styles = getSampleStyleSheet()
-        self._configurar_estilos()
+        self.styles = self._hoja_estilos()
+        self.streaming = streaming
+        self._temporal = tempfile.mkdtemp(prefix="ucsg_reporte_") if streaming else None
         
         # Colores UCSG
         self.color_rojo = colors.HexColor('#a33238')
         self.color_negro = colors.HexColor('#1a1a1a')
         self.color_gris = colors.HexColor('#f2f2f2')
         
-    def _configurar_estilos(self):
+    @classmethod
+    def _hoja_estilos(cls):
+        """Estilos del reporte; se construyen una vez por proceso."""
+        global _ESTILOS
+        if _ESTILOS is None:
+            estilos = estilos_rl.getSampleStyleSheet()
+            cls._configurar_estilos(estilos)
+            _ESTILOS = estilos
+        return _ESTILOS
+        
+    @staticmethod
+    def _configurar_estilos(estilos):
         """Configura los estilos tipográficos."""
         
-        self.styles.add(ParagraphStyle(
+        estilos.add(estilos_rl.ParagraphStyle(
             name='TituloUCSG',
-            parent=self.styles['Heading1'],
+            parent=estilos['Heading1'],
             fontName='Times-Bold',
             fontSize=16,
             textColor=colors.HexColor('#1a1a1a'),
@@ -57,9 +120,9 @@ class GeneradorReporteProfesionalUCSG:
             spaceAfter=8
         ))
         
-        self.styles.add(ParagraphStyle(
+        estilos.add(estilos_rl.ParagraphStyle(
             name='SubtituloUCSG',
-            parent=self.styles['Normal'],
+            parent=estilos['Normal'],
             fontName='Times-Roman',
             fontSize=11,
             textColor=colors.HexColor('#a33238'),
@@ -67,9 +130,9 @@ class GeneradorReporteProfesionalUCSG:
             spaceAfter=20
         ))
         
-        self.styles.add(ParagraphStyle(
+        estilos.add(estilos_rl.ParagraphStyle(
             name='SeccionTitulo',
-            parent=self.styles['Heading2'],
+            parent=estilos['Heading2'],
             fontName='Times-Bold',
             fontSize=13,
             textColor=colors.HexColor('#1a1a1a'),
@@ -77,9 +140,9 @@ class GeneradorReporteProfesionalUCSG:
             spaceBefore=15
         ))
         
-        self.styles.add(ParagraphStyle(
+        estilos.add(estilos_rl.ParagraphStyle(
             name='TextoNormal',
-            parent=self.styles['Normal'],
+            parent=estilos['Normal'],
             fontName='Times-Roman',
             fontSize=11,
             alignment=TA_JUSTIFY,
@@ -87,6 +150,30 @@ class GeneradorReporteProfesionalUCSG:
             leading=14
         ))
         
+        estilos.add(estilos_rl.ParagraphStyle(
+            name='CeldaTabla',
+            parent=estilos['Normal'],
+            fontName='Times-Roman',
+            fontSize=10,
+            alignment=TA_CENTER,
+            leading=12
+        ))
+        
+    def _imagen(self, datos: bytes, extension: str, width, height) -> platypus.Image:
+        """
+        Image de ReportLab para los bytes de un PNG o JPEG.
+        
+        En modo streaming la imagen se escribe una sola vez en el directorio
+        temporal (por su hash) y se referencia con lazy=2.
+        """
+        if not self.streaming:
+            return platypus.Image(io.BytesIO(datos), width=width, height=height)
+        ruta = os.path.join(self._temporal, hashlib.md5(datos).hexdigest() + extension)
+        if not os.path.exists(ruta):
+            with open(ruta, "wb") as archivo:
+                archivo.write(datos)
+        return platypus.Image(ruta, width=width, height=height, lazy=2)
+        
     def renderizar_formula_matematica(self, formula_latex, ancho=15*cm):
         """
         Renderiza una fórmula matemática LaTeX como imagen usando matplotlib.
@@ -96,30 +183,14 @@ class GeneradorReporteProfesionalUCSG:
             ancho: Ancho deseado de la imagen
             
         Returns:
-            Objeto Image de ReportLab
+            Objeto Image de ReportLab (Drawing en modo vectorial)
         """
-        fig = plt.figure(figsize=(8, 1.5))
-        fig.patch.set_facecolor('#fdfdfd')
-        ax = fig.add_subplot(111)
-        ax.axis('off')
-        
-        # Renderizar LaTeX
-        ax.text(0.5, 0.5, f'${formula_latex}$', 
-                fontsize=18, 
-                ha='center', 
-                va='center',
-                transform=ax.transAxes,
-                family='serif')
-        
-        # Guardar en buffer
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', 
-                   facecolor='#fdfdfd', edgecolor='none', pad_inches=0.2)
-        buf.seek(0)
-        plt.close()
+        if self.modo_formulas == "vectorial":
+            return self.cache_formulas.dibujo(formula_latex, ancho, ancho*0.15)
         
-        # Crear imagen para PDF
-        img = Image(buf, width=ancho, height=ancho*0.15)
+        # Las fórmulas repetidas entre reportes salen de la caché
+        png = self.cache_formulas.png(formula_latex, tamano=18, dpi=150)
+        img = self._imagen(png, ".png", ancho, ancho*0.15)
         return img
         
     def agregar_encabezado(self, titulo: str, autores: str, fecha: str = None):
@@ -129,47 +200,46 @@ class GeneradorReporteProfesionalUCSG:
             fecha = datetime.now().strftime("%d de %B de %Y")
         
         # Logo UCSG
-        import os
         logo_path = os.path.join(os.path.dirname(__file__), 'Logo_UCSG.png')
         
         if os.path.exists(logo_path):
-            logo = Image(logo_path, width=4*cm, height=4*cm)
+            logo = self._imagen(_logo_reducido(logo_path), ".png", 4*cm, 4*cm)
             logo.hAlign = 'CENTER'
             self.story.append(logo)
-            self.story.append(Spacer(1, 0.3*cm))
+            self.story.append(platypus.Spacer(1, 0.3*cm))
         
         # Títulos institucionales
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             "UNIVERSIDAD CATÓLICA DE SANTIAGO DE GUAYAQUIL",
             self.styles['TituloUCSG']
         ))
         
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             "FACULTAD DE INGENIERÍA",
             self.styles['TituloUCSG']
         ))
         
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             "Departamento de Matemáticas",
             self.styles['SubtituloUCSG']
         ))
         
         # Línea decorativa
         data_linea = [['', '', '']]
-        tabla_linea = Table(data_linea, colWidths=[16*cm])
-        tabla_linea.setStyle(TableStyle([
+        tabla_linea = platypus.Table(data_linea, colWidths=[16*cm])
+        tabla_linea.setStyle(platypus.TableStyle([
             ('LINEABOVE', (0, 0), (-1, 0), 3, self.color_rojo),
             ('LINEBELOW', (0, 0), (-1, 0), 1, self.color_negro)
         ]))
         self.story.append(tabla_linea)
-        self.story.append(Spacer(1, 0.5*cm))
+        self.story.append(platypus.Spacer(1, 0.5*cm))
         
         # Título del proyecto
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             f"<b>{titulo}</b>",
             self.styles['TituloUCSG']
         ))
-        self.story.append(Spacer(1, 0.3*cm))
+        self.story.append(platypus.Spacer(1, 0.3*cm))
         
         # Información del proyecto
         info_data = [
@@ -178,8 +248,8 @@ class GeneradorReporteProfesionalUCSG:
             ['<b>Fecha:</b>', fecha]
         ]
         
-        info_tabla = Table(info_data, colWidths=[4*cm, 12*cm])
-        info_tabla.setStyle(TableStyle([
+        info_tabla = platypus.Table(info_data, colWidths=[4*cm, 12*cm])
+        info_tabla.setStyle(platypus.TableStyle([
             ('FONTNAME', (0, 0), (0, -1), 'Times-Bold'),
             ('FONTNAME', (1, 0), (1, -1), 'Times-Roman'),
             ('FONTSIZE', (0, 0), (-1, -1), 11),
@@ -188,7 +258,7 @@ class GeneradorReporteProfesionalUCSG:
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
         ]))
         self.story.append(info_tabla)
-        self.story.append(Spacer(1, 0.8*cm))
+        self.story.append(platypus.Spacer(1, 0.8*cm))
         
     def agregar_seccion_con_formulas(self, titulo: str, descripcion: str, 
                                     formulas: list = None):
@@ -201,13 +271,13 @@ class GeneradorReporteProfesionalUCSG:
             formulas: Lista de diccionarios con 'latex' y 'descripcion'
         """
         
-        self.story.append(Paragraph(f"<b>{titulo}</b>", self.styles['SeccionTitulo']))
-        self.story.append(Paragraph(descripcion, self.styles['TextoNormal']))
+        self.story.append(platypus.Paragraph(f"<b>{titulo}</b>", self.styles['SeccionTitulo']))
+        self.story.append(platypus.Paragraph(descripcion, self.styles['TextoNormal']))
         
         if formulas:
             for formula_info in formulas:
                 if 'descripcion' in formula_info:
-                    self.story.append(Paragraph(
+                    self.story.append(platypus.Paragraph(
                         formula_info['descripcion'], 
                         self.styles['TextoNormal']
                     ))
@@ -215,7 +285,7 @@ class GeneradorReporteProfesionalUCSG:
                 # Renderizar fórmula
                 img_formula = self.renderizar_formula_matematica(formula_info['latex'])
                 self.story.append(img_formula)
-                self.story.append(Spacer(1, 0.3*cm))
+                self.story.append(platypus.Spacer(1, 0.3*cm))
         
     def agregar_desarrollo_matematico(self, ec_superior: str, ec_inferior: str,
                                       x_min: str, x_max: str,
@@ -279,22 +349,39 @@ class GeneradorReporteProfesionalUCSG:
             ]
         )
         
-    def agregar_resultados(self, volumen_numerico: float, metodo: str = "Sumas de Riemann"):
-        """Agrega los resultados del cálculo."""
+    def agregar_resultados(self, volumen_numerico: float, metodo: str = "Sumas de Riemann",
+                           error_estimado: Optional[float] = None, convergio: bool = True):
+        """
+        Agrega los resultados del cálculo.
         
-        self.story.append(Paragraph(
+        Args:
+            volumen_numerico: Volumen calculado
+            metodo: Nombre del método empleado
+            error_estimado: Error absoluto estimado por el integrador
+            convergio: Si el integrador alcanzó la tolerancia pedida
+        """
+        
+        self.story.append(platypus.Paragraph(
             "<b>5. RESULTADOS DEL CÁLCULO</b>", 
             self.styles['SeccionTitulo']
         ))
         
-        # Tabla de resultados
+        # Tabla de resultados (la precisión es el error que reporta el integrador)
+        if error_estimado is None:
+            precision = 'No estimada'
+        else:
+            precision = f'± {_notacion_cientifica(error_estimado)}'
+            if not convergio:
+                precision += '<br/>(tolerancia no alcanzada)'
+        celda = self.styles['CeldaTabla']
         data = [
             ['Método Empleado', 'Volumen Calculado', 'Precisión'],
-            [metodo, f'{volumen_numerico:.8f} u³', 'ε < 10⁻⁴']
+            [platypus.Paragraph(metodo, celda), f'{volumen_numerico:.8f} u³',
+             platypus.Paragraph(precision, celda)]
         ]
         
-        tabla = Table(data, colWidths=[6*cm, 5*cm, 5*cm])
-        tabla.setStyle(TableStyle([
+        tabla = platypus.Table(data, colWidths=[6*cm, 5*cm, 5*cm])
+        tabla.setStyle(platypus.TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), self.color_negro),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
@@ -306,116 +393,196 @@ class GeneradorReporteProfesionalUCSG:
             ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, self.color_gris])
         ]))
         self.story.append(tabla)
-        self.story.append(Spacer(1, 0.5*cm))
+        self.story.append(platypus.Spacer(1, 0.5*cm))
         
         # Resultado final renderizado
         resultado_latex = f'V = {volumen_numerico:.6f} \\, \\text{{unidades}}^3'
         img_resultado = self.renderizar_formula_matematica(resultado_latex)
         self.story.append(img_resultado)
         
-    def agregar_grafica_3d(self, f_superior, f_inferior, x_lims, y_lims):
-        """Agrega gráfica 3D del sólido."""
+    def agregar_grafica_3d(self, f_superior, f_inferior, x_lims, y_lims,
+                           region=None, resolucion: int = 50, malla=None):
+        """
+        Agrega gráfica 3D del sólido.
         
-        self.story.append(PageBreak())
-        self.story.append(Paragraph(
+        Args:
+            f_superior: Función f(x,y) o su expresión como string
+            f_inferior: Función g(x,y) o su expresión como string
+            x_lims: Tupla (x_min, x_max) de la malla
+            y_lims: Tupla (y_min, y_max) de la malla
+            region: Tupla (x_lims, (y_min(x), y_max(x))) de la región de
+                    integración; los puntos de la malla fuera de ella no se
+                    dibujan. Sin región, la malla se extiende 0.5 por lado.
+            resolucion: Puntos por eje de la malla (p. ej. 50 a 400)
+            malla: MallaSolido ya generada (p. ej. con mallas_solidos.cargar);
+                   se dibuja sin volver a evaluar las superficies
+        """
+        self.story.append(platypus.PageBreak())
+        self.story.append(platypus.Paragraph(
             "<b>6. VISUALIZACIÓN TRIDIMENSIONAL</b>", 
             self.styles['SeccionTitulo']
         ))
         
-        fig = plt.figure(figsize=(10, 8))
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Generar malla
-        x = np.linspace(x_lims[0] - 0.5, x_lims[1] + 0.5, 50)
-        y = np.linspace(y_lims[0] - 0.5, y_lims[1] + 0.5, 50)
-        X, Y = np.meshgrid(x, y)
-        
-        Z_sup = np.zeros_like(X)
-        Z_inf = np.zeros_like(X)
-        
-        for i in range(len(x)):
-            for j in range(len(y)):
-                try:
-                    Z_sup[j, i] = f_superior(X[j, i], Y[j, i])
-                    Z_inf[j, i] = f_inferior(X[j, i], Y[j, i])
-                except:
-                    Z_sup[j, i] = np.nan
-                    Z_inf[j, i] = np.nan
-        
-        # Graficar
-        ax.plot_surface(X, Y, Z_sup, alpha=0.85, cmap='Blues', edgecolor='none')
-        ax.plot_surface(X, Y, Z_inf, alpha=0.85, cmap='Reds', edgecolor='none')
-        
-        ax.set_xlabel('Eje X', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Eje Y', fontsize=12, fontweight='bold')
-        ax.set_zlabel('Eje Z', fontsize=12, fontweight='bold')
-        ax.set_title('Sólido Analizado', fontsize=14, fontweight='bold', pad=20)
-        ax.view_init(elev=25, azim=45)
-        ax.grid(True, alpha=0.3)
-        
-        # Guardar
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-        buf.seek(0)
-        plt.close()
-        
-        img = Image(buf, width=15*cm, height=12*cm)
+        # Con expresiones en texto la imagen se reutiliza entre reportes
+        clave = None if malla is not None else \
+            _clave_grafica(f_superior, f_inferior, x_lims, y_lims, region, resolucion)
+        imagen = _CACHE_GRAFICAS.obtener(clave) if clave is not None else None
+        if imagen is None:
+            if malla is None:
+                malla = _malla_grafica(f_superior, f_inferior, x_lims, y_lims,
+                                       region, resolucion)
+            with tramo("grafica_3d", resolucion=resolucion):
+                imagen = _renderizar_grafica_3d(malla, resolucion)
+            if clave is not None:
+                _CACHE_GRAFICAS.guardar(clave, imagen)
+        
+        img = self._imagen(imagen, ".jpg", 15*cm, 12*cm)
         self.story.append(img)
         
+    def estadisticas_formulas(self) -> dict:
+        """Aciertos de la caché de fórmulas (memoria, disco y renderizados)."""
+        return self.cache_formulas.estadisticas()
+        
     def finalizar(self):
         """Genera el PDF final."""
-        self.doc.build(self.story)
-        print(f"Reporte PDF generado: {self.filename}")
+        try:
+            with tramo("pdf", streaming=self._temporal is not None):
+                self.doc.build(self.story)
+        finally:
+            if self._temporal is not None:
+                shutil.rmtree(self._temporal, ignore_errors=True)
+        logger.info("Reporte PDF generado: %s", self.filename)
+        estadisticas = self.estadisticas_formulas()
+        logger.info("Caché de fórmulas: %.0f%% de aciertos (%d renderizadas)",
+                    100 * estadisticas['tasa_aciertos'], estadisticas['renderizados'])
         return self.filename
 
 
-def generar_reporte_profesional(nombre_solido: str = "Paraboloides", 
-                                autores: str = "Equipo UCSG"):
+@lru_cache(maxsize=4)
+def _logo_reducido(ruta: str, lado_px: int = 480) -> bytes:
     """
-    Genera un reporte completo profesional.
+    Logo reducido a ~300 dpi para los 4 cm que ocupa en la página: ReportLab
+    decodifica y recomprime la imagen completa en cada documento.
     """
-    from analizador_matematico import BibliotecaSolidos
-    
-    biblioteca = BibliotecaSolidos()
+    from PIL import Image as ImagenPIL
+    with ImagenPIL.open(ruta) as imagen:
+        imagen.thumbnail((lado_px, lado_px), ImagenPIL.LANCZOS)
+        buf = io.BytesIO()
+        imagen.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def _clave_grafica(f_superior, f_inferior, x_lims, y_lims, region, resolucion):
+    """Clave de la caché de gráficas; None si hay funciones (no comparables)."""
+    valores = [f_superior, f_inferior, *x_lims, *y_lims]
+    if region is not None:
+        valores += [*region[0], *region[1]]
+    if not all(isinstance(v, (str, int, float)) for v in valores):
+        return None
+    return (tuple(str(v) for v in valores), region is not None, resolucion, MAX_FACETAS_3D)
+
+
+def _malla_grafica(f_superior, f_inferior, x_lims, y_lims, region, resolucion: int):
+    """
+    Malla de la gráfica: ajustada a la región de tipo I si se da, o el
+    rectángulo de la malla ampliado 0.5 por lado.
+    """
+    if region is not None:
+        return generar_malla(f_superior, f_inferior, region[0], region[1], resolucion)
+    margen = 0.5
+    return generar_malla(f_superior, f_inferior,
+                         (x_lims[0] - margen, x_lims[1] + margen),
+                         (y_lims[0] - margen, y_lims[1] + margen), resolucion)
+
+
+def _renderizar_grafica_3d(malla, resolucion: int) -> bytes:
+    """Imagen JPEG de las superficies y la pared lateral de la malla (ver agregar_grafica_3d)."""
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
     
-    if nombre_solido == "Paraboloides":
-        resultado = biblioteca.paraboloides_intersectados()
-    else:
-        raise ValueError(f"Sólido '{nombre_solido}' no implementado")
+    # Graficar
+    # El coste de dibujo crece con las facetas: se submuestrea la malla
+    facetas = min(resolucion, MAX_FACETAS_3D)
+    ax.plot_surface(malla.X, malla.Y, malla.z_sup, alpha=0.85, cmap='Blues', edgecolor='none',
+                    rcount=facetas, ccount=facetas)
+    ax.plot_surface(malla.X, malla.Y, malla.z_inf, alpha=0.85, cmap='Reds', edgecolor='none',
+                    rcount=facetas, ccount=facetas)
+    ax.plot_surface(*malla.pared(), color='gray', alpha=0.35, edgecolor='none',
+                    rcount=2, ccount=4 * facetas)
     
-    # Crear reporte
-    filename = f"Reporte_Profesional_{nombre_solido}_UCSG.pdf"
-    reporte = GeneradorReporteProfesionalUCSG(filename)
+    ax.set_xlabel('Eje X', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Eje Y', fontsize=12, fontweight='bold')
+    ax.set_zlabel('Eje Z', fontsize=12, fontweight='bold')
+    ax.set_title('Sólido Analizado', fontsize=14, fontweight='bold', pad=20)
+    ax.view_init(elev=25, azim=45)
+    ax.grid(True, alpha=0.3)
     
-    # Encabezado
-    reporte.agregar_encabezado(
-        titulo=f"Análisis del Sólido: {resultado['nombre']}",
-        autores=autores
-    )
+    # Guardar: ReportLab inserta el JPEG tal cual, sin decodificarlo ni
+    # volver a comprimirlo como haría con un PNG
+    buf = io.BytesIO()
+    fig.savefig(buf, format='jpeg', dpi=150, bbox_inches='tight',
+                pil_kwargs={'quality': 92})
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def _caja_region(x_lims, y_lims):
+    """Rectángulo que contiene la región de tipo I (para la malla de la gráfica)."""
+    xs = np.linspace(x_lims[0], x_lims[1], 201)
+    with np.errstate(all='ignore'):
+        y_min = np.asarray(como_funcion(y_lims[0], ("x",))(xs))
+        y_max = np.asarray(como_funcion(y_lims[1], ("x",))(xs))
+    return tuple(x_lims), (float(np.nanmin(y_min)), float(np.nanmax(y_max)))
+
+
+def _notacion_cientifica(valor: float, cifras: int = 1) -> str:
+    """Valor en la forma 3.2 × 10<super>-9</super> (marcado de Paragraph)."""
+    if valor == 0 or not np.isfinite(valor):
+        return f'{valor:g}'
+    mantisa, exponente = f'{valor:.{cifras}e}'.split('e')
+    return f'{mantisa} × 10<super>{int(exponente)}</super>'
+
+
+def _agregar_solido(reporte: GeneradorReporteProfesionalUCSG, espec,
+                    resultado: dict, resolucion: int) -> dict:
+    """
+    Secciones de un sólido analizado (desarrollo, resultados, gráfica 3D y
+    conclusiones); devuelve el tiempo de cada etapa.
+    """
+    inicio = time.perf_counter()
     
     # Desarrollo matemático
+    latex = espec.latex()
     reporte.agregar_desarrollo_matematico(
-        ec_superior="8 - x^2 - y^2",
-        ec_inferior="x^2 + y^2",
-        x_min="-2",
-        x_max="2",
-        y_min="-\\sqrt{4-x^2}",
-        y_max="\\sqrt{4-x^2}"
+        ec_superior=latex['superior'],
+        ec_inferior=latex['inferior'],
+        x_min=latex['x_min'],
+        x_max=latex['x_max'],
+        y_min=latex['y_min'],
+        y_max=latex['y_max']
     )
     
     # Resultados
+    numerico = resultado['resultado_numerico']
     reporte.agregar_resultados(
-        volumen_numerico=resultado['resultado_numerico']['volumen'],
-        metodo="Sumas de Riemann (100×100)"
+        volumen_numerico=numerico['volumen'],
+        metodo=numerico['metodo'],
+        error_estimado=numerico.get('error_estimado'),
+        convergio=numerico.get('convergio', True)
     )
+    fin_formulas = time.perf_counter()
     
-    # Gráfica 3D
-    f_sup = lambda x, y: 8 - x**2 - y**2
-    f_inf = lambda x, y: x**2 + y**2
-    reporte.agregar_grafica_3d(f_sup, f_inf, (-2, 2), (-2, 2))
+    # Gráfica 3D (mismas expresiones compiladas que el cálculo numérico)
+    expresiones = resultado['expresiones']
+    x_lims, y_lims = _caja_region(expresiones['x_lims'], expresiones['y_lims'])
+    reporte.agregar_grafica_3d(
+        expresiones['superior'], expresiones['inferior'], x_lims, y_lims,
+        region=(expresiones['x_lims'], expresiones['y_lims']), resolucion=resolucion
+    )
+    fin_grafica = time.perf_counter()
     
     # Conclusiones
-    reporte.story.append(Paragraph(
+    reporte.story.append(platypus.Paragraph(
         "<b>7. CONCLUSIONES</b>", 
         reporte.styles['SeccionTitulo']
     ))
@@ -423,16 +590,175 @@ def generar_reporte_profesional(nombre_solido: str = "Paraboloides",
     conclusiones = (
         f"Se calculó exitosamente el volumen del sólido {resultado['nombre']} "
         f"mediante integración numérica, obteniendo un valor de "
-        f"{resultado['resultado_numerico']['volumen']:.6f} unidades cúbicas. "
-        f"El método empleado garantiza una precisión adecuada para aplicaciones de ingeniería."
+        f"{numerico['volumen']:.6f} unidades cúbicas. "
     )
+    if numerico.get('error_estimado') is not None:
+        conclusiones += (
+            f"El error absoluto estimado por el integrador es de "
+            f"{_notacion_cientifica(numerico['error_estimado'])} unidades cúbicas"
+        )
+        conclusiones += "." if numerico.get('convergio', True) else (
+            ", por encima de la tolerancia pedida: el cálculo se detuvo "
+            "al agotar su presupuesto."
+        )
+    
+    reporte.story.append(platypus.Paragraph(conclusiones, reporte.styles['TextoNormal']))
+    return {
+        "formulas_s": fin_formulas - inicio,
+        "grafica_s": fin_grafica - fin_formulas,
+    }
+
+
+def construir_reporte(espec, resultado: dict, filename: str,
+                      autores: str = "Equipo UCSG", resolucion: int = 100,
+                      modo_formulas: str = "png", streaming: bool = False) -> dict:
+    """
+    Arma y escribe el PDF de un sólido ya analizado.
+    
+    Args:
+        espec: EspecificacionSolido del sólido
+        resultado: Análisis de BibliotecaSolidos.analizar
+        filename: Archivo PDF de salida
+        autores: Autores que aparecen en el encabezado
+        resolucion: Puntos por eje de la malla de la gráfica 3D
+        modo_formulas: 'png' o 'vectorial' (ver GeneradorReporteProfesionalUCSG)
+        streaming: Imágenes en archivos temporales en lugar de en memoria
+        
+    Returns:
+        Dict con el archivo y el tiempo de cada etapa ('formulas_s',
+        'grafica_s', 'pdf_s')
+    """
+    inicio = time.perf_counter()
+    reporte = GeneradorReporteProfesionalUCSG(filename, modo_formulas=modo_formulas,
+                                              streaming=streaming)
+    
+    # Encabezado
+    reporte.agregar_encabezado(
+        titulo=f"Análisis del Sólido: {resultado['nombre']}",
+        autores=autores
+    )
+    encabezado_s = time.perf_counter() - inicio
+    
+    tiempos = _agregar_solido(reporte, espec, resultado, resolucion)
+    tiempos["formulas_s"] += encabezado_s
+    
+    inicio_pdf = time.perf_counter()
+    reporte.finalizar()
+    return {
+        "archivo": filename,
+        **tiempos,
+        "pdf_s": time.perf_counter() - inicio_pdf
+    }
+
+
+def construir_catalogo(analisis, filename: str = "Catalogo_Solidos_UCSG.pdf",
+                       autores: str = "Equipo UCSG", resolucion: int = 100,
+                       modo_formulas: str = "png", streaming: bool = True) -> dict:
+    """
+    Arma un único PDF con varios sólidos, uno tras otro.
+    
+    Con streaming (por defecto) las fórmulas y gráficas se vuelcan a
+    archivos temporales a medida que se agregan, de modo que la memoria de
+    la historia no crece con el número de sólidos: solo quedan las
+    referencias, y cada imagen se abre al dibujar su página.
+    
+    Args:
+        analisis: Iterable de pares (EspecificacionSolido, resultado); puede
+                  ser un generador que analice cada sólido al pedirlo
+        filename: Archivo PDF de salida
+        autores: Autores que aparecen en el encabezado
+        resolucion: Puntos por eje de la malla de las gráficas 3D
+        modo_formulas: 'png' o 'vectorial'
+        streaming: Imágenes en archivos temporales en lugar de en memoria
+        
+    Returns:
+        Dict con el archivo, el número de sólidos y el tiempo de cada etapa
+    """
+    reporte = GeneradorReporteProfesionalUCSG(filename, modo_formulas=modo_formulas,
+                                              streaming=streaming)
+    reporte.agregar_encabezado(titulo="Catálogo de Sólidos", autores=autores)
+    
+    tiempos = {"formulas_s": 0.0, "grafica_s": 0.0}
+    solidos = 0
+    for espec, resultado in analisis:
+        reporte.story.append(platypus.PageBreak())
+        reporte.story.append(platypus.Paragraph(
+            f"<b>Sólido: {resultado['nombre']}</b>",
+            reporte.styles['TituloUCSG']
+        ))
+        for etapa, segundos in _agregar_solido(reporte, espec, resultado, resolucion).items():
+            tiempos[etapa] += segundos
+        solidos += 1
+    
+    inicio_pdf = time.perf_counter()
+    reporte.finalizar()
+    return {
+        "archivo": filename,
+        "solidos": solidos,
+        **tiempos,
+        "pdf_s": time.perf_counter() - inicio_pdf
+    }
+
+
+def generar_reporte_profesional(nombre_solido: str = "Paraboloides", 
+                                autores: str = "Equipo UCSG",
+                                resolucion: int = 100,
+                                modo_formulas: str = "png"):
+    """
+    Genera un reporte completo profesional.
+    
+    Args:
+        nombre_solido: Nombre o clave de un sólido del registro
+                       (ver solidos_predefinidos.json)
+        autores: Autores que aparecen en el encabezado
+        resolucion: Puntos por eje de la malla de la gráfica 3D
+        modo_formulas: 'png' o 'vectorial' (ver GeneradorReporteProfesionalUCSG)
+    """
+    from analizador_matematico import BibliotecaSolidos
     
-    reporte.story.append(Paragraph(conclusiones, reporte.styles['TextoNormal']))
+    biblioteca = BibliotecaSolidos()
+    
+    # Cualquier sólido del registro (ValueError si no existe)
+    espec = biblioteca.obtener(nombre_solido)
+    resultado = biblioteca.analizar(espec)
+    
+    # Crear reporte
+    filename = f"Reporte_Profesional_{nombre_solido}_UCSG.pdf"
+    return construir_reporte(espec, resultado, filename, autores,
+                             resolucion, modo_formulas)["archivo"]
+
+
+def generar_catalogo_profesional(solidos=None, autores: str = "Equipo UCSG",
+                                 filename: str = "Catalogo_Solidos_UCSG.pdf",
+                                 resolucion: int = 100, modo_formulas: str = "png",
+                                 streaming: bool = True):
+    """
+    Genera un reporte con varios sólidos del registro.
+    
+    Args:
+        solidos: Nombres o claves de sólidos; por defecto, todo el catálogo
+        autores: Autores que aparecen en el encabezado
+        filename: Archivo PDF de salida
+        resolucion: Puntos por eje de las gráficas 3D
+        modo_formulas: 'png' o 'vectorial'
+        streaming: Imágenes en archivos temporales (ver construir_catalogo)
+    """
+    from analizador_matematico import BibliotecaSolidos
+    
+    biblioteca = BibliotecaSolidos()
+    if solidos is None:
+        especificaciones = biblioteca.catalogo()
+    else:
+        especificaciones = [biblioteca.obtener(nombre) for nombre in solidos]
     
-    return reporte.finalizar()
+    # Cada sólido se analiza cuando el catálogo llega a él
+    analisis = ((espec, biblioteca.analizar(espec)) for espec in especificaciones)
+    return construir_catalogo(analisis, filename, autores, resolucion,
+                              modo_formulas, streaming)["archivo"]
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("="*80)
     print("GENERADOR DE REPORTES PROFESIONALES UCSG")
     print("="*80)
@@ -0,0 +1,286 @@
+"""
+Instrumentación de los Caminos Críticos
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Tramos con duración (interpretar, integral interna y externa, simplificar,
+evalf, cuadratura, gráfica 3D, PDF) y contadores (evaluaciones del
+integrando) que se envían a sumideros intercambiables: un búfer circular en
+memoria, un archivo JSON Lines o un resumen en formato de texto de
+Prometheus. Sin sumideros activos, tramo() devuelve un contexto nulo
+compartido y contar() retorna de inmediato.
+
+    from instrumentacion import SumideroMemoria, instrumentar
+    with instrumentar(SumideroMemoria()) as (memoria,):
+        analizador.calcular_exacto(...)
+    memoria.eventos()
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sumideros activos; vacía = instrumentación desactivada
+_SUMIDEROS: List = []
+
+MOTORES_PERFIL = ("cprofile", "pyinstrument")
+
+
+class _TramoNulo:
+    """Contexto sin efecto que se devuelve cuando no hay sumideros."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        return False
+
+
+_NULO = _TramoNulo()
+
+
+class _Tramo:
+    __slots__ = ("nombre", "etiquetas", "inicio")
+
+    def __init__(self, nombre: str, etiquetas: Dict):
+        self.nombre = nombre
+        self.etiquetas = etiquetas
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        _emitir({
+            "tipo": "tramo",
+            "nombre": self.nombre,
+            "duracion_s": time.perf_counter() - self.inicio,
+            "marca": time.time(),
+            "error": tipo is not None,
+            "etiquetas": self.etiquetas,
+        })
+        return False
+
+
+def activa() -> bool:
+    """Indica si hay algún sumidero recibiendo eventos."""
+    return bool(_SUMIDEROS)
+
+
+def tramo(nombre: str, **etiquetas):
+    """
+    Contexto que mide la duración de un bloque.
+
+    Args:
+        nombre: Nombre del tramo ('integral_interna', 'cuadratura'...)
+        **etiquetas: Datos adicionales (p. ej. metodo='gauss_legendre')
+
+    Returns:
+        Context manager; si no hay sumideros, uno nulo compartido
+    """
+    if not _SUMIDEROS:
+        return _NULO
+    return _Tramo(nombre, etiquetas)
+
+
+def contar(nombre: str, valor: float = 1, **etiquetas):
+    """Suma valor al contador nombre (no hace nada si no hay sumideros)."""
+    if not _SUMIDEROS:
+        return
+    _emitir({
+        "tipo": "contador",
+        "nombre": nombre,
+        "valor": valor,
+        "marca": time.time(),
+        "etiquetas": etiquetas,
+    })
+
+
+def _emitir(evento: Dict):
+    for sumidero in tuple(_SUMIDEROS):
+        try:
+            sumidero.registrar(evento)
+        except Exception:
+            # Un sumidero defectuoso no debe interrumpir el cálculo
+            logger.exception("El sumidero %r falló al registrar un evento", sumidero)
+
+
+class SumideroMemoria:
+    """Búfer circular con los últimos eventos."""
+
+    def __init__(self, capacidad: int = 10_000):
+        self._eventos = deque(maxlen=capacidad)
+        self._candado = threading.Lock()
+
+    def registrar(self, evento: Dict):
+        with self._candado:
+            self._eventos.append(evento)
+
+    def eventos(self, nombre: Optional[str] = None) -> List[Dict]:
+        """Copia de los eventos guardados (opcionalmente, solo los de nombre)."""
+        with self._candado:
+            return [e for e in self._eventos if nombre is None or e["nombre"] == nombre]
+
+    def limpiar(self):
+        with self._candado:
+            self._eventos.clear()
+
+
+class SumideroJSONL:
+    """Un evento por línea en un archivo JSON Lines (se añade al final)."""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._archivo = open(ruta, "a", encoding="utf-8")
+        self._candado = threading.Lock()
+
+    def registrar(self, evento: Dict):
+        linea = json.dumps(evento, default=str, ensure_ascii=False)
+        with self._candado:
+            self._archivo.write(linea + "\n")
+            self._archivo.flush()
+
+    def cerrar(self):
+        with self._candado:
+            self._archivo.close()
+
+
+def _etiquetas_prometheus(etiquetas: Tuple) -> str:
+    if not etiquetas:
+        return ""
+    escapar = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escapar(v)}"' for k, v in etiquetas) + "}"
+
+
+class SumideroPrometheus:
+    """
+    Acumula conteo y suma de duraciones por tramo, y totales por contador,
+    para volcarlos en el formato de texto de Prometheus.
+    """
+
+    def __init__(self, prefijo: str = "ucsg"):
+        self.prefijo = prefijo
+        self._tramos: Dict[Tuple, List[float]] = {}
+        self._contadores: Dict[Tuple, float] = {}
+        self._candado = threading.Lock()
+
+    def registrar(self, evento: Dict):
+        clave = (evento["nombre"], tuple(sorted(evento["etiquetas"].items())))
+        with self._candado:
+            if evento["tipo"] == "tramo":
+                acumulado = self._tramos.setdefault(clave, [0, 0.0])
+                acumulado[0] += 1
+                acumulado[1] += evento["duracion_s"]
+            else:
+                self._contadores[clave] = self._contadores.get(clave, 0) + evento["valor"]
+
+    def texto(self) -> str:
+        """Métricas en el formato de exposición de texto de Prometheus."""
+        lineas = []
+        with self._candado:
+            if self._tramos:
+                metrica = f"{self.prefijo}_tramo_segundos"
+                lineas.append(f"# TYPE {metrica} summary")
+                for (nombre, etiquetas), (conteo, suma) in sorted(self._tramos.items()):
+                    marcas = _etiquetas_prometheus((("tramo", nombre),) + etiquetas)
+                    lineas.append(f"{metrica}_count{marcas} {conteo}")
+                    lineas.append(f"{metrica}_sum{marcas} {suma:.9f}")
+            nombres = sorted({nombre for nombre, _ in self._contadores})
+            for nombre in nombres:
+                metrica = f"{self.prefijo}_{nombre}_total"
+                lineas.append(f"# TYPE {metrica} counter")
+                for (n, etiquetas), valor in sorted(self._contadores.items()):
+                    if n == nombre:
+                        lineas.append(f"{metrica}{_etiquetas_prometheus(etiquetas)} {valor:.17g}")
+        return "\n".join(lineas) + "\n"
+
+    def volcar(self, ruta: str):
+        """Escribe texto() en un archivo (p. ej. para node_exporter)."""
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(self.texto())
+
+
+def activar(*sumideros):
+    """Añade sumideros; a partir de aquí tramo() y contar() registran eventos."""
+    _SUMIDEROS.extend(sumideros)
+    return sumideros
+
+
+def desactivar(*sumideros):
+    """Quita los sumideros indicados (todos si no se indica ninguno)."""
+    if not sumideros:
+        _SUMIDEROS.clear()
+    for sumidero in sumideros:
+        if sumidero in _SUMIDEROS:
+            _SUMIDEROS.remove(sumidero)
+
+
+@contextmanager
+def instrumentar(*sumideros) -> Iterator[Tuple]:
+    """Activa los sumideros durante el bloque y los retira al salir."""
+    activar(*sumideros)
+    try:
+        yield sumideros
+    finally:
+        desactivar(*sumideros)
+
+
+@contextmanager
+def perfilar(motor: str = "cprofile", lineas: int = 25,
+             ruta: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Perfila el bloque con cProfile o pyinstrument.
+
+    Args:
+        motor: 'cprofile' o 'pyinstrument' (opcional, debe estar instalado)
+        lineas: Funciones del informe de cProfile (ordenadas por tiempo acumulado)
+        ruta: Archivo donde guardar el perfil (.prof de cProfile o .html de
+              pyinstrument)
+
+    Yields:
+        Dict que al salir del bloque contiene 'informe' (texto) y 'perfil'
+        (el objeto del perfilador)
+
+    Raises:
+        ValueError: Si el motor no existe o no está instalado
+    """
+    if motor not in MOTORES_PERFIL:
+        raise ValueError(f"Motor de perfilado '{motor}' no soportado: use {list(MOTORES_PERFIL)}")
+    salida: Dict = {}
+    if motor == "cprofile":
+        import cProfile
+        import io
+        import pstats
+        perfil = cProfile.Profile()
+        perfil.enable()
+        try:
+            yield salida
+        finally:
+            perfil.disable()
+            texto = io.StringIO()
+            pstats.Stats(perfil, stream=texto).sort_stats("cumulative").print_stats(lineas)
+            salida.update({"informe": texto.getvalue(), "perfil": perfil})
+            if ruta is not None:
+                perfil.dump_stats(ruta)
+    else:
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise ValueError("El motor 'pyinstrument' requiere instalar pyinstrument")
+        perfil = Profiler()
+        perfil.start()
+        try:
+            yield salida
+        finally:
+            perfil.stop()
+            salida.update({"informe": perfil.output_text(), "perfil": perfil})
+            if ruta is not None:
+                with open(ruta, "w", encoding="utf-8") as archivo:
+                    archivo.write(perfil.output_html())
@@ -0,0 +1,187 @@
+"""
+Integración Monte Carlo y Cuasi-Monte Carlo en Regiones 3D Generales
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Calcula volúmenes (e integrales triples) de sólidos definidos por
+desigualdades, como la intersección de cilindros de Steinmetz, que no son
+regiones de tipo I. Los puntos de Sobol o Halton se generan y evalúan por
+lotes; solo se guardan sumas acumuladas, de modo que la memoria no crece
+con el número de muestras.
+"""
+
+import math
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from carga_perezosa import modulo_perezoso
+from expresiones_compiladas import como_funcion, compilar_expresion
+
+sp = modulo_perezoso("sympy")
+stats = modulo_perezoso("scipy.stats")
+
+SECUENCIAS = ("sobol", "halton", "aleatoria")
+
+VARIABLES_3D = ("x", "y", "z")
+
+
+def indicador_region(region, variables: Tuple[str, ...] = VARIABLES_3D) -> Callable:
+    """
+    Convierte la descripción de una región en su función indicadora.
+
+    Args:
+        region: Desigualdades en texto, p. ej. "(x**2 + y**2 <= 1) & (x**2 + z**2 <= 1)";
+                una expresión sin desigualdades F(x,y,z) describe la región F ≤ 0
+                (interior de una superficie implícita). Un invocable se usa tal cual.
+        variables: Nombres de las variables, en el orden de llamada
+
+    Returns:
+        Función vectorizada que devuelve 1 dentro de la región y 0 fuera
+    """
+    if callable(region):
+        return region
+    compilada = compilar_expresion(str(region), variables)
+    if isinstance(compilada.expr, sp.logic.boolalg.Boolean):
+        return compilada
+    return compilar_expresion(f"({region}) <= 0", variables)
+
+
+def _generadores(secuencia: str, dimension: int, replicas: int, semilla) -> list:
+    """Un generador independiente por réplica (QMC aleatorizado)."""
+    semillas = np.random.SeedSequence(semilla).spawn(replicas)
+    if secuencia == "sobol":
+        motores = [stats.qmc.Sobol(dimension, scramble=True, seed=np.random.default_rng(s))
+                   for s in semillas]
+        return [m.random for m in motores]
+    if secuencia == "halton":
+        motores = [stats.qmc.Halton(dimension, scramble=True, seed=np.random.default_rng(s))
+                   for s in semillas]
+        return [m.random for m in motores]
+    generadores = [np.random.default_rng(s) for s in semillas]
+    return [lambda n, g=g: g.random((n, dimension)) for g in generadores]
+
+
+def refinar_montecarlo(region, caja: Sequence[Tuple[float, float]],
+                       integrando=None, secuencia: str = "sobol",
+                       replicas: int = 8, tamano_lote: int = 2**14,
+                       confianza: float = 0.95, semilla=None,
+                       max_muestras: int = 2**24) -> Iterator[Dict]:
+    """
+    Genera estimaciones cada vez más precisas agregando lotes de puntos.
+
+    Se usan varias réplicas independientes de la secuencia (Sobol o Halton
+    con aleatorización, o puntos pseudoaleatorios); la dispersión entre
+    réplicas da un intervalo de confianza t de Student también para QMC,
+    cuyo error no se puede estimar con la varianza muestral.
+
+    Args:
+        region: Región (ver indicador_region)
+        caja: Caja que contiene la región, ((x_min, x_max), (y_min, y_max), ...)
+        integrando: f(x,y,z) a integrar en la región; None para el volumen
+        secuencia: 'sobol', 'halton' o 'aleatoria'
+        replicas: Réplicas independientes (≥ 2)
+        tamano_lote: Puntos por réplica y lote (potencia de 2 con Sobol)
+        confianza: Nivel del intervalo de confianza
+        semilla: Semilla para reproducir la estimación
+        max_muestras: Máximo total de puntos
+
+    Yields:
+        Dict con volumen, error_estimado (semiamplitud del intervalo),
+        intervalo_confianza, muestras, lotes y agotado
+    """
+    if secuencia not in SECUENCIAS:
+        raise ValueError(f"Secuencia '{secuencia}' no soportada: use {SECUENCIAS}")
+    if replicas < 2:
+        raise ValueError("Se necesitan al menos 2 réplicas para estimar el error")
+
+    caja = np.asarray(caja, dtype=float)
+    dimension = len(caja)
+    variables = VARIABLES_3D if dimension == 3 else tuple(f"x{i}" for i in range(dimension))
+    indicador = indicador_region(region, variables)
+    f = como_funcion(integrando, variables) if integrando is not None else None
+
+    if secuencia == "sobol":
+        # Los puntos de Sobol solo están equilibrados en bloques de 2^m
+        tamano_lote = 1 << max(0, int(tamano_lote) - 1).bit_length()
+
+    inferior, ancho = caja[:, 0], caja[:, 1] - caja[:, 0]
+    volumen_caja = float(np.prod(ancho))
+    cuantil = float(stats.t.ppf((1 + confianza) / 2, replicas - 1))
+
+    generadores = _generadores(secuencia, dimension, replicas, semilla)
+    sumas = np.zeros(replicas)
+    por_replica = 0
+    lotes = 0
+
+    while True:
+        # (replicas, tamano_lote, dimension): una sola evaluación por lote
+        puntos = np.stack([g(tamano_lote) for g in generadores])
+        puntos = inferior + ancho * puntos
+        coordenadas = [puntos[..., i] for i in range(dimension)]
+
+        valores = np.asarray(indicador(*coordenadas), dtype=float)
+        if f is not None:
+            valores = np.where(valores != 0, f(*coordenadas), 0.0)
+        valores = np.where(np.isfinite(valores), valores, 0.0)
+
+        sumas += valores.reshape(replicas, -1).sum(axis=1)
+        por_replica += tamano_lote
+        lotes += 1
+
+        estimaciones = volumen_caja * sumas / por_replica
+        volumen = float(estimaciones.mean())
+        error = cuantil * float(estimaciones.std(ddof=1)) / math.sqrt(replicas)
+        muestras = por_replica * replicas
+
+        yield {
+            "volumen": volumen,
+            "error_estimado": error,
+            "intervalo_confianza": (volumen - error, volumen + error),
+            "confianza": confianza,
+            "muestras": muestras,
+            "evaluaciones": lotes,
+            "lotes": lotes,
+            "replicas": replicas,
+            "agotado": muestras + replicas * tamano_lote > max_muestras,
+        }
+
+
+def integrar_montecarlo(region, caja: Sequence[Tuple[float, float]],
+                        integrando=None, secuencia: str = "sobol",
+                        epsabs: float = 1e-3, epsrel: float = 1e-3,
+                        replicas: int = 8, tamano_lote: int = 2**14,
+                        confianza: float = 0.95, semilla=None,
+                        max_muestras: int = 2**24,
+                        al_progresar: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Integra sobre una región 3D agregando lotes hasta alcanzar la tolerancia.
+
+    Args:
+        region: Región (ver indicador_region)
+        caja: Caja que contiene la región
+        integrando: f(x,y,z); None para el volumen
+        secuencia: 'sobol', 'halton' o 'aleatoria'
+        epsabs: Semiamplitud absoluta objetivo del intervalo de confianza
+        epsrel: Semiamplitud relativa objetivo
+        replicas: Réplicas independientes
+        tamano_lote: Puntos por réplica y lote
+        confianza: Nivel del intervalo de confianza
+        semilla: Semilla para reproducir la estimación
+        max_muestras: Máximo total de puntos
+        al_progresar: Función llamada con cada estimación intermedia
+
+    Returns:
+        Dict con volumen, error estimado, intervalo de confianza, muestras y
+        convergencia
+    """
+    paso = None
+    for paso in refinar_montecarlo(region, caja, integrando, secuencia, replicas,
+                                   tamano_lote, confianza, semilla, max_muestras):
+        tolerancia = max(epsabs, epsrel * abs(paso["volumen"]))
+        paso["convergio"] = paso["error_estimado"] <= tolerancia
+        if al_progresar is not None:
+            al_progresar(paso)
+        if paso["convergio"] or paso["agotado"]:
+            break
+    return paso
@@ -0,0 +1,452 @@
+"""
+Réplica en Python del Integrador de la Aplicación Web
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+integrarMejorado (app_ucsg_final.html) usa punto medio con N = 200 en x,
+Simpson 1/3 con N = 200 subintervalos en y y descarta los puntos con altura
+negativa o no finita (if (h > 0)); al final devuelve |V|. Si los límites en
+y contienen sqrt, los nodos de ambas reglas pasan por la sustitución
+u = (1 + sin(πt/2))/2, que suaviza el integrando en los extremos
+(y = ±sqrt(4 - x²) tiene pendiente infinita en x = ±2). Este módulo
+reproduce ese esquema exactamente, pero evaluando las 200 × 201 alturas en
+una sola llamada vectorizada, para que el servidor precalcule y verifique
+los volúmenes que muestra la página (tablas de volúmenes en JSON).
+
+Uso:
+    python integrador_navegador.py                  # paridad de los presets
+    python integrador_navegador.py --exportar tabla_volumenes.json
+"""
+
+import json
+import math
+import os
+import re
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+import sympy as sp
+from sympy.core.parameters import evaluate
+from sympy.parsing.sympy_parser import (
+    convert_xor, implicit_multiplication_application, parse_expr, standard_transformations
+)
+
+from expresiones_compiladas import compilar_expresion, simbolo
+
+
+# Subintervalos del navegador en x (punto medio) y en y (Simpson 1/3)
+N_NAVEGADOR = 200
+
+HTML_POR_DEFECTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app_ucsg_final.html")
+
+# Presets de la página → sólidos del registro (para los valores exactos)
+CLAVES_REGISTRO = {
+    "paraboloides": "Paraboloides",
+    "esfera-cono": "EsferaCono",
+    "cilindro-plano": "CilindroPlano",
+    "hemisferio": "Hemisferio",
+}
+
+# Reemplazos de cleanLatex, en el mismo orden
+_REEMPLAZOS_LATEX = [
+    (r"\\left|\\right", ""),
+    (r"\^\{([^{}]+)\}", r"^(\1)"),
+    (r"\\sqrt\{([^}]+)\}", r"sqrt(\1)"),
+    (r"\\frac\{([^}]+)\}\{([^}]+)\}", r"(\1)/(\2)"),
+    (r"\\cdot|\\times", "*"),
+    (r"\\sin", "sin"),
+    (r"\\cos", "cos"),
+    (r"\\pi", "pi"),
+    (r"\\theta", "theta"),
+    (r"\\phi", "phi"),
+    (r"\\exp", "exp"),
+    (r"\\ln", "log"),
+    (r"\\log", "log10"),
+    (r"\\operatorname\{([^}]+)\}", r"\1"),
+]
+
+_TRANSFORMACIONES = standard_transformations + (convert_xor, implicit_multiplication_application)
+
+
+def limpiar_latex(latex: str) -> str:
+    """cleanLatex de la página: LaTeX → sintaxis de math.js."""
+    if not latex:
+        return ""
+    texto = latex
+    for patron, reemplazo in _REEMPLAZOS_LATEX:
+        texto = re.sub(patron, reemplazo, texto)
+    return texto
+
+
+# Funciones del ámbito de evaluar() en la página; son los únicos nombres
+# de función que se aceptan
+_FUNCIONES_MATHJS = {
+    "sqrt": sp.sqrt, "sin": sp.sin, "cos": sp.cos, "tan": sp.tan,
+    "exp": sp.exp, "log": sp.log, "log10": lambda a: sp.log(a, 10),
+    "abs": sp.Abs, "pow": sp.Pow,
+}
+_VARIABLES_MATHJS = ("x", "y", "r", "theta")
+
+# Números, nombres y operadores; cualquier otro carácter (comillas,
+# corchetes, '.' suelto, ';'...) hace fallar la lectura
+_TOKEN_MATHJS = re.compile(
+    r"\s*(?:(?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<nombre>[A-Za-z_]\w*)"
+    r"|(?P<operador>\*\*|[-+*/^(),]))"
+)
+
+# Tamaño máximo de una expresión de la página (caracteres) y de cada
+# potencia numérica exacta (bits): 9^9^9 bloquearía a SymPy indefinidamente
+MAX_LONGITUD_MATHJS = 500
+MAX_BITS_POTENCIA = 10_000
+
+# parse_expr evalúa el código que generan sus transformaciones; sin
+# __builtins__ y solo con los constructores numéricos de SymPy
+_GLOBALES_PARSE = {
+    "__builtins__": {},
+    "Integer": sp.Integer, "Float": sp.Float, "Rational": sp.Rational,
+}
+
+
+def validar_mathjs(texto: str):
+    """
+    Comprueba que la expresión solo contenga números, x, y, r, theta, pi,
+    e, operadores aritméticos, paréntesis, comas y las funciones de la página.
+
+    Raises:
+        ValueError: Con el primer fragmento no permitido
+    """
+    if len(texto) > MAX_LONGITUD_MATHJS:
+        raise ValueError(f"Expresión demasiado larga ({len(texto)} caracteres; "
+                         f"máximo {MAX_LONGITUD_MATHJS})")
+    permitidos = set(_VARIABLES_MATHJS) | set(_FUNCIONES_MATHJS) | {"pi", "e"}
+    posicion = 0
+    texto = texto.rstrip()
+    while posicion < len(texto):
+        token = _TOKEN_MATHJS.match(texto, posicion)
+        if token is None:
+            raise ValueError(f"Carácter no permitido en la expresión: {texto[posicion:posicion + 10]!r}")
+        if token.group("nombre") is not None and token.group("nombre") not in permitidos:
+            raise ValueError(f"Nombre no permitido en la expresión: {token.group('nombre')!r}")
+        posicion = token.end()
+
+
+def _verificar_potencias(expr: sp.Expr):
+    """
+    Rechaza las potencias numéricas cuyo valor exacto excede MAX_BITS_POTENCIA.
+
+    Se recorre el árbol sin evaluar de las hojas hacia la raíz, de modo
+    que al estimar una potencia sus operandos ya están acotados.
+
+    Raises:
+        ValueError: Si alguna potencia es demasiado grande
+    """
+    for argumento in expr.args:
+        _verificar_potencias(argumento)
+    if not isinstance(expr, sp.Pow) or expr.free_symbols:
+        return
+    try:
+        exponente = abs(float(sp.Abs(sp.N(expr.exp))))
+        base = float(sp.Abs(sp.N(expr.base)))
+        bits = exponente * math.log2(max(base, 2.0))
+    except (TypeError, ValueError, OverflowError):
+        bits = math.inf
+    if not bits <= MAX_BITS_POTENCIA:
+        raise ValueError(f"Potencia demasiado grande en la expresión: {expr}")
+
+
+def a_sympy(texto_mathjs: str) -> str:
+    """
+    Traduce una expresión de math.js (^, multiplicación implícita, e,
+    log10) a texto SymPy.
+
+    El texto llega desde el navegador: antes de interpretarlo se valida
+    contra la lista de símbolos permitidos (validar_mathjs), porque
+    parse_expr ejecuta el código que genera.
+
+    Raises:
+        ValueError: Si la expresión contiene símbolos no permitidos o
+                    potencias numéricas demasiado grandes
+    """
+    validar_mathjs(texto_mathjs)
+    locales = {nombre: simbolo(nombre) for nombre in _VARIABLES_MATHJS}
+    locales.update(_FUNCIONES_MATHJS, pi=sp.pi, e=sp.E)
+
+    def leer():
+        return parse_expr(texto_mathjs, local_dict=locales, global_dict=dict(_GLOBALES_PARSE),
+                          transformations=_TRANSFORMACIONES)
+
+    # Primero sin evaluar (ni las llamadas a funciones), para medir las
+    # potencias antes de que SymPy intente calcularlas
+    with evaluate(False):
+        _verificar_potencias(leer())
+    return str(leer())
+
+
+def _evaluar(texto: str, *args) -> np.ndarray:
+    """
+    Evalúa sobre arreglos; como evaluar() de la página, los valores no
+    finitos (raíces de negativos, log de negativos...) quedan como NaN.
+    """
+    with np.errstate(all="ignore"):
+        valores = compilar_expresion(texto)(*args)
+    return np.where(np.isfinite(valores), valores, np.nan)
+
+
+def usa_suavizado(y_min: str, y_max: str) -> bool:
+    """Criterio de la página para aplicar la sustitución seno en x."""
+    return "sqrt" in y_min + y_max
+
+
+def integrar_navegador(f_sup: str, f_inf: str, x_min: float, x_max: float,
+                       y_min: str, y_max: str, n: int = N_NAVEGADOR) -> float:
+    """
+    integrarMejorado vectorizado.
+
+    Args:
+        f_sup: Superficie superior (texto SymPy)
+        f_inf: Superficie inferior (texto SymPy)
+        x_min: Límite inferior en x
+        x_max: Límite superior en x
+        y_min: y_min(x) (texto SymPy)
+        y_max: y_max(x) (texto SymPy)
+        n: Subintervalos por eje (par; 200 en la página)
+
+    Returns:
+        Volumen tal como lo muestra la página
+    """
+    dx = (x_max - x_min) / n
+    if usa_suavizado(y_min, y_max):
+        t = -1 + (np.arange(n) + 0.5) * 2 / n
+        x = x_min + (x_max - x_min) * (1 + np.sin(np.pi * t / 2)) / 2
+        pesos = dx * np.pi / 2 * np.cos(np.pi * t / 2)
+    else:
+        x = x_min + (np.arange(n) + 0.5) * dx
+        pesos = np.full(n, dx)
+    y1 = np.broadcast_to(_evaluar(y_min, x, np.zeros_like(x)), x.shape)
+    y2 = np.broadcast_to(_evaluar(y_max, x, np.zeros_like(x)), x.shape)
+    # Las columnas sin límites válidos (o vacías) no aportan
+    columnas = np.isfinite(y1) & np.isfinite(y2) & (y1 < y2)
+
+    dy = (y2 - y1) / n
+    j = np.arange(n + 1)
+    coeficientes = np.where(j % 2 == 1, 4.0, 2.0)
+    coeficientes[0] = coeficientes[-1] = 1.0
+    if usa_suavizado(y_min, y_max):
+        s = -1 + 2 * j / n
+        fraccion = (1 + np.sin(np.pi * s / 2)) / 2
+        coeficientes = coeficientes * np.pi / 2 * np.cos(np.pi * s / 2)
+    else:
+        fraccion = j / n
+
+    X = x[:, None]
+    Y = y1[:, None] + fraccion[None, :] * (y2 - y1)[:, None]
+    h = _evaluar(f_sup, X, Y) - _evaluar(f_inf, X, Y)
+    h = np.where(h > 0, h, 0.0)  # NaN > 0 es falso: se descarta igual que null
+
+    integral_y = (h @ coeficientes) * dy / 3
+    return abs(float(np.sum((integral_y * pesos)[columnas])))
+
+
+def integrar_navegador_escalar(f_sup: str, f_inf: str, x_min: float, x_max: float,
+                               y_min: str, y_max: str, n: int = N_NAVEGADOR) -> float:
+    """Traducción línea a línea (punto por punto) de integrarMejorado; referencia de paridad."""
+    def evaluar(texto, x, y=0.0):
+        with np.errstate(all="ignore"):
+            valor = compilar_expresion(texto)(x, y)
+        return valor if math.isfinite(valor) else None
+
+    volumen = 0.0
+    dx = (x_max - x_min) / n
+    suavizar = usa_suavizado(y_min, y_max)
+    for i in range(n):
+        if suavizar:
+            t = -1 + (i + 0.5) * 2 / n
+            x = x_min + (x_max - x_min) * (1 + math.sin(math.pi * t / 2)) / 2
+            peso = dx * math.pi / 2 * math.cos(math.pi * t / 2)
+        else:
+            x = x_min + (i + 0.5) * dx
+            peso = dx
+        y1, y2 = evaluar(y_min, x), evaluar(y_max, x)
+        if y1 is None or y2 is None or y1 >= y2:
+            continue
+        dy = (y2 - y1) / n
+        suma_y = 0.0
+        for j in range(n + 1):
+            coeficiente = 1 if j in (0, n) else (4 if j % 2 == 1 else 2)
+            if suavizar:
+                s = -1 + 2 * j / n
+                y = y1 + (y2 - y1) * (1 + math.sin(math.pi * s / 2)) / 2
+                coeficiente *= math.pi / 2 * math.cos(math.pi * s / 2)
+            else:
+                y = y1 + j * dy
+            z_s, z_i = evaluar(f_sup, x, y), evaluar(f_inf, x, y)
+            if z_s is not None and z_i is not None and z_s - z_i > 0:
+                suma_y += coeficiente * (z_s - z_i)
+        volumen += (suma_y * dy) / 3 * peso
+    return abs(volumen)
+
+
+def _cadena_js(cuerpo: str, campo: str) -> Optional[str]:
+    coincidencia = re.search(rf"\b{campo}:\s*'((?:[^'\\]|\\.)*)'", cuerpo)
+    return coincidencia.group(1).replace("\\\\", "\\") if coincidencia else None
+
+
+def leer_presets_html(ruta: str = HTML_POR_DEFECTO) -> Dict[str, Dict]:
+    """
+    Presets de la página, leídos del objeto `presets` del HTML.
+
+    Returns:
+        Dict clave → {'s', 'i', 'x1', 'x2', 'y1', 'y2' (LaTeX), 'exacto'
+        (float o None)}
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        html = archivo.read()
+    bloque = re.search(r"const presets = \{(.*?)\n\};", html, re.S).group(1)
+
+    presets = {}
+    for clave, cuerpo in re.findall(r"\n    '?([\w-]+)'?:\s*\{(.*?)\n    \}", bloque, re.S):
+        exacto = re.search(r"\bexacto:\s*(.+?),\s*\n", cuerpo).group(1)
+        exacto = exacto.replace("Math.PI", "pi").replace("Math.sqrt", "sqrt")
+        presets[clave] = {
+            **{c: _cadena_js(cuerpo, c) for c in ("s", "i", "x1", "x2", "y1", "y2")},
+            "exacto": None if exacto == "null" else float(sp.sympify(exacto)),
+        }
+    return presets
+
+
+def preparar_preset(preset: Dict) -> Dict:
+    """Argumentos de integrar_navegador para un preset (como los prepara ejecutar())."""
+    return {
+        "f_sup": a_sympy(limpiar_latex(preset["s"])),
+        "f_inf": a_sympy(limpiar_latex(preset["i"])),
+        "x_min": float(sp.sympify(a_sympy(limpiar_latex(preset["x1"])))),
+        "x_max": float(sp.sympify(a_sympy(limpiar_latex(preset["x2"])))),
+        "y_min": a_sympy(limpiar_latex(preset["y1"])),
+        "y_max": a_sympy(limpiar_latex(preset["y2"])),
+    }
+
+
+def tabla_volumenes(presets: Optional[Dict[str, Dict]] = None,
+                    n: int = N_NAVEGADOR) -> Dict:
+    """
+    Volúmenes precalculados que la página puede pedir en lugar de integrar.
+
+    Args:
+        presets: Presets (por defecto, los del HTML)
+        n: Subintervalos por eje
+
+    Returns:
+        Dict con 'metodo', 'n' y 'volumenes' (clave → volumen)
+    """
+    presets = leer_presets_html() if presets is None else presets
+    return {
+        "metodo": f"Punto medio × Simpson 1/3 ({n}×{n}), alturas negativas descartadas",
+        "n": n,
+        "volumenes": {clave: integrar_navegador(**preparar_preset(p), n=n)
+                      for clave, p in presets.items()},
+    }
+
+
+def exportar_tabla(ruta: str, presets: Optional[Dict[str, Dict]] = None,
+                   n: int = N_NAVEGADOR) -> Dict:
+    """Escribe tabla_volumenes en JSON y la devuelve."""
+    tabla = tabla_volumenes(presets, n)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(tabla, archivo, indent=2, ensure_ascii=False)
+    return tabla
+
+
+def verificar_paridad(presets: Optional[Dict[str, Dict]] = None,
+                      n: int = N_NAVEGADOR, tolerancia: float = 1e-10) -> Dict:
+    """
+    Compara, para cada preset, la réplica vectorizada con la traducción
+    punto por punto, con calcular_numerico (mismas expresiones y límites) y
+    con el valor exacto del registro.
+
+    Args:
+        presets: Presets (por defecto, los del HTML)
+        n: Subintervalos por eje
+        tolerancia: Diferencia relativa admitida entre las dos réplicas
+
+    Returns:
+        Dict con 'exito' y, por preset, los volúmenes y diferencias
+        relativas; 'exacto_html_correcto' indica si el valor exacto que
+        muestra la página coincide con el del registro
+    """
+    from analizador_matematico import AnalizadorMatematico, BibliotecaSolidos
+
+    presets = leer_presets_html() if presets is None else presets
+    analizador = AnalizadorMatematico()
+    biblioteca = BibliotecaSolidos()
+
+    def relativa(a, b):
+        return abs(a - b) / max(abs(b), 1e-300)
+
+    filas = {}
+    for clave, preset in presets.items():
+        argumentos = preparar_preset(preset)
+        vectorizado = integrar_navegador(**argumentos, n=n)
+        escalar = integrar_navegador_escalar(**argumentos, n=n)
+        numerico = analizador.calcular_numerico(
+            argumentos["f_sup"], argumentos["f_inf"],
+            (argumentos["x_min"], argumentos["x_max"]),
+            (argumentos["y_min"], argumentos["y_max"])
+        )["volumen"]
+
+        fila = {
+            "navegador": vectorizado,
+            "escalar": escalar,
+            "paridad": relativa(vectorizado, escalar) <= tolerancia,
+            "calcular_numerico": numerico,
+            "diferencia_numerico": relativa(vectorizado, numerico),
+            "exacto_html": preset["exacto"],
+        }
+        if clave in CLAVES_REGISTRO:
+            espec = biblioteca.obtener(CLAVES_REGISTRO[clave])
+            exacto = biblioteca.analizar_exacto(espec)["valor_numerico"]
+            fila["exacto"] = exacto
+            fila["error_navegador"] = relativa(vectorizado, exacto)
+            if preset["exacto"] is not None:
+                fila["exacto_html_correcto"] = relativa(preset["exacto"], exacto) < 1e-9
+        filas[clave] = fila
+
+    return {
+        "exito": all(f["paridad"] and f.get("exacto_html_correcto", True)
+                     for f in filas.values()),
+        "n": n,
+        "presets": filas,
+    }
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Réplica del integrador de la aplicación web")
+    parser.add_argument("--exportar", metavar="RUTA",
+                        help="Escribe la tabla de volúmenes de los presets en JSON")
+    parser.add_argument("-n", type=int, default=N_NAVEGADOR, help="Subintervalos por eje")
+    args = parser.parse_args(argv)
+
+    if args.exportar:
+        tabla = exportar_tabla(args.exportar, n=args.n)
+        print(f"Tabla con {len(tabla['volumenes'])} volúmenes escrita en {args.exportar}")
+        return 0
+
+    informe = verificar_paridad(n=args.n)
+    print(f"{'preset':<16}{'navegador':>14}{'escalar':>14}{'numérico':>14}"
+          f"{'exacto':>14}{'err. nav.':>11}  html")
+    for clave, fila in informe["presets"].items():
+        exacto = fila.get("exacto")
+        print(f"{clave:<16}{fila['navegador']:>14.8f}{fila['escalar']:>14.8f}"
+              f"{fila['calcular_numerico']:>14.8f}"
+              f"{'-' if exacto is None else format(exacto, '.8f'):>14}"
+              f"{fila.get('error_navegador', float('nan')):>11.2e}  "
+              f"{'ok' if fila.get('exacto_html_correcto', True) else 'EXACTO INCORRECTO'}"
+              f"{'' if fila['paridad'] else '  SIN PARIDAD'}")
+    return 0 if informe["exito"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
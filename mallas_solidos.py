@@ -0,0 +1,317 @@
+"""
+Mallas de Superficies de Sólidos y Formato Binario
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Genera las superficies superior e inferior de un sólido sobre una malla
+ajustada a la región de tipo I (para cada x, y recorre exactamente
+[y_min(x), y_max(x)], sin escalones en el borde) y la pared lateral a lo
+largo del contorno. Las mallas se guardan como arreglos Float32 contiguos
+en dos formatos que leen el reporte PDF, la aplicación web y herramientas
+externas sin recalcular:
+
+- .npz comprimido (np.savez_compressed).
+- Binario plano para mapear en memoria (np.memmap, Float32Array):
+
+      8 bytes   b"UCSGMSH1"
+      uint32    longitud H de la cabecera (little-endian)
+      H bytes   cabecera JSON: {"version": 1, "mallas": [{"resolucion": [nx, nt],
+                "meta": {...}, "arreglos": {nombre: {"offset", "forma"}}}]}
+      ...       arreglos float32 little-endian, alineados a 64 bytes
+
+Un archivo puede contener varios niveles de detalle (de menor a mayor
+resolución).
+
+Uso:
+    python mallas_solidos.py Hemisferio hemisferio.npz [--niveles 16 32 64 128]
+"""
+
+import json
+import struct
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from expresiones_compiladas import como_funcion
+
+
+MAGIA = b"UCSGMSH1"
+VERSION_FORMATO = 1
+ALINEACION = 64
+
+# Resoluciones por defecto de los niveles de detalle (puntos por eje)
+NIVELES_DETALLE = (16, 32, 64, 128)
+
+ARREGLOS = ("X", "Y", "z_sup", "z_inf", "borde_x", "borde_y", "borde_z_sup", "borde_z_inf")
+
+
+@dataclass
+class MallaSolido:
+    """
+    Superficies de un sólido sobre una malla ajustada a la región.
+
+    X, Y, z_sup y z_inf tienen forma (nx, nt): la fila i corresponde a
+    x_i y la columna j a y = y_min(x_i) + t_j·(y_max(x_i) - y_min(x_i)).
+    Los puntos donde una superficie no está definida valen NaN. La pared
+    lateral es la superficie reglada entre borde_z_inf y borde_z_sup a lo
+    largo del contorno cerrado (borde_x, borde_y).
+    """
+    X: np.ndarray
+    Y: np.ndarray
+    z_sup: np.ndarray
+    z_inf: np.ndarray
+    borde_x: np.ndarray
+    borde_y: np.ndarray
+    borde_z_sup: np.ndarray
+    borde_z_inf: np.ndarray
+    meta: Dict = field(default_factory=dict)
+
+    @property
+    def resolucion(self) -> Tuple[int, int]:
+        return tuple(self.X.shape)
+
+    def arreglos(self) -> Dict[str, np.ndarray]:
+        return {nombre: getattr(self, nombre) for nombre in ARREGLOS}
+
+    def pared(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pared lateral como malla (2, k) lista para plot_surface o Plotly."""
+        return (np.vstack([self.borde_x, self.borde_x]),
+                np.vstack([self.borde_y, self.borde_y]),
+                np.vstack([self.borde_z_inf, self.borde_z_sup]))
+
+
+def evaluar_en_malla(func, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    """Evalúa func sobre la malla completa; NaN donde no está definida."""
+    with np.errstate(all='ignore'):
+        try:
+            Z = np.array(np.broadcast_to(func(X, Y), X.shape), dtype=float)
+        except Exception:
+            # Funciones escalares (p. ej. lambdas con math.sqrt)
+            def punto(x, y):
+                try:
+                    return float(func(x, y))
+                except Exception:
+                    return np.nan
+            Z = np.vectorize(punto, otypes=[float])(X, Y)
+    Z[~np.isfinite(Z)] = np.nan
+    return Z
+
+
+def _limite(valor):
+    """Límite en y como función de x (acepta constantes, texto e invocables)."""
+    funcion = como_funcion(valor, ("x",))
+    return lambda x, y: funcion(x)
+
+
+def generar_malla(f_sup, f_inf, x_lims: Tuple, y_lims: Tuple,
+                  nx: int = 50, nt: Optional[int] = None) -> MallaSolido:
+    """
+    Superficies y pared lateral del sólido, recortadas a la región.
+
+    Args:
+        f_sup: Superficie superior (texto SymPy o invocable f(x, y))
+        f_inf: Superficie inferior
+        x_lims: Tupla (x_min, x_max) numérica o en texto
+        y_lims: Tupla (y_min(x), y_max(x)) en texto, constantes o invocables
+        nx: Puntos en x
+        nt: Puntos en y por columna (por defecto, nx)
+
+    Returns:
+        MallaSolido con arreglos Float32 contiguos
+
+    Raises:
+        ValueError: Si nx o nt es menor que 2 (el contorno necesita los dos
+                    extremos de cada dirección)
+    """
+    nt = nx if nt is None else nt
+    if nx < 2 or nt < 2:
+        raise ValueError(f"Se necesitan al menos 2 puntos por dirección (nx={nx}, nt={nt})")
+    x_min, x_max = (float(como_funcion(v, ())()) if isinstance(v, str) else float(v)
+                    for v in x_lims)
+    x = np.linspace(x_min, x_max, nx)
+    t = np.linspace(0.0, 1.0, nt)
+
+    ceros = np.zeros_like(x)
+    y_min = evaluar_en_malla(_limite(y_lims[0]), x, ceros)
+    y_max = evaluar_en_malla(_limite(y_lims[1]), x, ceros)
+    # Columnas vacías o indefinidas (y_min > y_max) no forman parte de la región
+    vacias = ~(y_min <= y_max)
+    y_min[vacias] = y_max[vacias] = np.nan
+
+    X = np.repeat(x[:, None], nt, axis=1)
+    Y = y_min[:, None] + t[None, :] * (y_max - y_min)[:, None]
+    z_sup = evaluar_en_malla(como_funcion(f_sup), X, Y)
+    z_inf = evaluar_en_malla(como_funcion(f_inf), X, Y)
+
+    # Contorno cerrado: y_min(x) hacia la derecha, lado x_max, y_max(x) de
+    # vuelta y lado x_min
+    filas = np.concatenate([np.arange(nx), np.full(nt - 2, nx - 1),
+                            np.arange(nx - 1, -1, -1), np.zeros(nt - 1, dtype=int)])
+    columnas = np.concatenate([np.zeros(nx, dtype=int), np.arange(1, nt - 1),
+                               np.full(nx, nt - 1), np.arange(nt - 2, -1, -1)])
+
+    def f32(a):
+        return np.ascontiguousarray(a, dtype="<f4")
+
+    return MallaSolido(
+        X=f32(X), Y=f32(Y), z_sup=f32(z_sup), z_inf=f32(z_inf),
+        borde_x=f32(X[filas, columnas]), borde_y=f32(Y[filas, columnas]),
+        borde_z_sup=f32(z_sup[filas, columnas]), borde_z_inf=f32(z_inf[filas, columnas]),
+        meta={"superficie_superior": str(f_sup), "superficie_inferior": str(f_inf),
+              "x_lims": [x_min, x_max], "y_lims": [str(v) for v in y_lims]},
+    )
+
+
+def generar_niveles(f_sup, f_inf, x_lims: Tuple, y_lims: Tuple,
+                    resoluciones: Sequence[int] = NIVELES_DETALLE) -> List[MallaSolido]:
+    """Una malla por nivel de detalle, de menor a mayor resolución."""
+    return [generar_malla(f_sup, f_inf, x_lims, y_lims, n) for n in sorted(resoluciones)]
+
+
+def malla_de_especificacion(espec, nx: int = 50) -> MallaSolido:
+    """Malla de un EspecificacionSolido sobre su región de tipo I."""
+    malla = generar_malla(espec.superficie_superior, espec.superficie_inferior,
+                          espec.x_lims, espec.y_lims, nx)
+    malla.meta["nombre"] = espec.nombre
+    return malla
+
+
+def nivel_para(mallas: Sequence[MallaSolido], resolucion: int) -> MallaSolido:
+    """El nivel de detalle más pequeño con al menos resolucion puntos en x (o el mayor)."""
+    for malla in sorted(mallas, key=lambda m: m.resolucion[0]):
+        if malla.resolucion[0] >= resolucion:
+            return malla
+    return max(mallas, key=lambda m: m.resolucion[0])
+
+
+def _alinear(n: int) -> int:
+    return -(-n // ALINEACION) * ALINEACION
+
+
+def a_bytes(mallas) -> bytes:
+    """
+    Serializa una o varias mallas en el formato binario plano.
+
+    Args:
+        mallas: MallaSolido o lista de niveles de detalle
+
+    Returns:
+        Contenido del archivo
+    """
+    mallas = [mallas] if isinstance(mallas, MallaSolido) else list(mallas)
+    # Los offsets dependen de la longitud de la cabecera, y viceversa: se
+    # recalcula hasta que el inicio de los datos no cambia
+    offsets_base, texto = 0, b""
+    while offsets_base != _alinear(len(MAGIA) + 4 + len(texto)) or not texto:
+        offsets_base = _alinear(len(MAGIA) + 4 + len(texto))
+        cabecera, posicion = {"version": VERSION_FORMATO, "mallas": []}, offsets_base
+        for malla in mallas:
+            descriptor = {"resolucion": list(malla.resolucion), "meta": malla.meta, "arreglos": {}}
+            for nombre, arreglo in malla.arreglos().items():
+                descriptor["arreglos"][nombre] = {"offset": posicion, "forma": list(arreglo.shape)}
+                posicion = _alinear(posicion + arreglo.nbytes)
+            cabecera["mallas"].append(descriptor)
+        texto = json.dumps(cabecera, separators=(",", ":")).encode("utf-8")
+
+    partes = bytearray(MAGIA + struct.pack("<I", len(texto)) + texto)
+    for malla in mallas:
+        for arreglo in malla.arreglos().values():
+            partes.extend(b"\0" * (_alinear(len(partes)) - len(partes)))
+            partes.extend(np.ascontiguousarray(arreglo, dtype="<f4").tobytes())
+    return bytes(partes)
+
+
+def _desde_buffer(buffer, cabecera: Dict) -> List[MallaSolido]:
+    mallas = []
+    for descriptor in cabecera["mallas"]:
+        arreglos = {
+            nombre: np.frombuffer(buffer, dtype="<f4", count=int(np.prod(d["forma"])),
+                                  offset=d["offset"]).reshape(d["forma"])
+            for nombre, d in descriptor["arreglos"].items()
+        }
+        mallas.append(MallaSolido(**arreglos, meta=descriptor.get("meta", {})))
+    return mallas
+
+
+def _leer_cabecera(buffer) -> Dict:
+    if bytes(buffer[:len(MAGIA)]) != MAGIA:
+        raise ValueError("No es un archivo de mallas UCSG (firma incorrecta)")
+    longitud, = struct.unpack("<I", bytes(buffer[len(MAGIA):len(MAGIA) + 4]))
+    cabecera = json.loads(bytes(buffer[len(MAGIA) + 4:len(MAGIA) + 4 + longitud]))
+    if cabecera.get("version") != VERSION_FORMATO:
+        raise ValueError(f"Versión de formato de mallas no soportada: {cabecera.get('version')}")
+    return cabecera
+
+
+def desde_bytes(datos: bytes) -> List[MallaSolido]:
+    """Mallas contenidas en el formato binario plano (sin copiar los datos)."""
+    return _desde_buffer(datos, _leer_cabecera(datos))
+
+
+def guardar(ruta: str, mallas):
+    """
+    Guarda una o varias mallas; el formato se elige por la extensión
+    (.npz comprimido, cualquier otra: binario plano mapeable).
+    """
+    mallas = [mallas] if isinstance(mallas, MallaSolido) else list(mallas)
+    if ruta.endswith(".npz"):
+        contenido = {"cabecera": np.frombuffer(json.dumps(
+            {"version": VERSION_FORMATO, "mallas": [m.meta for m in mallas]}
+        ).encode("utf-8"), dtype=np.uint8)}
+        for i, malla in enumerate(mallas):
+            contenido.update({f"{i}/{nombre}": a for nombre, a in malla.arreglos().items()})
+        np.savez_compressed(ruta, **contenido)
+        return
+    with open(ruta, "wb") as archivo:
+        archivo.write(a_bytes(mallas))
+
+
+def cargar(ruta: str, mmap: bool = True) -> List[MallaSolido]:
+    """
+    Carga las mallas de un archivo .npz o binario plano.
+
+    Args:
+        ruta: Archivo
+        mmap: Mapear el binario plano en memoria (los arreglos se leen del
+              disco al usarse)
+
+    Returns:
+        Lista de MallaSolido (niveles de detalle)
+    """
+    if ruta.endswith(".npz"):
+        with np.load(ruta) as datos:
+            metas = json.loads(datos["cabecera"].tobytes())["mallas"]
+            return [MallaSolido(**{n: datos[f"{i}/{n}"] for n in ARREGLOS}, meta=meta)
+                    for i, meta in enumerate(metas)]
+    if mmap:
+        buffer = np.memmap(ruta, dtype=np.uint8, mode="r")
+        return _desde_buffer(buffer, _leer_cabecera(buffer))
+    with open(ruta, "rb") as archivo:
+        return desde_bytes(archivo.read())
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exporta las mallas (niveles de detalle) de un sólido del registro")
+    parser.add_argument("solido", help="Nombre o clave del sólido")
+    parser.add_argument("salida", help="Archivo de salida (.npz comprimido o binario plano)")
+    parser.add_argument("--niveles", type=int, nargs="+", default=list(NIVELES_DETALLE),
+                        help="Puntos por eje de cada nivel de detalle")
+    args = parser.parse_args(argv)
+
+    from especificacion_solidos import registro_predefinido
+    espec = registro_predefinido().obtener(args.solido)
+    mallas = generar_niveles(espec.superficie_superior, espec.superficie_inferior,
+                             espec.x_lims, espec.y_lims, args.niveles)
+    for malla in mallas:
+        malla.meta["nombre"] = espec.nombre
+    guardar(args.salida, mallas)
+    print(f"{len(mallas)} niveles de detalle de '{espec.nombre}' guardados en {args.salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""
+Regiones de Integración con Tablas Memorizadas
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Muchas consultas comparten la región (x_lims y límites en y) y la
+superficie inferior y cambian solo la superior, o al revés. Para cada orden
+de la regla producto, RegionIntegracion calcula una vez los nodos (X, Y) y
+los pesos de cada dirección, que ya incluyen el ancho del intervalo
+interno y los jacobianos; un integrando nuevo se reduce a evaluarlo en los
+nodos y a un producto punto ponderado, w_x · H · w_y. Las tablas y las
+superficies evaluadas se guardan en una caché LRU acotada en bytes,
+compartida por todas las regiones y todos los hilos (los arreglos son de
+solo lectura):
+
+    region = RegionIntegracion((-2, 2), ("-sqrt(4 - x**2)", "sqrt(4 - x**2)"))
+    region.integrar("8 - x**2 - y**2", "x**2 + y**2")["volumen"]
+    region.integrar("8 - x**2 - y**2", "0")   # reutiliza nodos, pesos y 8 - x² - y²
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from cuadratura_vectorizada import (
+    ORDEN_MAXIMO, REGLAS_1D, SUSTITUCIONES, _mapear, _refinar_producto, evaluar_vectorizado,
+    seguir_refinamiento
+)
+from expresiones_compiladas import CacheLRU, ExpresionCompilada, compilar_expresion
+
+# Memoria máxima de tablas y superficies evaluadas (todas las regiones)
+MAX_BYTES_POR_DEFECTO = 256 * 2**20
+
+
+class _CacheBytes(CacheLRU):
+    """CacheLRU acotada por los bytes de los arreglos guardados, no por entradas."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(max_bytes)
+        self.bytes = 0
+        self._tamanos = {}
+
+    def guardar(self, clave, valor):
+        tamano = sum(a.nbytes for a in valor)
+        with self._lock:
+            if tamano > self.capacidad:
+                # Una tabla mayor que toda la caché desalojaría todo lo demás
+                return
+            if clave in self._datos:
+                self.bytes -= self._tamanos[clave]
+            self._datos[clave] = valor
+            self._tamanos[clave] = tamano
+            self.bytes += tamano
+            self._datos.move_to_end(clave)
+            self._desalojar()
+
+    def redimensionar(self, max_bytes: int):
+        with self._lock:
+            self.capacidad = max_bytes
+            self._desalojar()
+
+    def _desalojar(self):
+        while self.bytes > self.capacidad:
+            antigua, _ = self._datos.popitem(last=False)
+            self.bytes -= self._tamanos.pop(antigua)
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self._tamanos.clear()
+            self.bytes = 0
+            self.aciertos = self.fallos = 0
+
+
+_TABLAS = _CacheBytes(MAX_BYTES_POR_DEFECTO)
+
+
+def _clave_expresion(expr, variables: Tuple[str, ...]) -> Optional[str]:
+    """Forma canónica de una expresión; None para invocables (sin clave estable)."""
+    if isinstance(expr, ExpresionCompilada):
+        return expr.texto_canonico
+    if isinstance(expr, (str, int, float)):
+        return compilar_expresion(str(expr), variables).texto_canonico
+    return None
+
+
+class RegionIntegracion:
+    """
+    Región de tipo I con nodos, límites internos y pesos memorizados.
+
+    Dos objetos con los mismos límites, regla y transformación comparten
+    las tablas de la caché, de modo que crear la región en cada consulta
+    no cuesta más que reutilizar la misma instancia.
+    """
+
+    def __init__(self, x_lims: Tuple, y_lims: Tuple, regla: str = "gauss_legendre",
+                 transformacion=None):
+        """
+        Args:
+            x_lims: Tupla (x_min, x_max)
+            y_lims: Tupla (y_min(x), y_max(x)) como strings o ExpresionCompilada
+            regla: 'gauss_legendre' o 'clenshaw_curtis'
+            transformacion: None, 'seno' o 'tanh_sinh' (en ambas variables) o
+                            una tupla (en_x, en_y); ver transformar_region
+
+        Raises:
+            ValueError: Si la regla o la transformación no existen, o si los
+                        límites en y son funciones de Python
+        """
+        if regla not in REGLAS_1D:
+            raise ValueError(f"Regla '{regla}' no soportada: use {sorted(REGLAS_1D)}")
+        if transformacion is None or isinstance(transformacion, str):
+            transformacion = (transformacion or "ninguna",) * 2
+        for sustitucion in transformacion:
+            if sustitucion not in SUSTITUCIONES:
+                raise ValueError(
+                    f"Transformación '{sustitucion}' no soportada: use {sorted(SUSTITUCIONES)}"
+                )
+        claves_y = tuple(_clave_expresion(v, ("x",)) for v in y_lims)
+        if None in claves_y:
+            raise ValueError("Los límites en y deben ser expresiones (strings) para memorizar la región")
+
+        self.x_lims = (float(x_lims[0]), float(x_lims[1]))
+        self.y_lims = tuple(v if isinstance(v, ExpresionCompilada)
+                            else compilar_expresion(str(v), ("x",)) for v in y_lims)
+        self.regla = regla
+        self.transformacion = tuple(transformacion)
+        self.clave = (self.x_lims, claves_y, regla, self.transformacion)
+
+    def tabla(self, n_x: int, n_y: int) -> Tuple[np.ndarray, ...]:
+        """
+        Nodos y pesos de la regla producto n_x × n_y (memorizados).
+
+        Returns:
+            Tupla (X, Y, pesos_x, pesos_y) de solo lectura: X con forma
+            (n_x, 1) e Y con forma (n_x, n_y); la integral de h es
+            pesos_x @ h(X, Y) @ pesos_y
+        """
+        clave = ("tabla", self.clave, n_x, n_y)
+        tabla = _TABLAS.obtener(clave)
+        if tabla is None:
+            tabla = self._construir_tabla(n_x, n_y)
+            _TABLAS.guardar(clave, tabla)
+        return tabla
+
+    def _construir_tabla(self, n_x: int, n_y: int) -> Tuple[np.ndarray, ...]:
+        reglas = REGLAS_1D[self.regla]
+        tx, wx = reglas(n_x)
+        ty, wy = reglas(n_y)
+        en_x, en_y = self.transformacion
+
+        xs, jacobiano_x = _mapear(self.x_lims[0], self.x_lims[1], tx, en_x)
+        # Límites internos, evaluados una sola vez para todos los nodos x
+        y_min = evaluar_vectorizado(self.y_lims[0], xs)
+        y_max = evaluar_vectorizado(self.y_lims[1], xs)
+        Y, _ = _mapear(y_min[:, None], y_max[:, None], ty[None, :], en_y)
+
+        # El jacobiano en y es (y_max - y_min)·du/ds: separable en x y en s
+        X = xs[:, None]
+        pesos_x = wx * jacobiano_x * (y_max - y_min)
+        pesos_y = wy * SUSTITUCIONES[en_y](ty)[2]
+        for arreglo in (X, Y, pesos_x, pesos_y):
+            arreglo.setflags(write=False)
+        return X, Y, pesos_x, pesos_y
+
+    def valores(self, superficie, n_x: int, n_y: int) -> Tuple[np.ndarray, bool]:
+        """
+        Superficie evaluada en los nodos de la tabla n_x × n_y.
+
+        Las expresiones (strings o ExpresionCompilada) se memorizan por su
+        forma canónica; las funciones de Python se evalúan cada vez.
+
+        Returns:
+            Tupla (valores, memorizado) donde memorizado indica que no hubo
+            que evaluar la superficie
+        """
+        X, Y = self.tabla(n_x, n_y)[:2]
+        clave_superficie = _clave_expresion(superficie, ("x", "y"))
+        if clave_superficie is None:
+            return evaluar_vectorizado(superficie, X, Y), False
+
+        clave = ("superficie", self.clave, n_x, n_y, clave_superficie)
+        guardado = _TABLAS.obtener(clave)
+        if guardado is not None:
+            return guardado[0], True
+        funcion = superficie if isinstance(superficie, ExpresionCompilada) \
+            else compilar_expresion(str(superficie))
+        if funcion.expr.free_symbols:
+            valores = evaluar_vectorizado(funcion, X, Y)
+        else:
+            # Superficie constante (p. ej. z = 0): un escalar basta
+            valores = evaluar_vectorizado(funcion, np.zeros(()), np.zeros(()))
+        valores.setflags(write=False)
+        _TABLAS.guardar(clave, (valores,))
+        return valores, False
+
+    def refinar(self, f_sup, f_inf=0.0, epsabs: float = 1e-8, epsrel: float = 1e-8,
+                orden_inicial: int = 16, orden_maximo: int = ORDEN_MAXIMO,
+                tiempo_limite: Optional[float] = None,
+                max_nodos: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Estimaciones sucesivas con el mismo refinamiento (y los mismos
+        controles de presupuesto) que refinar_tensorial.
+
+        Yields:
+            Dict como refinar_tensorial; 'nodos' cuenta los puntos donde
+            hubo que evaluar alguna superficie y 'nodos_memorizados' aquellos
+            cuyas dos superficies vinieron de la caché
+        """
+        estado = {"nodos": 0, "evaluaciones": 0, "nodos_memorizados": 0}
+
+        def estimar(n_x, n_y):
+            _, _, pesos_x, pesos_y = self.tabla(n_x, n_y)
+            superior, memorizada_sup = self.valores(f_sup, n_x, n_y)
+            inferior, memorizada_inf = self.valores(f_inf, n_x, n_y)
+            estado["evaluaciones"] += (not memorizada_sup) + (not memorizada_inf)
+            estado["nodos_memorizados" if memorizada_sup and memorizada_inf else "nodos"] += n_x * n_y
+            return float(pesos_x @ ((superior - inferior) @ pesos_y))
+
+        return _refinar_producto(estimar, estado, epsabs, epsrel, orden_inicial, orden_maximo,
+                                 tiempo_limite, max_nodos)
+
+    def integrar(self, f_sup, f_inf=0.0, epsabs: float = 1e-8, epsrel: float = 1e-8,
+                 orden_inicial: int = 16, orden_maximo: int = ORDEN_MAXIMO,
+                 tiempo_limite: Optional[float] = None,
+                 max_nodos: Optional[int] = None,
+                 al_progresar: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Integra h = f - g sobre la región.
+
+        Args:
+            f_sup: Superficie superior (string, ExpresionCompilada o función f(x,y))
+            f_inf: Superficie inferior (igual que f_sup)
+            epsabs: Tolerancia absoluta
+            epsrel: Tolerancia relativa
+            orden_inicial: Nodos por dirección en la primera estimación
+            orden_maximo: Máximo de nodos por dirección
+            tiempo_limite: Segundos disponibles
+            max_nodos: Nodos evaluados disponibles
+            al_progresar: Función llamada con cada estimación intermedia
+
+        Returns:
+            Dict como integrar_tensorial, con 'nodos_memorizados'
+        """
+        pasos = self.refinar(f_sup, f_inf, epsabs, epsrel, orden_inicial, orden_maximo,
+                             tiempo_limite, max_nodos)
+        return seguir_refinamiento(pasos, epsabs, epsrel, tiempo_limite, max_nodos, al_progresar)
+
+    def __repr__(self):
+        textos = tuple(v.texto for v in self.y_lims)
+        return (f"RegionIntegracion(x_lims={self.x_lims}, y_lims={textos}, "
+                f"regla={self.regla!r}, transformacion={self.transformacion})")
+
+
+def configurar_cache_regiones(max_bytes: int):
+    """Cambia la memoria máxima de la caché (desaloja lo que sobre)."""
+    _TABLAS.redimensionar(max_bytes)
+
+
+def estadisticas_regiones() -> Dict:
+    """Ocupación y tasa de aciertos de la caché de tablas y superficies."""
+    consultas = _TABLAS.aciertos + _TABLAS.fallos
+    return {
+        "entradas": len(_TABLAS),
+        "bytes": _TABLAS.bytes,
+        "max_bytes": _TABLAS.capacidad,
+        "aciertos": _TABLAS.aciertos,
+        "fallos": _TABLAS.fallos,
+        "tasa_aciertos": _TABLAS.aciertos / consultas if consultas else 0.0,
+    }
+
+
+def limpiar_cache_regiones():
+    """Vacía la caché de tablas y superficies."""
+    _TABLAS.limpiar()
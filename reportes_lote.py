@@ -0,0 +1,139 @@
+"""
+Generación de Reportes PDF por Lotes
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Un único pool de procesos de larga vida analiza los sólidos (cada sólido
+distinto una sola vez) y luego escribe los PDF en paralelo. Cada proceso
+arranca con matplotlib, las fuentes, mathtext y los estilos ya cargados, y
+conserva sus cachés (fórmulas, gráficas 3D, expresiones) entre reportes.
+"""
+
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from especificacion_solidos import EspecificacionSolido
+
+
+def _iniciar_trabajador():
+    """Precalienta matplotlib (fuentes, mathtext, ejes 3D) y los estilos."""
+    import matplotlib.pyplot as plt
+    from generador_pdf_profesional import GeneradorReporteProfesionalUCSG
+
+    fig = plt.figure(figsize=(2, 2))
+    ax = fig.add_subplot(111, projection='3d')
+    ax.set_title(r'$\iint_R x^2 \, dA$', family='serif')
+    fig.canvas.draw()
+    plt.close(fig)
+    GeneradorReporteProfesionalUCSG._hoja_estilos()
+
+
+def _tarea_analisis(espec: EspecificacionSolido) -> Dict:
+    from ejecucion_paralela import tarea_completa
+    inicio = time.perf_counter()
+    resultado = tarea_completa(espec)
+    return {"resultado": resultado, "analisis_s": time.perf_counter() - inicio}
+
+
+def _tarea_reporte(espec: EspecificacionSolido, resultado: Dict, archivo: str,
+                   autores: str, resolucion: int, modo_formulas: str) -> Dict:
+    from generador_pdf_profesional import construir_reporte
+    tiempos = construir_reporte(espec, resultado, archivo, autores,
+                                resolucion, modo_formulas)
+    tiempos["proceso"] = os.getpid()
+    return tiempos
+
+
+def _base_archivo(espec: EspecificacionSolido) -> str:
+    """Clave del registro (como generar_reporte_profesional) o el nombre saneado."""
+    if espec.clave:
+        return espec.clave
+    ascii_ = unicodedata.normalize("NFKD", espec.nombre).encode("ascii", "ignore")
+    return re.sub(r"[^A-Za-z0-9]+", "_", ascii_.decode()).strip("_") or "Solido"
+
+
+def _nombres_archivo(especificaciones: Sequence[EspecificacionSolido],
+                     directorio: str) -> List[str]:
+    """Un archivo por reporte; los sólidos repetidos llevan un sufijo."""
+    vistos: Dict[str, int] = {}
+    archivos = []
+    for espec in especificaciones:
+        base = _base_archivo(espec)
+        n = vistos.get(base, 0)
+        vistos[base] = n + 1
+        sufijo = f"_{n + 1}" if n else ""
+        archivos.append(os.path.join(
+            directorio, f"Reporte_Profesional_{base}{sufijo}_UCSG.pdf"
+        ))
+    return archivos
+
+
+def generar_reportes_lote(solidos: Sequence, autores: str = "Equipo UCSG",
+                          directorio: str = ".", max_workers: Optional[int] = None,
+                          resolucion: int = 100, modo_formulas: str = "png") -> Dict:
+    """
+    Genera un reporte PDF por sólido con un pool de procesos compartido.
+
+    Args:
+        solidos: EspecificacionSolido o nombres/claves de sólidos registrados
+                 (pueden repetirse)
+        autores: Autores que aparecen en el encabezado
+        directorio: Carpeta de salida (se crea si no existe)
+        max_workers: Procesos del pool (por defecto, núcleos disponibles)
+        resolucion: Puntos por eje de la malla de la gráfica 3D
+        modo_formulas: 'png' o 'vectorial'
+
+    Returns:
+        Dict con 'archivos' (en el orden de solidos), 'tiempos' (reloj de
+        cada etapa), 'etapas' (tiempo acumulado en los procesos por etapa),
+        'por_reporte' y 'reportes_por_segundo'
+    """
+    from analizador_matematico import BibliotecaSolidos
+
+    inicio = time.perf_counter()
+    biblioteca = BibliotecaSolidos()
+    especificaciones = [biblioteca.obtener(s) if isinstance(s, str) else s for s in solidos]
+    unicos = list(dict.fromkeys(especificaciones))
+    archivos = _nombres_archivo(especificaciones, directorio)
+    os.makedirs(directorio, exist_ok=True)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_iniciar_trabajador) as pool:
+        # Etapa 1: cada sólido distinto se analiza una sola vez
+        analisis = [f.result() for f in [pool.submit(_tarea_analisis, e) for e in unicos]]
+        por_solido = {e: a["resultado"] for e, a in zip(unicos, analisis)}
+        fin_analisis = time.perf_counter()
+
+        # Etapa 2: figuras y PDF en los mismos procesos, ya calientes
+        futuros = [
+            pool.submit(_tarea_reporte, espec, por_solido[espec], archivo,
+                        autores, resolucion, modo_formulas)
+            for espec, archivo in zip(especificaciones, archivos)
+        ]
+        por_reporte = [f.result() for f in futuros]
+
+    fin = time.perf_counter()
+    return {
+        "archivos": archivos,
+        "tiempos": {
+            "analisis_s": fin_analisis - inicio,
+            "reportes_s": fin - fin_analisis,
+            "total_s": fin - inicio,
+        },
+        "etapas": {
+            "analisis_s": sum(a["analisis_s"] for a in analisis),
+            "formulas_s": sum(r["formulas_s"] for r in por_reporte),
+            "grafica_s": sum(r["grafica_s"] for r in por_reporte),
+            "pdf_s": sum(r["pdf_s"] for r in por_reporte),
+        },
+        "por_reporte": por_reporte,
+        "solidos_distintos": len(unicos),
+        "procesos": max_workers,
+        "reportes_por_segundo": len(archivos) / (fin - inicio) if fin > inicio else 0.0,
+    }
@@ -0,0 +1,445 @@
+"""
+Servidor Local de Cálculo para la Aplicación Web
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Expone AnalizadorMatematico por HTTP (asyncio, sin dependencias externas)
+para que app_ucsg_final.html no tenga que integrar ni mallar en JavaScript:
+
+    POST /volumen   {f_sup, f_inf, x_lims, y_lims, metodo?,
+                     epsabs?, epsrel?, tiempo_limite?,
+                     transformacion?}                        → JSON
+    POST /exacto    {f_sup, f_inf, x_lims, y_lims}           → JSON
+    POST /malla     {f_sup, f_inf, x_lims, y_lims, n?, niveles?} → binario Float32
+    GET  /tabla                                              → volúmenes de los presets
+    GET  /estado                                             → cachés y peticiones en curso
+
+Las expresiones llegan en sintaxis de math.js (la que produce cleanLatex) o
+de SymPy. Los resultados se guardan en una caché LRU indexada por la forma
+canónica de las expresiones, y las peticiones idénticas que llegan mientras
+otra se calcula esperan a esa misma (no se calculan dos veces). El cálculo
+corre en un pool de procesos, fuera del bucle de eventos; la integral
+simbólica de /exacto tiene plazo (si vence, responde el respaldo numérico).
+
+Las mallas se envían en el formato binario plano de mallas_solidos
+(cabecera JSON y arreglos Float32 alineados), con un nivel de detalle o
+varios.
+
+Solo la página abierta como archivo (Origin: null) y los orígenes dados con
+--origen reciben permiso CORS; los POST deben ser application/json y las
+expresiones se validan contra una lista de símbolos permitidos antes de
+interpretarlas.
+
+Uso:
+    python servidor_calculo.py [--puerto 8765] [--origen http://localhost:8000]
+"""
+
+import asyncio
+import functools
+import json
+import math
+import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from analizador_matematico import METODOS_NUMERICOS
+from carga_perezosa import modulo_perezoso
+from cuadratura_vectorizada import SUSTITUCIONES
+from expresiones_compiladas import CacheLRU, compilar_expresion
+
+sp = modulo_perezoso("sympy")
+
+
+HOST_POR_DEFECTO = "127.0.0.1"
+PUERTO_POR_DEFECTO = 8765
+
+# La página se abre como archivo local: los navegadores envían Origin: null
+ORIGENES_POR_DEFECTO = ("null",)
+
+# Tamaño máximo del cuerpo de una petición (las consultas son unos cientos de bytes)
+MAX_CUERPO = 64 * 1024
+
+# Puntos por eje de la malla de la gráfica 3D (los mismos que la página)
+N_MALLA = 50
+MAX_N_MALLA = 400
+
+_ANALIZADOR = None
+
+
+def _analizador():
+    """Un AnalizadorMatematico por proceso (sus cachés se reutilizan entre tareas)."""
+    global _ANALIZADOR
+    if _ANALIZADOR is None:
+        from analizador_matematico import AnalizadorMatematico
+        _ANALIZADOR = AnalizadorMatematico()
+    return _ANALIZADOR
+
+
+def _tarea_volumen(consulta: Dict) -> Dict:
+    return _analizador().calcular_numerico(
+        consulta["f_sup"], consulta["f_inf"], consulta["x_lims"],
+        consulta["y_lims"], metodo=consulta["metodo"], epsabs=consulta["epsabs"],
+        epsrel=consulta["epsrel"], tiempo_limite=consulta["tiempo_limite"],
+        transformacion=consulta["transformacion"]
+    )
+
+
+def _tarea_exacto(consulta: Dict) -> Dict:
+    # sp.integrate puede no terminar: corre en un proceso hijo que se elimina
+    # al vencer el plazo, para que el trabajador del pool quede libre
+    return _analizador().calcular_exacto_con_limite(
+        consulta["f_sup"], consulta["f_inf"], consulta["x_lims"], consulta["y_lims"],
+        tiempo_limite=consulta["tiempo_limite"], automatico=True
+    )
+
+
+def _tarea_malla(consulta: Dict) -> bytes:
+    """Superficies y pared lateral ajustadas a la región (ver mallas_solidos)."""
+    from mallas_solidos import a_bytes, generar_niveles
+    return a_bytes(generar_niveles(consulta["f_sup"], consulta["f_inf"],
+                                   consulta["x_lims"], consulta["y_lims"],
+                                   consulta["niveles"]))
+
+
+def _tarea_tabla(consulta: Dict) -> Dict:
+    from integrador_navegador import tabla_volumenes
+    return tabla_volumenes()
+
+
+_TAREAS = {
+    "volumen": _tarea_volumen,
+    "exacto": _tarea_exacto,
+    "malla": _tarea_malla,
+    "tabla": _tarea_tabla,
+}
+
+
+def _a_sympy(texto) -> str:
+    from integrador_navegador import a_sympy
+    return a_sympy(str(texto))
+
+
+def _campo(datos: Dict, nombre: str):
+    if nombre not in datos:
+        raise ValueError(f"Petición incompleta: falta '{nombre}' "
+                         f"(se esperan f_sup, f_inf, x_lims y y_lims)")
+    return datos[nombre]
+
+
+def _expresion(valor, nombre: str) -> str:
+    """Texto SymPy de una expresión de la petición; el error nombra el campo."""
+    if isinstance(valor, bool) or not isinstance(valor, (str, int, float)):
+        raise ValueError(f"'{nombre}' debe ser una expresión (texto o número)")
+    try:
+        return _a_sympy(valor)
+    except (sp.SympifyError, SyntaxError, TypeError, ValueError, tokenize.TokenError) as e:
+        raise ValueError(f"Expresión no válida en '{nombre}': {e}")
+
+
+def _par(valor, nombre: str) -> list:
+    if not isinstance(valor, list) or len(valor) != 2:
+        raise ValueError(f"'{nombre}' debe ser una lista [inferior, superior]")
+    return valor
+
+
+def _real(datos: Dict, nombre: str, defecto: Optional[float]) -> Optional[float]:
+    """Número no negativo y finito de la petición (None solo si lo es el defecto)."""
+    valor = datos.get(nombre, defecto)
+    if valor is None and defecto is None:
+        return None
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)) \
+            or not math.isfinite(valor) or valor < 0:
+        raise ValueError(f"'{nombre}' debe ser un número no negativo")
+    return float(valor)
+
+
+def normalizar_consulta(tipo: str, datos: Dict) -> Tuple[Dict, Tuple]:
+    """
+    Traduce la petición a texto SymPy y calcula su clave de caché.
+
+    La clave usa la forma canónica de cada expresión, de modo que
+    "x^2+y^2" y "y**2 + x**2" comparten resultado.
+
+    Returns:
+        Tupla (consulta para la tarea, clave)
+
+    Raises:
+        ValueError: Si el tipo no existe, falta un campo o alguno no es
+                    válido (el mensaje nombra el campo)
+    """
+    if tipo not in _TAREAS:
+        raise ValueError(f"Cálculo '{tipo}' no soportado: use {sorted(_TAREAS)}")
+    if tipo == "tabla":
+        return {}, ("tabla",)
+    if not isinstance(datos, dict):
+        raise ValueError("La petición debe ser un objeto JSON")
+    f_sup = _expresion(_campo(datos, "f_sup"), "f_sup")
+    f_inf = _expresion(_campo(datos, "f_inf"), "f_inf")
+    y_lims = tuple(_expresion(y, f"y_lims[{i}]")
+                   for i, y in enumerate(_par(_campo(datos, "y_lims"), "y_lims")))
+    x_lims = []
+    for i, x in enumerate(_par(_campo(datos, "x_lims"), "x_lims")):
+        try:
+            x_lims.append(float(sp.sympify(_expresion(x, f"x_lims[{i}]"))))
+        except TypeError:
+            raise ValueError(f"'x_lims[{i}]' debe ser un número (p. ej. -2 o 2*pi), no '{x}'")
+        if not math.isfinite(x_lims[-1]):
+            raise ValueError(f"'x_lims[{i}]' debe ser finito")
+    x_lims = tuple(x_lims)
+
+    consulta = {"f_sup": f_sup, "f_inf": f_inf, "x_lims": x_lims, "y_lims": y_lims}
+    if tipo == "volumen":
+        metodo = datos.get("metodo", "gauss_legendre")
+        if metodo not in METODOS_NUMERICOS:
+            raise ValueError(f"'metodo' no soportado: '{metodo}'; use {sorted(METODOS_NUMERICOS)}")
+        consulta["metodo"] = metodo
+        consulta["epsabs"] = _real(datos, "epsabs", 1e-8)
+        consulta["epsrel"] = _real(datos, "epsrel", 1e-8)
+        consulta["tiempo_limite"] = _real(datos, "tiempo_limite", None)
+        # 'auto' detecta las raíces que se anulan en el borde (p. ej. y = ±sqrt(4 - x²))
+        transformacion = datos.get("transformacion", "auto")
+        if isinstance(transformacion, list) and len(transformacion) == 2:
+            transformacion = tuple(transformacion)
+            validas = all(isinstance(n, str) and n in SUSTITUCIONES for n in transformacion)
+        else:
+            validas = transformacion is None or transformacion == "auto" \
+                or (isinstance(transformacion, str) and transformacion in SUSTITUCIONES)
+        if not validas:
+            raise ValueError(f"'transformacion' no soportada: '{transformacion}'; use "
+                             f"'auto', {sorted(SUSTITUCIONES)} o un par [en_x, en_y]")
+        consulta["transformacion"] = transformacion
+    elif tipo == "malla":
+        if "niveles" in datos:
+            niveles, error = datos["niveles"], "'niveles' debe ser una lista no vacía de enteros"
+            if not isinstance(niveles, list) or not niveles:
+                raise ValueError(error)
+        else:
+            niveles, error = [datos.get("n", N_MALLA)], "'n' debe ser un entero (puntos por eje)"
+        if any(isinstance(n, bool) or not isinstance(n, int) for n in niveles):
+            raise ValueError(error)
+        consulta["niveles"] = tuple(sorted({max(2, min(n, MAX_N_MALLA)) for n in niveles}))
+
+    canonicas = tuple(compilar_expresion(t).texto_canonico for t in (f_sup, f_inf, *y_lims))
+    extra = tuple(v for k, v in sorted(consulta.items()) if k not in ("f_sup", "f_inf", "x_lims", "y_lims"))
+    return consulta, (tipo, canonicas, x_lims, extra)
+
+
+def _json_seguro(resultado: Dict) -> bytes:
+    """JSON del resultado; los objetos de SymPy se envían como texto."""
+    return json.dumps(resultado, default=str, ensure_ascii=False).encode("utf-8")
+
+
+class ServidorCalculo:
+    """
+    Servidor HTTP mínimo sobre asyncio con caché y fusión de peticiones.
+    """
+
+    def __init__(self, host: str = HOST_POR_DEFECTO, puerto: int = PUERTO_POR_DEFECTO,
+                 max_workers: Optional[int] = None, capacidad_cache: int = 256,
+                 tiempo_limite: float = 30.0,
+                 origenes: Tuple[str, ...] = ORIGENES_POR_DEFECTO):
+        """
+        Args:
+            host: Dirección de escucha (solo local por defecto)
+            puerto: Puerto TCP
+            max_workers: Procesos del pool de cálculo
+            capacidad_cache: Resultados guardados en la caché LRU
+            tiempo_limite: Espera máxima (s) de una respuesta; el cálculo
+                           sigue en el pool y su resultado queda en caché
+            origenes: Valores de Origin a los que se permite llamar desde
+                      un navegador ('null' para la página abierta como archivo)
+        """
+        self.host = host
+        self.origenes = tuple(origenes)
+        self.puerto = puerto
+        self.tiempo_limite = tiempo_limite
+        self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        self._cache = CacheLRU(capacidad_cache)
+        self._en_curso: Dict[Tuple, asyncio.Future] = {}
+        self.calculadas = 0
+        self.fusionadas = 0
+
+    async def calcular(self, tipo: str, datos: Dict):
+        """
+        Resultado de una petición: desde la caché, uniéndose a una petición
+        idéntica en curso o calculándolo en el pool.
+        """
+        consulta, clave = normalizar_consulta(tipo, datos)
+        if tipo == "exacto":
+            # Margen para que el respaldo numérico llegue antes del plazo de espera
+            consulta["tiempo_limite"] = 0.8 * self.tiempo_limite
+        resultado = self._cache.obtener(clave)
+        if resultado is not None:
+            return resultado
+
+        tarea = self._en_curso.get(clave)
+        if tarea is not None:
+            self.fusionadas += 1
+        else:
+            tarea = asyncio.ensure_future(self._ejecutar(tipo, consulta, clave))
+            # Si todos los clientes agotaron su plazo, nadie recoge el error
+            tarea.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._en_curso[clave] = tarea
+        # shield: si un cliente se desconecta o se agota su plazo, el
+        # cálculo sigue para los demás (y para la caché)
+        return await asyncio.wait_for(asyncio.shield(tarea), self.tiempo_limite)
+
+    async def _ejecutar(self, tipo: str, consulta: Dict, clave: Tuple):
+        try:
+            bucle = asyncio.get_running_loop()
+            resultado = await bucle.run_in_executor(self._pool, _TAREAS[tipo], consulta)
+            self.calculadas += 1
+            self._cache.guardar(clave, resultado)
+            return resultado
+        finally:
+            del self._en_curso[clave]
+
+    def estado(self) -> Dict:
+        """Aciertos de la caché, cálculos hechos y peticiones en curso."""
+        return {
+            "calculadas": self.calculadas,
+            "fusionadas": self.fusionadas,
+            "aciertos_cache": self._cache.aciertos,
+            "entradas_cache": len(self._cache),
+            "en_curso": len(self._en_curso),
+        }
+
+    async def _responder(self, escritor, estado: int, cuerpo: bytes,
+                         tipo_contenido: str = "application/json",
+                         origen: Optional[str] = None):
+        razones = {200: "OK", 204: "No Content", 400: "Bad Request", 403: "Forbidden",
+                   404: "Not Found", 413: "Payload Too Large", 415: "Unsupported Media Type",
+                   500: "Internal Server Error", 504: "Gateway Timeout"}
+        cabeceras = [
+            f"HTTP/1.1 {estado} {razones.get(estado, '')}",
+            f"Content-Type: {tipo_contenido}",
+            f"Content-Length: {len(cuerpo)}",
+        ]
+        if origen in self.origenes:
+            # Solo los orígenes permitidos reciben permiso CORS; para el resto
+            # el navegador bloquea la respuesta y el preflight de los POST JSON
+            cabeceras += [
+                f"Access-Control-Allow-Origin: {origen}",
+                "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+                "Access-Control-Allow-Headers: Content-Type",
+                "Vary: Origin",
+            ]
+        cabeceras.append("Connection: close")
+        escritor.write(("\r\n".join(cabeceras) + "\r\n\r\n").encode("latin-1") + cuerpo)
+        await escritor.drain()
+
+    async def _atender(self, lector, escritor):
+        try:
+            linea = (await lector.readline()).decode("latin-1").split()
+            if len(linea) < 2:
+                return
+            verbo, ruta = linea[0], linea[1].split("?")[0]
+            cabeceras = {}
+            while True:
+                cabecera = (await lector.readline()).decode("latin-1").strip()
+                if not cabecera:
+                    break
+                nombre, _, valor = cabecera.partition(":")
+                cabeceras[nombre.strip().lower()] = valor.strip()
+            origen = cabeceras.get("origin")
+            responder = functools.partial(self._responder, escritor, origen=origen)
+
+            longitud = cabeceras.get("content-length", "0")
+            if not longitud.isdigit():
+                await responder(400, _json_seguro(
+                    {"exito": False, "error": f"Content-Length no válido: {longitud}"}))
+                return
+            if int(longitud) > MAX_CUERPO:
+                # No se lee: el cuerpo completo ocuparía memoria del servidor
+                await responder(413, _json_seguro(
+                    {"exito": False, "error": f"Petición mayor que {MAX_CUERPO} bytes"}))
+                return
+            cuerpo = await lector.readexactly(int(longitud)) if int(longitud) else b""
+            if verbo == "OPTIONS":
+                await responder(204, b"")
+                return
+            tipo = ruta.strip("/")
+            if verbo == "GET" and tipo == "estado":
+                await responder(200, _json_seguro(self.estado()))
+                return
+            if tipo not in _TAREAS or (verbo == "GET") != (tipo == "tabla"):
+                await responder(404, _json_seguro(
+                    {"exito": False, "error": f"Ruta no encontrada: {verbo} {ruta}"}))
+                return
+            if verbo == "POST":
+                # Otra página abierta en el navegador no debe poder usar el servidor:
+                # se exige su origen y JSON (que obliga al navegador a un preflight)
+                if origen is not None and origen not in self.origenes:
+                    await responder(403, _json_seguro(
+                        {"exito": False, "error": f"Origen no permitido: {origen}"}))
+                    return
+                tipo_contenido = cabeceras.get("content-type", "").split(";")[0].strip().lower()
+                if tipo_contenido != "application/json":
+                    await responder(415, _json_seguro(
+                        {"exito": False, "error": "Se requiere Content-Type: application/json"}))
+                    return
+
+            try:
+                datos = json.loads(cuerpo or b"{}")
+                resultado = await self.calcular(tipo, datos)
+            except (ValueError, json.JSONDecodeError) as e:
+                await responder(400, _json_seguro({"exito": False, "error": str(e)}))
+                return
+            except asyncio.TimeoutError:
+                await responder(504, _json_seguro({
+                    "exito": False,
+                    "error": f"Tiempo agotado ({self.tiempo_limite:g} s); el cálculo continúa"
+                }))
+                return
+            except Exception as e:
+                await responder(500, _json_seguro({"exito": False, "error": str(e)}))
+                return
+
+            if isinstance(resultado, bytes):
+                await responder(200, resultado, "application/octet-stream")
+            else:
+                await responder(200, _json_seguro(resultado))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def servir(self):
+        """Atiende peticiones hasta que se cancele la tarea."""
+        servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor local de cálculo para app_ucsg_final.html")
+    parser.add_argument("--host", default=HOST_POR_DEFECTO)
+    parser.add_argument("--puerto", type=int, default=PUERTO_POR_DEFECTO)
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="Procesos de cálculo (por defecto, núcleos disponibles)")
+    parser.add_argument("--tiempo-limite", type=float, default=30.0,
+                        help="Espera máxima de una respuesta, en segundos")
+    parser.add_argument("--origen", action="append", default=[],
+                        help="Origen adicional permitido (p. ej. http://localhost:8000); "
+                             "'null' (la página como archivo) siempre lo está")
+    args = parser.parse_args(argv)
+
+    servidor = ServidorCalculo(args.host, args.puerto, args.procesos,
+                               tiempo_limite=args.tiempo_limite,
+                               origenes=ORIGENES_POR_DEFECTO + tuple(args.origen))
+    print(f"Servidor de cálculo en http://{args.host}:{args.puerto} (Ctrl+C para salir)")
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
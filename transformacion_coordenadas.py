@@ -0,0 +1,215 @@
+"""
+Detección Automática del Sistema de Coordenadas
+Proyecto: Análisis de Sólidos y Regiones - Cálculo Vectorial
+Universidad Católica de Santiago de Guayaquil (UCSG)
+
+Reconoce regiones circulares descritas en cartesianas (límites de la forma
+y = ±sqrt(q(x)) con q cuadrática) y reescribe el problema en coordenadas
+polares, donde SymPy integra mucho más rápido que con raíces en los límites.
+También elige la sustitución de extremos (seno o tanh-sinh) que devuelve la
+suavidad al integrando cuando una raíz se anula en el borde de la región.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from carga_perezosa import modulo_perezoso
+from expresiones_compiladas import compilar_expresion, simbolo
+
+sp = modulo_perezoso("sympy")
+
+
+# Rango de θ según el signo de x e y en la región (para círculos centrados)
+_RANGOS_THETA = {
+    ("ambos", "ambos"): ("0", "2*pi"),
+    ("ambos", "pos"): ("0", "pi"),
+    ("ambos", "neg"): ("pi", "2*pi"),
+    ("pos", "ambos"): ("-pi/2", "pi/2"),
+    ("neg", "ambos"): ("pi/2", "3*pi/2"),
+    ("pos", "pos"): ("0", "pi/2"),
+    ("neg", "pos"): ("pi/2", "pi"),
+    ("neg", "neg"): ("pi", "3*pi/2"),
+    ("pos", "neg"): ("-pi/2", "0"),
+}
+
+
+def _raiz_de(expr: sp.Expr) -> Optional[Tuple[int, sp.Expr]]:
+    """Si expr es ±sqrt(q), devuelve (signo, q)."""
+    signo = 1
+    if expr.could_extract_minus_sign():
+        signo, expr = -1, -expr
+    if isinstance(expr, sp.Pow) and expr.exp == sp.Rational(1, 2):
+        return signo, expr.base
+    return None
+
+
+def _iguales(a, b) -> bool:
+    return sp.simplify(sp.sympify(a) - sp.sympify(b)) == 0
+
+
+def detectar_region_polar(x_lims: Tuple, y_lims: Tuple) -> Optional[Dict]:
+    """
+    Detecta si la región de tipo I es un disco (o una porción de disco)
+    y devuelve sus límites en polares.
+
+    Se reconocen círculos centrados en el origen (disco completo, mitades y
+    cuadrantes) y círculos que pasan por el origen con centro en el eje x,
+    donde r(θ) = 2h·cos θ.
+
+    Args:
+        x_lims: Tupla (x_min, x_max) como números o strings
+        y_lims: Tupla (y_min(x), y_max(x)) como strings
+
+    Returns:
+        Dict con 'tipo', 'r_lims', 'theta_lims' (strings en θ), 'centro'
+        y 'radio', o None si la región no es circular
+    """
+    x = simbolo("x")
+    y_min = compilar_expresion(y_lims[0], ("x",)).expr
+    y_max = compilar_expresion(y_lims[1], ("x",)).expr
+    x_min, x_max = (sp.sympify(v) for v in x_lims)
+
+    # Identificar la cuadrática q(x) bajo la raíz y el signo de y
+    raiz_sup, raiz_inf = _raiz_de(y_max), _raiz_de(y_min)
+    if raiz_sup and raiz_inf and raiz_sup[0] == 1 and raiz_inf[0] == -1 \
+            and _iguales(raiz_sup[1], raiz_inf[1]):
+        q, signo_y = raiz_sup[1], "ambos"
+    elif raiz_sup and raiz_sup[0] == 1 and y_min == 0:
+        q, signo_y = raiz_sup[1], "pos"
+    elif raiz_inf and raiz_inf[0] == -1 and y_max == 0:
+        q, signo_y = raiz_inf[1], "neg"
+    else:
+        return None
+
+    try:
+        polinomio = sp.Poly(sp.expand(q), x)
+    except sp.PolynomialError:
+        return None
+    if polinomio.degree() != 2 or polinomio.LC() != -1:
+        return None
+    _, b, c = polinomio.all_coeffs()
+    h = b / 2
+    radio = sp.sqrt(sp.simplify(c + h**2))
+    if not radio.is_positive:
+        return None
+
+    if h == 0:
+        # Círculo centrado: el rango de x fija el signo de x
+        if _iguales(x_min, -radio) and _iguales(x_max, radio):
+            signo_x = "ambos"
+        elif _iguales(x_min, 0) and _iguales(x_max, radio):
+            signo_x = "pos"
+        elif _iguales(x_min, -radio) and _iguales(x_max, 0):
+            signo_x = "neg"
+        else:
+            return None
+        tipo = "disco" if (signo_x, signo_y) == ("ambos", "ambos") else "sector"
+        r_lims = ("0", str(radio))
+        theta_lims = _RANGOS_THETA[(signo_x, signo_y)]
+    elif c == 0 and _iguales(x_min, sp.Min(0, 2 * h)) and _iguales(x_max, sp.Max(0, 2 * h)):
+        # Círculo que pasa por el origen: r = 2h·cos θ
+        tipo = "disco_desplazado"
+        r_lims = ("0", f"{2 * h}*cos(theta)")
+        if h > 0:
+            theta_lims = {"ambos": ("-pi/2", "pi/2"), "pos": ("0", "pi/2"),
+                          "neg": ("-pi/2", "0")}[signo_y]
+        else:
+            theta_lims = {"ambos": ("pi/2", "3*pi/2"), "pos": ("pi/2", "pi"),
+                          "neg": ("pi", "3*pi/2")}[signo_y]
+    else:
+        return None
+
+    return {
+        "tipo": tipo,
+        "r_lims": r_lims,
+        "theta_lims": theta_lims,
+        "centro": (str(h), "0"),
+        "radio": str(radio),
+    }
+
+
+def region_anular(r_interno, r_externo) -> Dict:
+    """Región anular r_interno ≤ r ≤ r_externo (no es de tipo I en cartesianas)."""
+    return {
+        "tipo": "anillo",
+        "r_lims": (str(r_interno), str(r_externo)),
+        "theta_lims": ("0", "2*pi"),
+        "centro": ("0", "0"),
+        "radio": str(r_externo),
+    }
+
+
+def a_polares(h_cartesiana: sp.Expr) -> Tuple[sp.Expr, bool]:
+    """
+    Reescribe h(x, y) con x = r·cos θ, y = r·sin θ.
+
+    Returns:
+        Tupla (h(r, θ), simetria_rotacional) donde simetria_rotacional
+        indica que la altura no depende de θ
+    """
+    x, y = simbolo("x"), simbolo("y")
+    r = sp.Symbol("r", real=True, positive=True)
+    theta = sp.Symbol("theta", real=True)
+    h_polar = sp.simplify(sp.trigsimp(
+        h_cartesiana.subs({x: r * sp.cos(theta), y: r * sp.sin(theta)})
+    ))
+    return h_polar, theta not in h_polar.free_symbols
+
+
+def _potencias_fraccionarias(expr: sp.Expr):
+    """Pares (base, exponente) de las potencias con exponente no entero."""
+    for potencia in expr.atoms(sp.Pow):
+        if potencia.exp.is_Rational and not potencia.exp.is_integer:
+            yield potencia.base, potencia.exp
+
+
+def _sustitucion_para(exponentes) -> str:
+    if not exponentes:
+        return "ninguna"
+    # seno basta para raíces cuadradas (también 1/sqrt); el resto, doble exponencial
+    if all(e.q == 2 and e > -1 for e in exponentes):
+        return "seno"
+    return "tanh_sinh"
+
+
+def detectar_transformacion(f_sup, f_inf, x_lims: Tuple, y_lims: Tuple) -> Tuple[str, str]:
+    """
+    Elige la sustitución de extremos en x y en y para transformar_region.
+
+    Una dirección es singular cuando la base de alguna potencia fraccionaria
+    se anula en su extremo: sqrt(4 - x²) en x = ±2, o sqrt(9 - x² - y²) en
+    y = ±sqrt(9 - x²).
+
+    Args:
+        f_sup: Expresión superior f(x,y) como string
+        f_inf: Expresión inferior g(x,y) como string
+        x_lims: Tupla (x_min, x_max) como números o strings
+        y_lims: Tupla (y_min(x), y_max(x)) como strings
+
+    Returns:
+        Tupla (en_x, en_y) con 'ninguna', 'seno' o 'tanh_sinh'
+    """
+    return _detectar_transformacion(str(f_sup), str(f_inf),
+                                    tuple(str(v) for v in x_lims), tuple(str(v) for v in y_lims))
+
+
+@lru_cache(maxsize=256)
+def _detectar_transformacion(f_sup: str, f_inf: str, x_lims: Tuple, y_lims: Tuple) -> Tuple[str, str]:
+    x, y = simbolo("x"), simbolo("y")
+    altura = compilar_expresion(f_sup).expr - compilar_expresion(f_inf).expr
+    limites_y = [compilar_expresion(v, ("x",)).expr for v in y_lims]
+    x_min, x_max = (sp.sympify(v) for v in x_lims)
+
+    def se_anula(base, sustituciones) -> bool:
+        return any(sp.simplify(base.subs(s)) == 0 for s in sustituciones)
+
+    en_x, en_y = [], []
+    for expr in limites_y + [altura]:
+        for base, exponente in _potencias_fraccionarias(expr):
+            if se_anula(base, ({x: x_min}, {x: x_max})):
+                en_x.append(exponente)
+            if y in base.free_symbols and se_anula(base, ({y: v} for v in limites_y)):
+                en_y.append(exponente)
+    return _sustitucion_para(en_x), _sustitucion_para(en_y)